@@ -0,0 +1,60 @@
+import loopy as lp
+import numpy as np
+import time
+
+from loopy.version import LOOPY_USE_LANGUAGE_VERSION_2018_2  # noqa: F401
+
+
+def _make_axpy(n):
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "z[i] = alpha*x[i] + y[i]",
+            [
+                lp.GlobalArg("x,y", np.float64, shape="n"),
+                lp.GlobalArg("z", np.float64, shape="n", is_input=False),
+                lp.ValueArg("alpha", np.float64),
+                lp.ValueArg("n", np.int32),
+                ],
+            target=lp.ExecutableCTarget())
+    return knl
+
+
+class CKernelLaunchBenchmarkSuite:
+    """Measures the per-call overhead of launching small kernels through
+    :class:`loopy.ExecutableCTarget`.
+    """
+
+    params = [16, 1 << 16]
+
+    param_names = ["n"]
+
+    version = 1
+
+    def setup(self, n):
+        self.t_unit = _make_axpy(n)
+
+        rng = np.random.default_rng(seed=17)
+        self.x = rng.random(n)
+        self.y = rng.random(n)
+        self.z = np.empty(n)
+
+        # compile, and obtain the compiled kernel for direct invocation
+        self.t_unit(x=self.x, y=self.y, z=self.z, alpha=2.0)
+        pex = self.t_unit._get_kernel_executor(entrypoint="loopy_kernel")
+        info = pex.program_info("loopy_kernel", pex.arg_to_dtype_set({}))
+        self.c_kernel, = info.c_kernels
+
+        # arguments in the order of the kernel's signature
+        self.c_kernel_args = tuple(
+                {"x": self.x, "y": self.y, "z": self.z,
+                    "alpha": 2.0, "n": n}[idi.name]
+                for idi in info.implemented_data_info)
+
+    def time_translation_unit_call(self, n):
+        self.t_unit(x=self.x, y=self.y, z=self.z, alpha=2.0)
+
+    def time_compiled_kernel_call(self, n):
+        self.c_kernel(*self.c_kernel_args)
+
+    time_translation_unit_call.timer = time.perf_counter
+    time_compiled_kernel_call.timer = time.perf_counter
@@ -0,0 +1,243 @@
+import loopy as lp
+import numpy as np
+import time
+
+from loopy.version import LOOPY_USE_LANGUAGE_VERSION_2018_2  # noqa: F401
+
+
+# {{{ kernels
+
+def _make_stencil():
+    knl = lp.make_kernel(
+            "{[i, j]: 1<=i, j<n-1}",
+            """
+            out[i, j] = (-4*u[i, j] + u[i-1, j] + u[i+1, j]
+                         + u[i, j-1] + u[i, j+1]) * h2inv
+            """,
+            [
+                lp.GlobalArg("u,out", np.float64, shape="n, n"),
+                lp.ValueArg("h2inv", np.float64),
+                lp.ValueArg("n", np.int32),
+                ],
+            target=lp.ExecutableCTarget(),
+            name="stencil")
+    knl = lp.split_iname(knl, "j", 4, inner_tag="unr")
+    return knl
+
+
+def _make_matmul():
+    knl = lp.make_kernel(
+            "{[i, j, k]: 0<=i, j, k<n}",
+            "c[i, j] = sum(k, a[i, k]*b[k, j])",
+            [
+                lp.GlobalArg("a,b,c", np.float64, shape="n, n"),
+                lp.ValueArg("n", np.int32),
+                ],
+            target=lp.ExecutableCTarget(),
+            name="matmul")
+    knl = lp.split_iname(knl, "i", 16)
+    knl = lp.split_iname(knl, "j", 16)
+    knl = lp.split_iname(knl, "k", 16)
+    knl = lp.prioritize_loops(knl, "i_outer,j_outer,k_outer,i_inner,k_inner,j_inner")
+    return knl
+
+
+def _make_reduction():
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<m}",
+            """
+            row_norm2[i] = sum(j, a[i, j]**2)
+            row_prod[i] = product(j, a[i, j])
+            total[0] = sum(i, row_norm2[i])
+            """,
+            [
+                lp.GlobalArg("a", np.float64, shape="n, m"),
+                lp.GlobalArg("row_norm2,row_prod", np.float64, shape="n"),
+                lp.GlobalArg("total", np.float64, shape=(1,)),
+                lp.ValueArg("n,m", np.int32),
+                ],
+            target=lp.ExecutableCTarget(),
+            name="reduction")
+    return knl
+
+
+def _make_scan():
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<=i}",
+            "out[i] = sum(j, a[j])",
+            [
+                lp.GlobalArg("a,out", np.float64, shape="n"),
+                lp.ValueArg("n", np.int32),
+                ],
+            target=lp.ExecutableCTarget(),
+            name="scan")
+    return knl
+
+
+def _make_many_callees(ncallees=20):
+    target = lp.ExecutableCTarget()
+
+    callees = [
+            lp.make_function(
+                "{[i]: 0<=i<16}",
+                f"y[i] = {icallee+1}*x[i] + {icallee}",
+                [
+                    lp.GlobalArg("x,y", np.float64, shape=(16,)),
+                    ],
+                name=f"callee_{icallee}", target=target)
+            for icallee in range(ncallees)]
+
+    caller = lp.make_kernel(
+            "{[i, k]: 0<=i, k<16}",
+            "\n".join(
+                f"[k]: tmp{icallee}[k] = callee_{icallee}([k]: a[k])"
+                for icallee in range(ncallees))
+            + "\nout[i] = " + " + ".join(
+                f"tmp{icallee}[i]" for icallee in range(ncallees)),
+            [
+                lp.GlobalArg("a,out", np.float64, shape=(16,)),
+                ]
+            + [
+                lp.TemporaryVariable(f"tmp{icallee}", np.float64, shape=(16,))
+                for icallee in range(ncallees)],
+            target=target,
+            name="many_callees")
+
+    return lp.merge([caller, *callees])
+
+
+_KERNELS = {
+        "stencil": _make_stencil,
+        "matmul": _make_matmul,
+        "reduction": _make_reduction,
+        "scan": _make_scan,
+        "many_callees": _make_many_callees,
+        }
+
+# }}}
+
+
+def _get_args(name):
+    rng = np.random.default_rng(seed=17)
+
+    if name == "stencil":
+        n = 64
+        return {"u": rng.random((n, n)), "out": np.zeros((n, n)), "h2inv": 1.0}
+    elif name == "matmul":
+        n = 32
+        return {"a": rng.random((n, n)), "b": rng.random((n, n)),
+                "c": np.empty((n, n))}
+    elif name == "reduction":
+        n, m = 32, 16
+        return {"a": rng.random((n, m)), "row_norm2": np.empty(n),
+                "row_prod": np.empty(n), "total": np.empty(1)}
+    elif name == "scan":
+        n = 64
+        return {"a": rng.random(n), "out": np.empty(n)}
+    elif name == "many_callees":
+        return {"a": rng.random(16), "out": np.empty(16)}
+    else:
+        raise ValueError(name)
+
+
+class CompilePipelineBenchmarkSuite:
+    """Measures the time and peak memory taken by each stage of turning a
+    kernel description into code, with :mod:`loopy`'s caches disabled.
+    """
+
+    params = list(_KERNELS)
+
+    param_names = ["kernel"]
+
+    version = 1
+
+    # Set up fresh (un-memoized) kernels for each measurement.
+    number = 1
+    repeat = (3, 10, 20.0)
+    warmup_time = 0
+    timeout = 600.0
+
+    def setup(self, name):
+        self.caching_was_enabled = lp.CACHING_ENABLED
+        lp.set_caching_enabled(False)
+        lp.clear_memo_caches()
+
+        self.t_unit = _KERNELS[name]()
+        self.preprocessed = lp.preprocess_program(self.t_unit)
+        self.linearized = lp.linearize(self.preprocessed)
+
+    def teardown(self, name):
+        lp.set_caching_enabled(self.caching_was_enabled)
+
+    def time_make_kernel(self, name):
+        _KERNELS[name]()
+
+    def time_preprocess_program(self, name):
+        lp.preprocess_program(self.t_unit)
+
+    def time_get_one_linearized_kernel(self, name):
+        t_unit = self.preprocessed
+        for entrypoint in t_unit.entrypoints:
+            lp.get_one_linearized_kernel(t_unit[entrypoint], t_unit.callables_table)
+
+    def time_linearize(self, name):
+        lp.linearize(self.preprocessed)
+
+    def time_generate_code_v2(self, name):
+        lp.generate_code_v2(self.linearized)
+
+    def time_get_op_map(self, name):
+        lp.get_op_map(self.t_unit, subgroup_size="guess")
+
+    def time_get_mem_access_map(self, name):
+        lp.get_mem_access_map(self.t_unit, subgroup_size="guess")
+
+    # Use CPU time as the timer
+    time_make_kernel.timer = time.process_time
+    time_preprocess_program.timer = time.process_time
+    time_get_one_linearized_kernel.timer = time.process_time
+    time_linearize.timer = time.process_time
+    time_generate_code_v2.timer = time.process_time
+    time_get_op_map.timer = time.process_time
+    time_get_mem_access_map.timer = time.process_time
+
+    # Run memory benchmarks as well
+    peakmem_make_kernel = time_make_kernel
+    peakmem_preprocess_program = time_preprocess_program
+    peakmem_get_one_linearized_kernel = time_get_one_linearized_kernel
+    peakmem_linearize = time_linearize
+    peakmem_generate_code_v2 = time_generate_code_v2
+    peakmem_get_op_map = time_get_op_map
+    peakmem_get_mem_access_map = time_get_mem_access_map
+
+
+class CKernelInvocationBenchmarkSuite:
+    """Measures the overhead of invoking compiled kernels through
+    :class:`loopy.ExecutableCTarget`.
+    """
+
+    params = list(_KERNELS)
+
+    param_names = ["kernel"]
+
+    version = 1
+
+    def setup(self, name):
+        self.t_unit = _KERNELS[name]()
+        self.args = _get_args(name)
+
+        # compile
+        self.t_unit(**self.args)
+
+    def time_translation_unit_call(self, name):
+        self.t_unit(**self.args)
+
+    def time_kernel_executor_call(self, name):
+        executor = self.t_unit._get_kernel_executor(
+                entrypoint=self.t_unit.default_entrypoint.name)
+        executor(entrypoint=self.t_unit.default_entrypoint.name, **self.args)
+
+    time_translation_unit_call.timer = time.perf_counter
+    time_kernel_executor_call.timer = time.perf_counter
+
+# vim: foldmethod=marker
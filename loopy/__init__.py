@@ -127,7 +127,7 @@ from loopy.preprocess import (preprocess_kernel, realize_reduction,
         preprocess_program, infer_arg_descr)
 from loopy.schedule import (
     generate_loop_schedules, get_one_scheduled_kernel,
-    get_one_linearized_kernel, linearize)
+    get_one_linearized_kernel, get_reusable_preschedule, linearize)
 from loopy.statistics import (ToCountMap, ToCountPolynomialMap, CountGranularity,
         stringify_stats_mapping, Op, MemAccess, get_op_map, get_mem_access_map,
         get_synchronization_map, gather_access_footprints,
@@ -139,6 +139,7 @@ from loopy.codegen.result import (
         GeneratedProgram,
         CodeGenerationResult)
 from loopy.compiled import CompiledKernel
+from loopy.target.execution import BoundKernelCall, KernelCallSequence
 from loopy.options import Options
 from loopy.auto_test import auto_test_vs_ref
 from loopy.frontend.fortran import (c_preprocess, parse_transformed_fortran,
@@ -151,8 +152,10 @@ from loopy.target.opencl import OpenCLTarget
 from loopy.target.pyopencl import PyOpenCLTarget
 from loopy.target.ispc import ISPCTarget
 from loopy.target.numba import NumbaTarget, NumbaCudaTarget
+from loopy.target.numpy import NumpyTarget
 
-from loopy.tools import Optional
+from loopy.tools import Optional, cache_stats, reset_cache_stats
+from loopy.memo import clear_memo_caches, memo_cache_info
 
 
 __all__ = [
@@ -265,7 +268,7 @@ __all__ = [
 
         "generate_loop_schedules",
         "get_one_scheduled_kernel", "get_one_linearized_kernel",
-        "linearize",
+        "get_reusable_preschedule", "linearize",
 
         "GeneratedProgram", "CodeGenerationResult",
         "PreambleInfo",
@@ -277,7 +280,7 @@ __all__ = [
         "gather_access_footprints", "gather_access_footprint_bytes",
         "Sync",
 
-        "CompiledKernel",
+        "CompiledKernel", "BoundKernelCall", "KernelCallSequence",
 
         "auto_test_vs_ref",
 
@@ -292,10 +295,11 @@ __all__ = [
         "CFamilyTarget", "CTarget", "ExecutableCTarget", "generate_header",
         "CudaTarget", "OpenCLTarget",
         "PyOpenCLTarget", "ISPCTarget",
-        "NumbaTarget", "NumbaCudaTarget",
+        "NumbaTarget", "NumbaCudaTarget", "NumpyTarget",
         "ASTBuilderBase",
 
-        "Optional",
+        "Optional", "cache_stats", "reset_cache_stats",
+        "clear_memo_caches", "memo_cache_info",
 
         # {{{ from this file
 
@@ -0,0 +1,360 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+from pytools import ImmutableRecord
+
+from loopy.diagnostic import LoopyError
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+__doc__ = """
+Selecting the fastest among the variants of a kernel obtained by applying a
+parametrized transformation.
+
+Example::
+
+    def transform(t_unit, block_size, unroll):
+        t_unit = lp.split_iname(t_unit, "i", block_size,
+                outer_tag="g.0", inner_tag="l.0")
+        if unroll:
+            t_unit = lp.tag_inames(t_unit, "j:unr")
+        return t_unit
+
+    result = autotune(t_unit, transform,
+            {"block_size": [32, 64, 128], "unroll": [False, True]},
+            args={"a": a, "b": b, "n": n}, queue=queue)
+    fast_t_unit = result.t_unit
+
+.. autofunction:: autotune
+
+.. autoclass:: AutotuneResult
+
+.. autoclass:: VariantTiming
+
+.. autofunction:: get_problem_size_bucket
+
+.. autofunction:: get_default_database
+"""
+
+
+# {{{ results database
+
+def get_default_database():
+    """Return the :class:`pytools.persistent_dict.PersistentDict` in which
+    :func:`autotune` stores its results by default. It is kept in the user
+    data directory (as opposed to the cache directory), so that it is not
+    pruned along with :mod:`loopy`'s caches.
+    """
+    import os
+    import appdirs
+    from pytools.persistent_dict import PersistentDict
+    from loopy.tools import LoopyKeyBuilder
+    from loopy.version import DATA_MODEL_VERSION
+
+    identifier = "loopy-autotune-results-v1-" + DATA_MODEL_VERSION
+    return PersistentDict(identifier,
+            key_builder=LoopyKeyBuilder(),
+            container_dir=os.path.join(
+                appdirs.user_data_dir("loopy", "loopy"), identifier))
+
+
+def get_problem_size_bucket(args):
+    """Return a hashable summary of the problem size given by the kernel
+    arguments *args*, by which the results of :func:`autotune` are filed.
+    Integer arguments and the extents of array arguments are rounded up to
+    the next power of two, so that similar problem sizes share results.
+    """
+    def bucket(n):
+        n = int(n)
+        if n <= 0:
+            return n
+        return 1 << (n-1).bit_length()
+
+    result = []
+    for name, value in sorted(args.items()):
+        if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+            result.append((name, bucket(value)))
+        elif hasattr(value, "shape"):
+            result.append((name, tuple(bucket(n) for n in value.shape)))
+
+    return tuple(result)
+
+
+def _get_device_key(t_unit, queue):
+    if queue is not None:
+        device = queue.device
+        return ("cl", device.platform.name, device.name, device.driver_version)
+
+    import os
+    import platform
+    compiler = getattr(t_unit.target, "compiler", None)
+    toolchain = getattr(compiler, "toolchain", None)
+    return ("c", platform.machine(), platform.processor(), os.cpu_count(),
+            str(getattr(toolchain, "cc", None)),
+            tuple(getattr(toolchain, "cflags", ())))
+
+# }}}
+
+
+# {{{ timing
+
+class VariantTiming(ImmutableRecord):
+    """The timing of a variant examined by :func:`autotune`.
+
+    .. attribute:: choice
+
+        A :class:`dict` of the transformation parameters of the variant.
+
+    .. attribute:: times
+
+        A :class:`list` of the wall times (in seconds) of the timed
+        invocations, or *None* if the variant could not be generated or run.
+
+    .. attribute:: error
+
+        The exception that prevented timing the variant, or *None*.
+
+    .. autoattribute:: median
+    .. autoattribute:: min
+    """
+
+    @property
+    def median(self):
+        if not self.times:
+            return np.inf
+        return float(np.median(self.times))
+
+    @property
+    def min(self):
+        if not self.times:
+            return np.inf
+        return min(self.times)
+
+
+def _time_variant(t_unit, args, queue, entrypoint, warmup, repeat):
+    from loopy.benchmark import benchmark
+    return benchmark(t_unit, args, queue=queue, entrypoint=entrypoint,
+            warmup=warmup, min_repeat=repeat, max_repeat=repeat).times
+
+
+def _build_variants(variants, max_workers):
+    """Compile the variants in *variants*, a list of tuples ``(choice,
+    t_unit)``, ahead of timing them, concurrently where the target allows.
+
+    :returns: a tuple ``(variants, failures)`` of the variants that could be
+        compiled (or are compiled on their first invocation) and a list of
+        tuples ``(choice, error)`` for the others.
+    """
+    from loopy.target.c import ExecutableCTarget
+
+    built_variants = []
+    failures = []
+    c_variants = []
+    for choice, t_unit in variants:
+        if (isinstance(t_unit.target, ExecutableCTarget)
+                and not any(
+                    t_unit._get_kernel_executor(
+                        entrypoint=entrypoint).has_runtime_typed_args
+                    for entrypoint in t_unit.entrypoints)):
+            c_variants.append((choice, t_unit))
+        else:
+            built_variants.append((choice, t_unit))
+
+    if c_variants:
+        from loopy.target.c.c_execution import build_translation_units
+        errors = build_translation_units(
+                [t_unit for _, t_unit in c_variants],
+                max_workers=max_workers, return_exceptions=True)
+
+        for (choice, t_unit), error in zip(c_variants, errors):
+            if error is None:
+                built_variants.append((choice, t_unit))
+            else:
+                failures.append((choice, error))
+
+    return built_variants, failures
+
+# }}}
+
+
+class AutotuneResult(ImmutableRecord):
+    """
+    .. attribute:: choice
+
+        A :class:`dict` of the transformation parameters of the fastest
+        variant.
+
+    .. attribute:: t_unit
+
+        The fastest variant.
+
+    .. attribute:: timings
+
+        A :class:`list` of :class:`VariantTiming` for all variants examined,
+        or an empty list if the result was found in the database.
+
+    .. attribute:: from_database
+
+        *True* if the result was obtained from the database without timing
+        any variants.
+    """
+
+
+def autotune(t_unit, transform, space, args, *, queue=None, entrypoint=None,
+        warmup=2, repeat=5, max_workers=None, database=True, force=False,
+        identifier=None):
+    """Time the variants ``transform(t_unit, **choice)`` of *t_unit* for
+    each *choice* in the Cartesian product of the parameter values in
+    *space*, and return the fastest as an :class:`AutotuneResult`.
+
+    :arg transform: a function taking a :class:`loopy.TranslationUnit` and
+        keyword arguments for each of the parameters in *space*, and
+        returning the transformed translation unit. Variants for which it
+        raises a :exc:`loopy.LoopyError` are skipped, as are variants that
+        fail to compile or to run.
+    :arg space: a :class:`dict` mapping parameter names to sequences of
+        values to try. The values must be hashable by
+        :class:`loopy.tools.LoopyKeyBuilder` (numbers, strings, tuples, ...).
+    :arg args: a :class:`dict` of the keyword arguments with which to invoke
+        each variant.
+    :arg queue: a :class:`pyopencl.CommandQueue` to run variants targeting
+        :mod:`pyopencl` on, or *None* for the C target.
+    :arg warmup: the number of invocations of each variant before timing it.
+    :arg repeat: the number of timed invocations of each variant. Variants
+        are ranked by the median of their times.
+    :arg max_workers: the maximum number of variants compiled concurrently
+        (on the C target).
+    :arg database: a mapping (such as a
+        :class:`pytools.persistent_dict.PersistentDict`) in which the best
+        choice is stored per (*identifier*, *space*, *t_unit*, device, problem
+        size bucket) and from which it is retrieved, *True* to use
+        :func:`get_default_database`, or *False* to not use a database. See
+        also :func:`get_problem_size_bucket`.
+    :arg force: if *True*, time the variants even if the database has a
+        result.
+    :arg identifier: a :class:`str` distinguishing different *transform*
+        functions in the database. Defaults to the qualified name of
+        *transform*.
+    """
+    from itertools import product
+
+    if entrypoint is None:
+        entrypoint = t_unit.default_entrypoint.name
+
+    if identifier is None:
+        identifier = f"{transform.__module__}.{transform.__qualname__}"
+
+    param_names = sorted(space)
+    choices = [
+            dict(zip(param_names, values))
+            for values in product(*[space[name] for name in param_names])]
+    if not choices:
+        raise LoopyError("autotune: the parameter space is empty")
+
+    # {{{ database lookup
+
+    if database is True:
+        database = get_default_database()
+
+    db_key = None
+    if database is not False and database is not None:
+        db_key = (
+                identifier,
+                tuple((name, tuple(space[name])) for name in param_names),
+                t_unit, entrypoint,
+                _get_device_key(t_unit, queue),
+                get_problem_size_bucket(args))
+
+        if not force:
+            try:
+                choice = database[db_key]
+            except KeyError:
+                pass
+            else:
+                logger.info("%s: autotuning result found in database: %s"
+                        % (entrypoint, choice))
+                return AutotuneResult(
+                        choice=choice,
+                        t_unit=transform(t_unit, **choice),
+                        timings=[],
+                        from_database=True)
+
+    # }}}
+
+    # {{{ generate and build variants
+
+    variants = []
+    timings = []
+    for choice in choices:
+        try:
+            variants.append((choice, transform(t_unit, **choice)))
+        except LoopyError as e:
+            logger.info("%s: skipping variant %s: %s" % (entrypoint, choice, e))
+            timings.append(VariantTiming(choice=choice, times=None, error=e))
+
+    variants, failures = _build_variants(variants, max_workers)
+    for choice, e in failures:
+        logger.info("%s: variant %s failed: %s" % (entrypoint, choice, e))
+        timings.append(VariantTiming(choice=choice, times=None, error=e))
+
+    # }}}
+
+    # {{{ time variants
+
+    best = None
+    for choice, variant in variants:
+        try:
+            times = _time_variant(variant, args, queue, entrypoint,
+                    warmup=warmup, repeat=repeat)
+        except Exception as e:
+            logger.info("%s: variant %s failed: %s" % (entrypoint, choice, e))
+            timings.append(VariantTiming(choice=choice, times=None, error=e))
+            continue
+
+        timing = VariantTiming(choice=choice, times=times, error=None)
+        timings.append(timing)
+        logger.info("%s: variant %s: median %g s"
+                % (entrypoint, choice, timing.median))
+
+        if best is None or timing.median < best[0].median:
+            best = (timing, variant)
+
+    if best is None:
+        raise LoopyError("autotune: none of the variants could be run")
+
+    # }}}
+
+    best_timing, best_variant = best
+
+    if db_key is not None:
+        database[db_key] = best_timing.choice
+
+    return AutotuneResult(
+            choice=best_timing.choice,
+            t_unit=best_variant,
+            timings=timings,
+            from_database=False)
+
+# vim: foldmethod=marker
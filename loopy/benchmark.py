@@ -0,0 +1,212 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+from pytools import ImmutableRecord
+
+from loopy.diagnostic import LoopyError
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+__doc__ = """
+Timing the execution of kernels, independently of checking their results
+(for which see :func:`loopy.auto_test_vs_ref`).
+
+Example::
+
+    result = benchmark(t_unit, {"a": a, "n": n}, queue=queue, timer="event")
+    print(result)
+    with open("timings.json", "w") as outf:
+        outf.write(result.to_json())
+
+.. autofunction:: benchmark
+
+.. autoclass:: BenchmarkResult
+"""
+
+
+class BenchmarkResult(ImmutableRecord):
+    """
+    .. attribute:: name
+
+    .. attribute:: timer
+
+        ``"wall"`` or ``"event"``, see :func:`benchmark`.
+
+    .. attribute:: times
+
+        A :class:`list` of the times (in seconds) taken by the timed
+        invocations.
+
+    .. autoattribute:: nrepeat
+    .. autoattribute:: min
+    .. autoattribute:: median
+    .. autoattribute:: iqr
+    .. autoattribute:: mean
+
+    .. automethod:: as_dict
+    .. automethod:: to_json
+    """
+
+    @property
+    def nrepeat(self):
+        return len(self.times)
+
+    @property
+    def min(self):
+        return min(self.times)
+
+    @property
+    def median(self):
+        return float(np.median(self.times))
+
+    @property
+    def iqr(self):
+        """The interquartile range of :attr:`times`."""
+        q1, q3 = np.percentile(self.times, [25, 75])
+        return float(q3 - q1)
+
+    @property
+    def mean(self):
+        return float(np.mean(self.times))
+
+    def as_dict(self):
+        """Return a :class:`dict` of the summary statistics and the times,
+        suitable for serialization as JSON.
+        """
+        return {
+                "name": self.name,
+                "timer": self.timer,
+                "nrepeat": self.nrepeat,
+                "min": self.min,
+                "median": self.median,
+                "iqr": self.iqr,
+                "mean": self.mean,
+                "times": list(self.times),
+                }
+
+    def to_json(self, **kwargs):
+        """Return :meth:`as_dict` as a JSON :class:`str`. *kwargs* are passed
+        on to :func:`json.dumps`.
+        """
+        import json
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def __str__(self):
+        return ("%s: median %g s (IQR %g s), min %g s, %d repetitions (%s)"
+                % (self.name, self.median, self.iqr, self.min, self.nrepeat,
+                    self.timer))
+
+
+def _get_default_name(func):
+    from loopy.translation_unit import TranslationUnit
+    if isinstance(func, TranslationUnit):
+        return func.default_entrypoint.name
+    return getattr(func, "__name__", type(func).__name__)
+
+
+def benchmark(func, args=None, *, queue=None, entrypoint=None, warmup=2,
+        min_repeat=5, max_repeat=1000, min_time=0.2, timer="wall", name=None):
+    """Time the invocations of *func* with the keyword arguments *args*.
+
+    :arg func: a :class:`loopy.TranslationUnit` with an executable target,
+        a kernel executor, or any other callable. It is called as
+        ``func(queue, **args)`` if *queue* is given, and as ``func(**args)``
+        otherwise.
+    :arg queue: a :class:`pyopencl.CommandQueue`, which is waited for after
+        each invocation.
+    :arg entrypoint: passed on to *func* if given.
+    :arg warmup: the number of untimed invocations before timing, which
+        absorb the cost of compilation and of populating caches.
+    :arg min_repeat: the minimum number of timed invocations.
+    :arg max_repeat: the maximum number of timed invocations.
+    :arg min_time: invocations are repeated (up to *max_repeat* times) until
+        their total time exceeds *min_time* seconds, to keep the statistics
+        of fast kernels from being dominated by noise.
+    :arg timer: ``"wall"`` to time invocations by the wall clock (as given by
+        :func:`time.perf_counter`), or ``"event"`` to time them by device
+        events enqueued into *queue* around each invocation. The latter
+        requires *queue* to have profiling enabled, and excludes the host-side
+        overhead of the invocation.
+    :arg name: the name under which to report the result. Defaults to the
+        name of the entrypoint.
+    :returns: a :class:`BenchmarkResult`.
+    """
+    from time import perf_counter
+
+    if args is None:
+        args = {}
+    if entrypoint is not None:
+        args = dict(args, entrypoint=entrypoint)
+    if name is None:
+        name = entrypoint if entrypoint is not None else _get_default_name(func)
+
+    if timer not in ["wall", "event"]:
+        raise LoopyError(f"unknown timer: '{timer}'")
+
+    if queue is not None:
+        def run():
+            func(queue, **args)
+            queue.finish()
+    else:
+        def run():
+            func(**args)
+
+    if timer == "event":
+        if queue is None:
+            raise LoopyError("timing by events requires a queue")
+
+        import pyopencl as cl
+        if not queue.properties & cl.command_queue_properties.PROFILING_ENABLE:
+            raise LoopyError("timing by events requires a queue with "
+                    "profiling enabled")
+
+        def time_run():
+            evt_start = cl.enqueue_marker(queue)
+            func(queue, **args)
+            evt_end = cl.enqueue_marker(queue)
+            queue.finish()
+            return 1e-9*(evt_end.profile.START - evt_start.profile.START)
+    else:
+        def time_run():
+            start = perf_counter()
+            run()
+            return perf_counter() - start
+
+    logger.info("%s: warmup" % name)
+    for _ in range(warmup):
+        run()
+
+    logger.info("%s: timing run" % name)
+    times = []
+    while len(times) < max_repeat and (
+            len(times) < min_repeat or sum(times) < min_time):
+        times.append(time_run())
+
+    result = BenchmarkResult(name=name, timer=timer, times=times)
+    logger.info(str(result))
+
+    return result
+
+# vim: foldmethod=marker
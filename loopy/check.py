@@ -31,10 +31,9 @@ from loopy.kernel.instruction import (MultiAssignmentBase, CallInstruction,
                                       CInstruction, _DataObliviousInstruction,
                                       NoOpInstruction)
 from loopy.translation_unit import for_each_kernel
+from loopy.instrumentation import instrumented_pass
 from pytools import memoize_method
 
-from collections import defaultdict
-
 from functools import reduce
 
 import logging
@@ -195,6 +194,7 @@ def _check_for_integer_subscript_indices_inner(kernel, callables_table):
                 type(insn).__name__))
 
 
+@instrumented_pass
 def check_for_integer_subscript_indices(t_unit):
     """
     Checks if every array access is of type :class:`int`.
@@ -337,6 +337,7 @@ def _check_for_double_use_of_hw_axes_inner(kernel, callables_table):
                 insn_tag_keys.add(key)
 
 
+@instrumented_pass
 def check_for_double_use_of_hw_axes(t_unit):
     """
     Check if any instruction of *kernel* is within multiple inames tagged with
@@ -758,6 +759,7 @@ def _check_bounds_inner_rec(kernel, callables_table):
                 warn_with_kernel(kernel, "array_access_out_of_bounds", str(e))
 
 
+@instrumented_pass
 def check_bounds(t_unit):
     """
     Performs out-of-bound check for every array access.
@@ -889,6 +891,37 @@ def _get_topological_order(kernel):
     return order
 
 
+def _get_ordered_insn_bitsets(kernel, topological_order):
+    """Return a tuple ``(insn_to_index, predecessors, successors)``, where
+    *insn_to_index* maps instruction IDs to their position in
+    *topological_order*, and *predecessors* (*successors*) is a :class:`list`
+    containing for each instruction (in *topological_order*) an :class:`int`
+    with the bits set at the positions of the instructions it depends on
+    (that depend on it) directly or indirectly.
+    """
+    insn_to_index = {insn_id: i for i, insn_id in enumerate(topological_order)}
+    ninsns = len(topological_order)
+
+    predecessors = [0] * ninsns
+    successors = [0] * ninsns
+
+    for i, insn_id in enumerate(topological_order):
+        preds = 0
+        for dep_id in kernel.id_to_insn[insn_id].depends_on:
+            dep_index = insn_to_index[dep_id]
+            preds |= predecessors[dep_index] | (1 << dep_index)
+        predecessors[i] = preds
+
+    for i in range(ninsns-1, -1, -1):
+        succs = successors[i] | (1 << i)
+        # propagate to the direct dependencies only, as they propagate
+        # to their own dependencies in turn
+        for dep_id in kernel.id_to_insn[topological_order[i]].depends_on:
+            successors[insn_to_index[dep_id]] |= succs
+
+    return insn_to_index, predecessors, successors
+
+
 def _check_variable_access_ordered_inner(kernel):
     from loopy.kernel.tools import find_aliasing_equivalence_classes
     from loopy.symbolic import AccessRangeOverlapChecker
@@ -899,18 +932,29 @@ def _check_variable_access_ordered_inner(kernel):
     # where the tuple denotes a pair of instructions IDs, and the variable
     # names are the ones that necessitate a dependency.
     #
-    # This mapping describes all the pairs of instructions (involving at least
-    # one write) that require ordering by way of a dependency.
-    # This mapping is then "whittled down" to remove pairs that have
-    # dependencies between them. E.g. a pair of writers will be contained in
-    # the mapping in both directions.
+    # This mapping describes the pairs of instructions (involving at least
+    # one write) that require ordering by way of a dependency, but are not
+    # ordered by a (possibly indirect) dependency between them.
     #
-    # Note: This can be worst-case O(n^2) in the number of instructions.
+    # Whether two instructions are ordered is determined from bitsets of the
+    # direct/indirect predecessors and successors of each instruction, so
+    # that the ordered pairs (usually the vast majority) need not be
+    # enumerated.
     dep_reqs_to_vars = {}
 
     wmap = kernel.writer_map()
     rmap = kernel.reader_map()
 
+    topological_order = _get_topological_order(kernel)
+    insn_to_index, predecessors, successors = _get_ordered_insn_bitsets(
+            kernel, topological_order)
+
+    def get_bitset(insn_ids):
+        result = 0
+        for insn_id in insn_ids:
+            result |= 1 << insn_to_index[insn_id]
+        return result
+
     # {{{ populate 'dep_reqs_to_vars'
 
     for var in kernel.get_written_variables():
@@ -922,94 +966,22 @@ def _check_variable_access_ordered_inner(kernel):
         writers = set.union(
                 *[wmap.get(eq_name, set()) for eq_name in eq_class])
 
-        for writer in writers:
-            required_deps = (readers | writers) - {writer}
-            required_deps = {req_dep
-                for req_dep in required_deps
-                if not declares_nosync_with(kernel, address_space, writer,
-                    req_dep)}
-
-            for req_dep in required_deps:
-                dep_reqs_to_vars.setdefault((writer, req_dep), set()).add(var)
+        accessors = get_bitset(readers | writers)
 
-    # }}}
-
-    # {{{ compute rev_depends, depends_on
-
-    # depends_on: mapping from insn_ids to their dependencies
-    depends_on = {insn.id: set() for insn in kernel.instructions}
-    # rev_depends: mapping from insn_ids to their reverse deps.
-    rev_depends = {insn.id: set() for insn in kernel.instructions}
-
-    for insn in kernel.instructions:
-        depends_on[insn.id].update(insn.depends_on)
-        for dep in insn.depends_on:
-            rev_depends[dep].add(insn.id)
-
-    # }}}
-
-    # {{{ remove pairs from dep_reqs_to_vars for which dependencies exist
-
-    topological_order = _get_topological_order(kernel)
+        for writer in writers:
+            writer_index = insn_to_index[writer]
+            unordered = accessors & ~(
+                    predecessors[writer_index] | successors[writer_index]
+                    | (1 << writer_index))
 
-    def satisfy_dep_reqs_in_order(dep_reqs_to_vars, edges, order):
-        """
-        Considering a graph defined by *edges* (as ``key -> value``),
-        remove pairs of nodes from *dep_reqs_to_vars* for which edges
-        exist in the graph. In doing so, make use of the topological
-        order *order* (given as a sequence of *nodes*). For ``i<j``,
-        no direct or indirect edges from ``order[j]`` to ``order[i]``
-        exist. (All edges go from 'low index' to 'high index'.)
-        """
-
-        insn_to_req_deps = defaultdict(set)
-        insn_to_order = {insn: i for i, insn in enumerate(order)}
-
-        # Use dep_reqs_to_vars to construct insn_to_req_deps, listing
-        # path endpoints pred -> ... -> insn to be considered for elimination.
-        for insn, pred in dep_reqs_to_vars:
-            if insn_to_order[pred] > insn_to_order[insn]:
-                # If *pred* happens after *insn*, then there is no path
-                # *pred* -> ... -> *insn*.
-                continue
+            while unordered:
+                lowest_bit = unordered & -unordered
+                unordered ^= lowest_bit
+                req_dep = topological_order[lowest_bit.bit_length() - 1]
 
-            insn_to_req_deps[pred].add(insn)
-
-        for pred, check_successors in insn_to_req_deps.items():
-            # for each *pred*, we will calculate all the direct/indirect
-            # instructions that can be reached.
-            seen_successors = set()
-            # first let us start with direct sucessors
-            to_check = edges[pred].copy()
-            while to_check:
-                successor = to_check.pop()
-                seen_successors.add(successor)
-
-                # Next we check if this successor was in *dep_reqs_to_vars*
-                # and remove the pair from there if it is
-                if successor in check_successors:
-                    dep_reqs_to_vars.pop((successor, pred))
-                    check_successors.remove(successor)
-                    if not check_successors:
-                        break
-
-                # next we iterate through the successors of successor.
-                for edge in edges[successor]:
-                    if edge not in seen_successors:
-                        to_check.add(edge)
-
-    # forward dep. graph traversal in reverse topological sort order
-    # (proceeds "end of program" -> "beginning of program")
-    satisfy_dep_reqs_in_order(dep_reqs_to_vars, depends_on,
-            topological_order[::-1])
-
-    # Run the same thing on the reversed graph, with the reverse topological_order.
-    # All edges above are 'low index to high index'.
-    # Reversing graph and order maintains this property.
-
-    # reverse dep. graph traversal in topological sort order
-    # (proceeds "beginning of program" -> "end of program")
-    satisfy_dep_reqs_in_order(dep_reqs_to_vars, rev_depends, topological_order)
+                if not declares_nosync_with(kernel, address_space, writer,
+                        req_dep):
+                    dep_reqs_to_vars.setdefault((writer, req_dep), set()).add(var)
 
     # }}}
 
@@ -1108,6 +1080,7 @@ def check_variable_access_ordered(kernel):
 # }}}
 
 
+@instrumented_pass
 def pre_schedule_checks(t_unit):
     try:
         logger.debug("pre-schedule checks start for entrypoints: "
@@ -1542,6 +1515,7 @@ def validate_kernel_call_sites(translation_unit):
 # }}}
 
 
+@instrumented_pass
 def pre_codegen_entrypoint_checks(kernel, callables_table):
     logger.debug("pre-codegen entrypoint check %s: start" % kernel.name)
 
@@ -1550,6 +1524,7 @@ def pre_codegen_entrypoint_checks(kernel, callables_table):
     logger.debug("pre-codegen entrypoint check %s: done" % kernel.name)
 
 
+@instrumented_pass
 def pre_codegen_callable_checks(kernel, callables_table):
     logger.debug("pre-codegen callable check %s: start" % kernel.name)
 
@@ -1563,6 +1538,7 @@ def pre_codegen_callable_checks(kernel, callables_table):
     logger.debug("pre-codegen callable check %s: done" % kernel.name)
 
 
+@instrumented_pass
 def pre_codegen_checks(t_unit):
     from loopy.kernel.function_interface import CallableKernel
 
@@ -51,7 +51,81 @@ def defines_to_python_code(defines_str):
     return "\n".join(result)
 
 
+# {{{ cache management
+
+def _format_size(nbytes):
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if nbytes < 1024:
+            break
+        nbytes /= 1024
+    else:
+        unit = "TiB"
+
+    return f"{nbytes:.1f} {unit}" if unit != "B" else f"{nbytes} B"
+
+
+def cache_main(argv):
+    from argparse import ArgumentParser
+    from loopy.tools import (get_cache_dirs, get_cache_root, parse_size,
+            prune_caches, _iter_disk_entries)
+
+    parser = ArgumentParser(prog="python -m loopy cache",
+            description="Inspect and prune loopy's on-disk caches")
+    parser.add_argument("--cache-root", metavar="DIR",
+            help="Defaults to %s" % get_cache_root())
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("info", help="show the size of each cache")
+
+    prune_parser = subparsers.add_parser("prune",
+            help="remove least recently used and stale entries")
+    prune_parser.add_argument("--max-size", metavar="SIZE",
+            help="maximum size to retain per cache, e.g. 500M or 2G")
+    prune_parser.add_argument("--max-age", metavar="DAYS", type=float,
+            help="remove entries not used for more than DAYS days")
+    prune_parser.add_argument("--keep-stale", action="store_true",
+            help="keep caches belonging to other versions of loopy")
+
+    subparsers.add_parser("clear", help="remove all of loopy's caches")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        total = 0
+        for container_dir, is_current in get_cache_dirs(args.cache_root):
+            entries = list(_iter_disk_entries(container_dir))
+            nbytes = sum(size for _, size, _ in entries)
+            total += nbytes
+            print("{:>10}  {:>6} entries  {}{}".format(
+                _format_size(nbytes), len(entries),
+                container_dir, "" if is_current else "  (stale)"))
+        print(f"{_format_size(total):>10}  total")
+
+    elif args.command == "prune":
+        nbytes_removed = prune_caches(
+                max_size=(parse_size(args.max_size)
+                    if args.max_size is not None else None),
+                max_age=(args.max_age * 24 * 3600
+                    if args.max_age is not None else None),
+                remove_stale=not args.keep_stale,
+                cache_root=args.cache_root)
+        print(f"removed {_format_size(nbytes_removed)}")
+
+    elif args.command == "clear":
+        nbytes_removed = prune_caches(max_size=0, remove_stale=True,
+                cache_root=args.cache_root)
+        print(f"removed {_format_size(nbytes_removed)}")
+
+    else:
+        raise AssertionError()
+
+# }}}
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "cache":
+        return cache_main(sys.argv[2:])
+
     from argparse import ArgumentParser
 
     parser = ArgumentParser(description="Stand-alone loopy frontend")
@@ -28,8 +28,7 @@ import islpy as isl
 from loopy.diagnostic import LoopyError, warn
 from pytools import ImmutableRecord
 
-from pytools.persistent_dict import WriteOncePersistentDict
-from loopy.tools import LoopyKeyBuilder
+from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
 from loopy.version import DATA_MODEL_VERSION
 
 
@@ -39,6 +38,7 @@ from functools import reduce
 from loopy.kernel.function_interface import CallableKernel
 
 from pytools import ProcessLogger
+from loopy.instrumentation import instrumented_pass, note_pass_cache_hit
 
 __doc__ = """
 .. currentmodule:: loopy.codegen
@@ -422,7 +422,7 @@ class CodeGenerationState:
 # }}}
 
 
-code_gen_cache = WriteOncePersistentDict(
+code_gen_cache = LoopyWriteOncePersistentDict(
          "loopy-code-gen-cache-v3-"+DATA_MODEL_VERSION,
          key_builder=LoopyKeyBuilder())
 
@@ -465,6 +465,7 @@ class PreambleInfo(ImmutableRecord):
 
 # {{{ main code generation entrypoint
 
+@instrumented_pass
 def generate_code_for_a_single_kernel(kernel, callables_table, target,
         is_entrypoint):
     """
@@ -709,11 +710,52 @@ class TranslationUnitCodeGenerationResult(ImmutableRecord):
                     self.host_programs.values()))
 
 
+def _generate_code_for_a_single_callable(program, func_id):
+    return generate_code_for_a_single_kernel(program[func_id],
+                                             program.callables_table,
+                                             program.target,
+                                             func_id in program.entrypoints)
+
+
+_codegen_worker_program = None
+
+
+def _init_codegen_worker(program):
+    global _codegen_worker_program
+    _codegen_worker_program = program
+
+
+def _generate_code_for_a_single_callable_in_worker(func_id):
+    return _generate_code_for_a_single_callable(_codegen_worker_program,
+                                                func_id)
+
+
+def _generate_code_for_kernels_parallel(program, func_ids, nprocesses):
+    """Return a list of the :class:`CodeGenerationResult` instances for the
+    callable kernels *func_ids* of *program*, in the same order, generated in
+    *nprocesses* worker processes.
+    """
+    import multiprocessing
+    with ProcessLogger(logger, "%s: parallel code generation for %d kernels"
+            % (", ".join(sorted(program.entrypoints)), len(func_ids))):
+        # The translation unit is sent to each worker once, instead of with
+        # each kernel name.
+        with multiprocessing.Pool(nprocesses,
+                initializer=_init_codegen_worker,
+                initargs=(program,)) as pool:
+            return pool.map(_generate_code_for_a_single_callable_in_worker,
+                    func_ids)
+
+
+@instrumented_pass
 def generate_code_v2(program):
     """
     Returns an instance of :class:`CodeGenerationResult`.
 
     :param program: An instance of :class:`loopy.TranslationUnit`.
+
+    Code for the callable kernels is generated in worker processes if
+    :attr:`loopy.Options.codegen_processes` is greater than 1.
     """
 
     from loopy.kernel import LoopKernel
@@ -729,9 +771,10 @@ def generate_code_v2(program):
             result = code_gen_cache[input_program]
             logger.debug(f"TranslationUnit with entrypoints {program.entrypoints}:"
                          " code generation cache hit")
+            note_pass_cache_hit(True)
             return result
         except KeyError:
-            pass
+            note_pass_cache_hit(False)
 
     # }}}
 
@@ -771,12 +814,21 @@ def generate_code_v2(program):
 
     # {{{ collect host/device programs
 
-    for func_id in sorted(key for key, val in program.callables_table.items()
-                          if isinstance(val, CallableKernel)):
-        cgr = generate_code_for_a_single_kernel(program[func_id],
-                                                program.callables_table,
-                                                program.target,
-                                                func_id in program.entrypoints)
+    func_ids = sorted(key for key, val in program.callables_table.items()
+                      if isinstance(val, CallableKernel))
+    nprocesses = min(
+            max(program[func_id].options.codegen_processes
+                for func_id in func_ids),
+            len(func_ids))
+
+    if nprocesses > 1:
+        cgrs = _generate_code_for_kernels_parallel(program, func_ids,
+                nprocesses)
+    else:
+        cgrs = (_generate_code_for_a_single_callable(program, func_id)
+                for func_id in func_ids)
+
+    for func_id, cgr in zip(func_ids, cgrs):
         if func_id in program.entrypoints:
             host_programs[func_id] = cgr.host_program
             implemented_data_infos[func_id] = cgr.implemented_data_info
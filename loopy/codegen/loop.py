@@ -161,6 +161,9 @@ def generate_unroll_loop(codegen_state, sched_index):
 # {{{ vectorized loops
 
 def generate_vectorize_loop(codegen_state, sched_index):
+    if codegen_state.ast_builder.can_implement_simd_loops:
+        return generate_sequential_loop_dim_code(codegen_state, sched_index)
+
     kernel = codegen_state.kernel
 
     iname = kernel.linearization[sched_index].iname
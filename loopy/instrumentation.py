@@ -0,0 +1,425 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import sys
+import threading
+import time
+from functools import wraps
+
+
+__doc__ = """
+Recording the time, memory and cache use of the passes that make up the
+processing of a kernel, i.e. preprocessing (e.g. type inference, reduction
+realization, substitution expansion), checks, linearization (including
+barrier insertion) and code generation, as well as any transformation
+applied to each kernel via :func:`loopy.for_each_kernel`.
+
+Example::
+
+    from loopy.instrumentation import PassProfiler
+
+    with PassProfiler(trace_memory=True) as prof:
+        code = lp.generate_code_v2(t_unit)
+
+    print(prof.summary())
+    prof.write_chrome_trace("loopy-trace.json")
+
+The resulting file may be viewed in ``chrome://tracing`` or
+`Perfetto <https://ui.perfetto.dev>`__. Passes run in worker processes (see
+:attr:`loopy.Options.codegen_processes`) are not recorded.
+
+.. autoclass:: PassProfiler
+
+.. autoclass:: PassRecord
+
+.. autofunction:: add_pass_listener
+
+.. autofunction:: remove_pass_listener
+
+.. autofunction:: record_pass
+
+.. autofunction:: instrumented_pass
+
+.. autofunction:: note_pass_cache_hit
+"""
+
+
+# {{{ recording
+
+# callables to which each PassRecord is passed once the pass has finished
+_pass_listeners = []
+
+# number of PassProfiler instances tracing memory allocations
+_nmemory_tracers = 0
+
+# tracemalloc.reset_peak, needed to find the peak memory use of each pass, was
+# added in Python 3.9.
+_HAVE_RESET_PEAK = sys.version_info >= (3, 9)
+
+_thread_state = threading.local()
+
+
+class PassRecord:
+    """The resources used by one execution of a pass on a kernel.
+
+    .. attribute:: name
+
+    .. attribute:: kernel_name
+
+        The name of the kernel the pass was applied to, a comma-separated list
+        of entrypoints for passes applied to a whole
+        :class:`loopy.TranslationUnit`, or *None*.
+
+    .. attribute:: start
+
+        The value of :func:`time.perf_counter` when the pass started.
+
+    .. attribute:: wall_time
+
+        In seconds.
+
+    .. attribute:: cpu_time
+
+        Time (in seconds) spent by the process on the CPU during the pass,
+        see :func:`time.process_time`.
+
+    .. attribute:: allocated_memory
+
+        The change (in bytes) in the memory allocated by Python objects
+        during the pass, or *None* if memory was not traced.
+
+    .. attribute:: peak_memory
+
+        The maximum increase (in bytes) of the memory allocated by Python
+        objects over its amount at the start of the pass, or *None* if memory
+        was not traced. Only recorded on Python 3.9 and newer.
+
+    .. attribute:: cache_hit
+
+        *True* if the result of the pass was found in a cache, *False* if it
+        was not, and *None* if the pass is not cached (or caching is
+        disabled).
+
+    .. attribute:: depth
+
+        The number of passes within which this pass was run.
+
+    .. attribute:: thread_id
+    """
+
+    def __init__(self, name, kernel_name, start, depth, thread_id):
+        self.name = name
+        self.kernel_name = kernel_name
+        self.start = start
+        self.depth = depth
+        self.thread_id = thread_id
+
+        self.wall_time = None
+        self.cpu_time = None
+        self.allocated_memory = None
+        self.peak_memory = None
+        self.cache_hit = None
+
+        # whether the pass was run within another execution of itself
+        self._is_recursive = False
+
+    def __repr__(self):
+        return (f"PassRecord({self.name!r}, kernel_name={self.kernel_name!r}, "
+                f"wall_time={self.wall_time!r}, cache_hit={self.cache_hit!r})")
+
+
+def _get_active_records():
+    try:
+        return _thread_state.records
+    except AttributeError:
+        _thread_state.records = []
+        return _thread_state.records
+
+
+class _NullRecorder:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NULL_RECORDER = _NullRecorder()
+
+
+class _PassRecorder:
+    def __init__(self, name, kernel_name):
+        self.name = name
+        self.kernel_name = kernel_name
+
+    def __enter__(self):
+        import tracemalloc
+
+        active_records = _get_active_records()
+        record = PassRecord(self.name, self.kernel_name,
+                start=None, depth=len(active_records),
+                thread_id=threading.get_ident())
+        record._is_recursive = any(
+                outer_record.name == self.name for outer_record in active_records)
+
+        if tracemalloc.is_tracing() and _nmemory_tracers:
+            current, peak = tracemalloc.get_traced_memory()
+            record.allocated_memory = current
+
+            if _HAVE_RESET_PEAK:
+                # The peak is reset for each pass, so propagate the peak so far
+                # to the passes this one is nested in.
+                for outer_record in active_records:
+                    if outer_record.peak_memory is not None:
+                        outer_record.peak_memory = max(
+                                outer_record.peak_memory, peak)
+                tracemalloc.reset_peak()
+
+                record.peak_memory = current
+
+        active_records.append(record)
+
+        self.record = record
+        self.start_cpu_time = time.process_time()
+        record.start = time.perf_counter()
+
+        return record
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        import tracemalloc
+
+        record = self.record
+        record.wall_time = time.perf_counter() - record.start
+        record.cpu_time = time.process_time() - self.start_cpu_time
+
+        active_records = _get_active_records()
+        popped_record = active_records.pop()
+        assert popped_record is record
+
+        if record.allocated_memory is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+
+            if record.peak_memory is not None:
+                record.peak_memory = max(record.peak_memory, peak)
+                for outer_record in active_records:
+                    if outer_record.peak_memory is not None:
+                        outer_record.peak_memory = max(
+                                outer_record.peak_memory, record.peak_memory)
+                tracemalloc.reset_peak()
+
+                record.peak_memory -= record.allocated_memory
+
+            record.allocated_memory = current - record.allocated_memory
+        else:
+            record.allocated_memory = None
+            record.peak_memory = None
+
+        if exc_type is None:
+            for listener in list(_pass_listeners):
+                listener(record)
+
+
+def record_pass(name, kernel_name=None):
+    """Return a context manager recording the execution of its body as the
+    pass *name* applied to the kernel *kernel_name*, if any listeners are
+    registered (see :func:`add_pass_listener`). Does nothing otherwise.
+    """
+    if not _pass_listeners:
+        return _NULL_RECORDER
+
+    return _PassRecorder(name, kernel_name)
+
+
+def _get_kernel_name(obj):
+    entrypoints = getattr(obj, "entrypoints", None)
+    if entrypoints is not None:
+        return ", ".join(sorted(entrypoints))
+
+    name = getattr(obj, "name", None)
+    if isinstance(name, str):
+        return name
+
+    return None
+
+
+def instrumented_pass(func):
+    """A decorator recording each invocation of *func* as a pass (see
+    :func:`record_pass`), applied to the kernel or translation unit that is
+    the first argument of *func*.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _pass_listeners:
+            return func(*args, **kwargs)
+
+        with _PassRecorder(name, _get_kernel_name(args[0]) if args else None):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def note_pass_cache_hit(cache_hit):
+    """Record whether the result of the innermost active pass (see
+    :func:`record_pass`) was found in a cache.
+    """
+    if not _pass_listeners:
+        return
+
+    active_records = _get_active_records()
+    if active_records:
+        active_records[-1].cache_hit = cache_hit
+
+
+def add_pass_listener(listener):
+    """Register *listener* to be called with a :class:`PassRecord` after each
+    pass has finished.
+    """
+    _pass_listeners.append(listener)
+
+
+def remove_pass_listener(listener):
+    _pass_listeners.remove(listener)
+
+# }}}
+
+
+# {{{ profiler
+
+class PassProfiler:
+    """A context manager collecting :class:`PassRecord` instances for all
+    passes run in its body.
+
+    :arg trace_memory: if *True*, record the memory allocated by each pass
+        using :mod:`tracemalloc`. This slows down the passes considerably.
+
+    .. attribute:: records
+
+        A :class:`list` of :class:`PassRecord` instances, in the order in
+        which the passes finished.
+
+    .. automethod:: summary
+    .. automethod:: to_chrome_trace
+    .. automethod:: write_chrome_trace
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+
+    def __enter__(self):
+        global _nmemory_tracers
+
+        if self.trace_memory:
+            import tracemalloc
+            self.started_tracemalloc = not tracemalloc.is_tracing()
+            if self.started_tracemalloc:
+                tracemalloc.start()
+            _nmemory_tracers += 1
+
+        add_pass_listener(self.records.append)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _nmemory_tracers
+
+        remove_pass_listener(self.records.append)
+
+        if self.trace_memory:
+            _nmemory_tracers -= 1
+            if self.started_tracemalloc:
+                import tracemalloc
+                tracemalloc.stop()
+
+    def summary(self):
+        """Return a :class:`str` with a table of the total wall time, CPU time
+        and number of calls and cache hits for each pass, slowest first.
+        Only the outermost execution of nested executions of a pass is
+        counted.
+        """
+        totals = {}
+        for record in self.records:
+            if record._is_recursive:
+                continue
+
+            wall_time, cpu_time, ncalls, nhits = totals.get(
+                    record.name, (0, 0, 0, 0))
+            totals[record.name] = (wall_time + record.wall_time,
+                    cpu_time + record.cpu_time, ncalls + 1,
+                    nhits + bool(record.cache_hit))
+
+        name_width = max((len(name) for name in totals), default=4)
+        lines = ["%-*s %10s %10s %6s %6s"
+                % (name_width, "pass", "wall [s]", "cpu [s]", "calls", "hits")]
+        for name, (wall_time, cpu_time, ncalls, nhits) in sorted(
+                totals.items(), key=lambda item: -item[1][0]):
+            lines.append("%-*s %10.4f %10.4f %6d %6d"
+                    % (name_width, name, wall_time, cpu_time, ncalls, nhits))
+
+        return "\n".join(lines)
+
+    def to_chrome_trace(self):
+        """Return the records as a :class:`dict` in the `Trace Event Format
+        <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`__
+        understood by Chrome's and Perfetto's trace viewers.
+        """
+        import os
+
+        pid = os.getpid()
+        t0 = min((record.start for record in self.records), default=0)
+
+        events = []
+        for record in sorted(self.records, key=lambda record: record.start):
+            args = {"cpu_time": record.cpu_time}
+            if record.kernel_name is not None:
+                args["kernel"] = record.kernel_name
+            if record.cache_hit is not None:
+                args["cache_hit"] = record.cache_hit
+            if record.allocated_memory is not None:
+                args["allocated_memory"] = record.allocated_memory
+            if record.peak_memory is not None:
+                args["peak_memory"] = record.peak_memory
+
+            events.append({
+                "name": (record.name if record.kernel_name is None
+                    else f"{record.name} ({record.kernel_name})"),
+                "cat": "loopy",
+                "ph": "X",
+                "ts": 1e6*(record.start - t0),
+                "dur": 1e6*record.wall_time,
+                "pid": pid,
+                "tid": record.thread_id,
+                "args": args,
+                })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, filename):
+        """Write :meth:`to_chrome_trace` to the file *filename* as JSON."""
+        import json
+        with open(filename, "w") as outf:
+            json.dump(self.to_chrome_trace(), outf)
+
+# }}}
+
+# vim: foldmethod=marker
@@ -0,0 +1,172 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import os
+from functools import lru_cache
+from types import ModuleType
+
+
+__doc__ = """
+Process-global memoization of functions of (expression) arguments, in
+caches of bounded size.
+
+.. autofunction:: memoize_lru
+
+.. autofunction:: clear_memo_caches
+
+.. autofunction:: memo_cache_info
+
+.. autoclass:: MemoCacheInfo
+"""
+
+
+def _get_default_memo_cache_size():
+    return int(os.environ.get("LOOPY_MEMO_CACHE_SIZE", 10000))
+
+
+# maps identifiers to functions wrapped by functools.lru_cache
+_memo_caches = {}
+
+# maps identifiers to the number of evictions before the cache was last cleared
+_evictions_before_clear = {}
+
+
+class MemoCacheInfo:
+    """A snapshot of the state of a cache created by :func:`memoize_lru`.
+
+    .. attribute:: identifier
+
+    .. attribute:: hits
+
+        Number of calls served from the cache since it was last cleared.
+
+    .. attribute:: misses
+
+    .. attribute:: evictions
+
+        Number of entries dropped to keep the cache within its maximum size.
+
+    .. attribute:: size
+
+        Number of entries in the cache.
+
+    .. attribute:: maxsize
+
+    .. attribute:: nbytes
+
+        An estimate of the memory (in bytes) held by the cached arguments and
+        results, counting objects shared between entries only once.
+    """
+
+    def __init__(self, identifier, hits, misses, evictions, size, maxsize,
+            nbytes):
+        self.identifier = identifier
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.maxsize = maxsize
+        self.nbytes = nbytes
+
+    def __str__(self):
+        return (
+                f"{self.identifier}: {self.size}/{self.maxsize} entries "
+                f"(~{self.nbytes} B), {self.hits} hits, {self.misses} misses, "
+                f"{self.evictions} evictions")
+
+
+def _estimate_nbytes(objects):
+    import gc
+    from sys import getsizeof
+
+    seen = set()
+    nbytes = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType)):
+            continue
+        seen.add(id(obj))
+        nbytes += getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+
+    return nbytes
+
+
+def _get_memo_cache_info(identifier):
+    import gc
+    wrapper = _memo_caches[identifier]
+    hits, misses, maxsize, size = wrapper.cache_info()
+
+    # The cache entries are only accessible through the garbage
+    # collector's view of the references held by the wrapper.
+    entries = [obj for obj in gc.get_referents(wrapper)
+            if obj is not wrapper.__dict__ and obj is not wrapper.__wrapped__]
+
+    return MemoCacheInfo(identifier,
+            hits=hits, misses=misses, size=size, maxsize=maxsize,
+            evictions=_evictions_before_clear.get(identifier, 0) + misses - size,
+            nbytes=_estimate_nbytes(entries))
+
+
+def memoize_lru(maxsize=None):
+    """Return a decorator memoizing a function of hashable positional
+    arguments in a process-global :func:`functools.lru_cache` that is
+    registered for :func:`clear_memo_caches` and :func:`memo_cache_info`.
+    The cache holds at most *maxsize* entries, evicting the least recently
+    used entry first. *maxsize* defaults to the value of the environment
+    variable :envvar:`LOOPY_MEMO_CACHE_SIZE` (or 10000 if unset). A size of
+    0 disables memoization.
+
+    Unlike :func:`pytools.memoize`, this keeps the memory held by caches of
+    functions of expressions from growing with each kernel processed.
+    """
+    if maxsize is None:
+        maxsize = _get_default_memo_cache_size()
+
+    def decorator(func):
+        wrapper = lru_cache(maxsize)(func)
+        wrapper.identifier = f"{func.__module__}.{func.__qualname__}"
+        _memo_caches[wrapper.identifier] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def clear_memo_caches():
+    """Empty all caches created by :func:`memoize_lru`."""
+    for identifier, wrapper in list(_memo_caches.items()):
+        hits, misses, maxsize, size = wrapper.cache_info()
+        _evictions_before_clear[identifier] = (
+                _evictions_before_clear.get(identifier, 0) + misses - size)
+        wrapper.cache_clear()
+
+
+def memo_cache_info():
+    """Return a :class:`dict` mapping the identifiers (qualified function
+    names) of the caches created by :func:`memoize_lru` to
+    :class:`MemoCacheInfo` instances.
+    """
+    return {identifier: _get_memo_cache_info(identifier)
+            for identifier in sorted(_memo_caches)}
+
+# vim: foldmethod=marker
@@ -102,6 +102,11 @@ class Options(ImmutableRecord):
         Do not do any checking (data type, data layout, shape,
         etc.) on arguments for a minor performance gain.
 
+        If not set, the arguments are only checked if their data types,
+        shapes, strides or offsets (or the values of integer arguments
+        related to them) differ from those of an earlier call of the same
+        kernel.
+
         .. versionchanged:: 2021.1
 
             This now defaults to the same value as the ``optimize``
@@ -160,6 +165,23 @@ class Options(ImmutableRecord):
 
         A :class:`bool`. Whether to allow colors in terminal output
 
+    .. attribute:: linearization_processes
+
+        An :class:`int`. If greater than 1, the number of worker processes
+        among which the search for a linearization is divided. The resulting
+        linearization is the same as the one found by the sequential search.
+        Only this first linearization is searched for, i.e.
+        :func:`loopy.generate_loop_schedules` yields a single linearization
+        if this option is set.
+        See :func:`loopy.schedule.generate_loop_schedules_parallel`.
+
+    .. attribute:: codegen_processes
+
+        An :class:`int`. If greater than 1, the number of worker processes
+        among which code generation for the kernels of a translation unit is
+        divided. The largest value among the kernels of the translation unit
+        is used. The generated code does not depend on this option.
+
     .. rubric:: Features
 
     .. attribute:: disable_global_barriers
@@ -239,6 +261,8 @@ class Options(ImmutableRecord):
                 build_options=kwargs.get("build_options", []),
                 allow_terminal_colors=kwargs.get("allow_terminal_colors",
                     allow_terminal_colors_def),
+                linearization_processes=kwargs.get("linearization_processes", 0),
+                codegen_processes=kwargs.get("codegen_processes", 0),
                 disable_global_barriers=kwargs.get("disable_global_barriers",
                     False),
                 check_dep_resolution=kwargs.get("check_dep_resolution", True),
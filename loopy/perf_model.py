@@ -0,0 +1,309 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+from pytools import ImmutableRecord
+
+from loopy.diagnostic import LoopyError
+from loopy.statistics import CountGranularity
+
+
+__doc__ = """
+A roofline-style model predicting the run time of a kernel from the counts
+gathered by :func:`loopy.get_op_map`, :func:`loopy.get_mem_access_map` and
+:func:`loopy.get_synchronization_map`. It is meant to rank variants of a
+kernel (e.g. with different transformations applied) without running them,
+not to predict absolute run times accurately.
+
+The model assumes that arithmetic, global memory traffic and local memory
+traffic overlap perfectly, so that the slowest of them determines the run
+time, to which the cost of synchronization is added.
+
+Global memory traffic accounts for coalescing: an access by a work-item
+whose index changes by *s* elements from one work-item to the next along
+local axis 0 (see :attr:`loopy.MemAccess.lid_strides`) is taken to transfer
+``min(s, transaction_size/itemsize)`` elements, i.e. consecutive accesses
+share memory transactions. Accesses counted once per sub-group (see
+:class:`loopy.CountGranularity`), such as uniform loads, transfer one
+element.
+
+.. autoclass:: DeviceDescription
+
+.. autoclass:: PerformanceEstimate
+
+.. autofunction:: estimate_performance
+
+.. autofunction:: rank_variants
+"""
+
+
+class DeviceDescription(ImmutableRecord):
+    """The characteristics of a device relevant to the performance model.
+
+    .. attribute:: op_throughput
+
+        A :class:`dict` mapping (anything convertible to) a
+        :class:`numpy.dtype` to the peak number of arithmetic operations per
+        second on values of this type. The key *None* provides a default
+        for types not listed.
+
+    .. attribute:: op_weights
+
+        A :class:`dict` mapping operation names (see :attr:`loopy.Op.name`,
+        e.g. ``"div"`` or ``"func:exp"``) to the number of operations each
+        such operation is counted as. Operations not listed count as one.
+
+    .. attribute:: global_bandwidth
+
+        Global memory bandwidth in bytes per second.
+
+    .. attribute:: local_bandwidth
+
+        Local memory bandwidth in bytes per second, or *None* to ignore local
+        memory traffic.
+
+    .. attribute:: transaction_size
+
+        Size of a global memory transaction in bytes.
+
+    .. attribute:: subgroup_size
+
+    .. attribute:: barrier_latency
+
+        Time in seconds taken by a barrier.
+
+    .. attribute:: launch_latency
+
+        Time in seconds taken by a kernel launch.
+    """
+
+    def __init__(self, op_throughput, global_bandwidth, *,
+            op_weights=None, local_bandwidth=None, transaction_size=128,
+            subgroup_size=32, barrier_latency=0, launch_latency=0):
+        op_throughput = {
+                np.dtype(dtype) if dtype is not None else None: rate
+                for dtype, rate in op_throughput.items()}
+
+        if op_weights is None:
+            op_weights = {}
+
+        super().__init__(
+                op_throughput=op_throughput,
+                op_weights=op_weights,
+                global_bandwidth=global_bandwidth,
+                local_bandwidth=local_bandwidth,
+                transaction_size=transaction_size,
+                subgroup_size=subgroup_size,
+                barrier_latency=barrier_latency,
+                launch_latency=launch_latency)
+
+    def get_op_throughput(self, dtype):
+        try:
+            return self.op_throughput[np.dtype(dtype)]
+        except KeyError:
+            pass
+
+        try:
+            return self.op_throughput[None]
+        except KeyError:
+            raise LoopyError("device description does not specify the "
+                    "throughput of operations on '%s'" % dtype)
+
+
+class PerformanceEstimate(ImmutableRecord):
+    """The components of the predicted run time of a kernel, in seconds. If
+    arrays of parameter values were passed to :func:`estimate_performance`,
+    these are arrays of the broadcast shape.
+
+    .. attribute:: compute_time
+
+    .. attribute:: global_memory_time
+
+    .. attribute:: local_memory_time
+
+    .. attribute:: synchronization_time
+
+    .. attribute:: ops
+
+        The (weighted) number of arithmetic operations.
+
+    .. attribute:: global_bytes
+
+        The number of bytes transferred to and from global memory, accounting
+        for coalescing.
+
+    .. autoattribute:: total_time
+    .. autoattribute:: arithmetic_intensity
+    .. autoattribute:: bound
+    """
+
+    @property
+    def total_time(self):
+        """The predicted run time."""
+        return (
+                np.maximum(np.maximum(
+                    self.compute_time, self.global_memory_time),
+                    self.local_memory_time)
+                + self.synchronization_time)
+
+    @property
+    def arithmetic_intensity(self):
+        """Operations per byte of global memory traffic."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.divide(self.ops, self.global_bytes)
+
+    @property
+    def bound(self):
+        """A :class:`str` (or an array of them) naming the dominant
+        component of the run time: ``"compute"``, ``"global memory"`` or
+        ``"local memory"``.
+        """
+        names = np.array(["compute", "global memory", "local memory"])
+        result = names[np.argmax(np.stack(np.broadcast_arrays(
+                self.compute_time, self.global_memory_time,
+                self.local_memory_time)), axis=0)]
+
+        if result.ndim == 0:
+            return str(result)
+        return result
+
+
+def _get_global_access_elements_factor(device, access, params):
+    """Return the number of elements transferred per element accessed by
+    *access*, a :class:`loopy.MemAccess` of global memory.
+    """
+    if access.count_granularity != CountGranularity.WORKITEM:
+        return 1
+
+    lid0_stride = access.lid_strides.get(0)
+    if lid0_stride is None:
+        # contiguity unknown
+        return 1
+
+    from pymbolic import evaluate
+    stride = np.abs(evaluate(lid0_stride, params))
+
+    itemsize = access.dtype.numpy_dtype.itemsize
+    elements_per_transaction = max(device.transaction_size // itemsize, 1)
+
+    return np.where(stride == 0,
+            1 / device.subgroup_size,
+            np.minimum(stride, elements_per_transaction))
+
+
+def estimate_performance(program, device, params, entrypoint=None):
+    """Predict the run time of *program* on *device*.
+
+    :arg device: A :class:`DeviceDescription`.
+    :arg params: A mapping from the names of the kernel's parameters to
+        their values, which may be (broadcastable) integer arrays to evaluate
+        the model for many problem sizes at once.
+    :returns: A :class:`PerformanceEstimate`.
+    """
+    from loopy.statistics import (get_op_map, get_mem_access_map,
+            get_synchronization_map)
+
+    subgroup_size = device.subgroup_size
+
+    # {{{ arithmetic
+
+    op_map = get_op_map(program, subgroup_size=subgroup_size,
+            count_redundant_work=True, count_within_subscripts=False,
+            entrypoint=entrypoint)
+
+    ops = 0
+    compute_time = 0
+    for op, count in op_map.eval_with_arrays(params).items():
+        if op.count_granularity == CountGranularity.SUBGROUP:
+            count = count * subgroup_size
+
+        count = count * device.op_weights.get(op.name, 1)
+        ops = ops + count
+        compute_time = compute_time + count / device.get_op_throughput(
+                op.dtype.numpy_dtype)
+
+    # }}}
+
+    # {{{ memory
+
+    mem_map = get_mem_access_map(program, subgroup_size=subgroup_size,
+            count_redundant_work=True, entrypoint=entrypoint)
+
+    global_bytes = 0
+    local_bytes = 0
+    for access, count in mem_map.eval_with_arrays(params).items():
+        nbytes = count * access.dtype.numpy_dtype.itemsize
+        if access.mtype == "global":
+            global_bytes = global_bytes + nbytes * (
+                    _get_global_access_elements_factor(device, access, params))
+        elif access.mtype == "local":
+            local_bytes = local_bytes + nbytes
+
+    global_memory_time = global_bytes / device.global_bandwidth
+    if device.local_bandwidth is None:
+        local_memory_time = 0
+    else:
+        local_memory_time = local_bytes / device.local_bandwidth
+
+    # }}}
+
+    # {{{ synchronization
+
+    sync_map = get_synchronization_map(program, subgroup_size=subgroup_size,
+            entrypoint=entrypoint)
+
+    synchronization_time = 0
+    for sync, count in sync_map.eval_with_arrays(params).items():
+        if sync.kind == "kernel_launch":
+            synchronization_time = (synchronization_time
+                    + count * device.launch_latency)
+        else:
+            synchronization_time = (synchronization_time
+                    + count * device.barrier_latency)
+
+    # }}}
+
+    return PerformanceEstimate(
+            compute_time=compute_time,
+            global_memory_time=global_memory_time,
+            local_memory_time=local_memory_time,
+            synchronization_time=synchronization_time,
+            ops=ops,
+            global_bytes=global_bytes)
+
+
+def rank_variants(programs, device, params, entrypoint=None):
+    """Order variants of a kernel by their predicted run time on *device*.
+
+    :arg programs: An iterable of :class:`loopy.TranslationUnit` instances.
+    :arg params: A mapping from parameter names to (scalar) values.
+    :returns: A :class:`list` of tuples ``(estimate, program)``, where
+        *estimate* is a :class:`PerformanceEstimate`, fastest first.
+    """
+    estimates = [
+            (estimate_performance(program, device, params,
+                entrypoint=entrypoint), program)
+            for program in programs]
+
+    return sorted(estimates, key=lambda item: float(item[0].total_time))
+
+# vim: foldmethod=marker
@@ -28,9 +28,8 @@ from loopy.diagnostic import (
         LoopyAdvisory)
 import islpy as isl
 
-from pytools.persistent_dict import WriteOncePersistentDict
 
-from loopy.tools import LoopyKeyBuilder
+from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
 from loopy.version import DATA_MODEL_VERSION
 from loopy.kernel.data import make_assignment, filter_iname_tags_by_type
 from loopy.kernel.tools import kernel_has_global_barriers
@@ -45,6 +44,7 @@ from loopy.translation_unit import TranslationUnit
 from loopy.kernel.function_interface import CallableKernel, ScalarCallable
 
 from pytools import ProcessLogger
+from loopy.instrumentation import instrumented_pass, note_pass_cache_hit
 from functools import partial
 
 
@@ -136,6 +136,7 @@ def _get_assignee_inames_tagged(kernel, insn, tag_base, tv_names):
             if kernel.iname_tags_of_type(iname, tag_base)}
 
 
+@instrumented_pass
 def find_temporary_address_space(kernel):
     logger.debug("%s: find temporary address space" % kernel.name)
 
@@ -881,6 +882,7 @@ class RealizeReductionCallbackMapper(ReductionCallbackMapper):
 
 
 # @remove_any_newly_unused_inames
+@instrumented_pass
 def realize_reduction_for_single_kernel(kernel, callables_table,
         insn_id_filter=None, unknown_types_ok=True, automagic_scans_ok=False,
         force_scan=False, force_outer_iname_for_scan=None):
@@ -2033,6 +2035,7 @@ def realize_reduction(program, *args, **kwargs):
 
 # {{{ realize_ilp
 
+@instrumented_pass
 def realize_ilp(kernel):
     logger.debug("%s: add axes to temporaries for ilp" % kernel.name)
 
@@ -2055,6 +2058,7 @@ def realize_ilp(kernel):
 
 # {{{ check for loads of atomic variables
 
+@instrumented_pass
 def check_atomic_loads(kernel):
     """Find instances of AtomicInit or AtomicUpdate with use of other atomic
     variables to update the atomicity
@@ -2243,6 +2247,7 @@ def traverse_to_infer_arg_descr(kernel, callables_table):
     return descr_inferred_kernel, arg_descr_inf_mapper.clbl_inf_ctx
 
 
+@instrumented_pass
 def infer_arg_descr(program):
     """
     Returns a copy of *program* with the
@@ -2292,6 +2297,7 @@ def infer_arg_descr(program):
 
 # {{{  inline_kernels_with_gbarriers
 
+@instrumented_pass
 def inline_kernels_with_gbarriers(program):
     from loopy.kernel.instruction import BarrierInstruction
     from loopy.transform.callable import inline_callable_kernel
@@ -2331,11 +2337,12 @@ def filter_reachable_callables(t_unit):
     return t_unit.copy(callables_table=new_callables)
 
 
-preprocess_cache = WriteOncePersistentDict(
+preprocess_cache = LoopyWriteOncePersistentDict(
         "loopy-preprocess-cache-v2-"+DATA_MODEL_VERSION,
         key_builder=LoopyKeyBuilder())
 
 
+@instrumented_pass
 def _preprocess_single_kernel(kernel, callables_table, device=None):
     from loopy.kernel import KernelState
 
@@ -2384,6 +2391,7 @@ def _preprocess_single_kernel(kernel, callables_table, device=None):
     return kernel
 
 
+@instrumented_pass
 def preprocess_program(program, device=None):
 
     # {{{ cache retrieval
@@ -2396,6 +2404,7 @@ def preprocess_program(program, device=None):
             result = preprocess_cache[program]
             logger.debug(f"program with entrypoints: {program.entrypoints}"
                     " preprocess cache hit")
+            note_pass_cache_hit(True)
             return result
         except KeyError:
             pass
@@ -2492,6 +2501,7 @@ def preprocess_program(program, device=None):
 
     if CACHING_ENABLED:
         preprocess_cache.store_if_not_present(input_program, program)
+        note_pass_cache_hit(False)
 
     return program
 
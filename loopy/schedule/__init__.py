@@ -29,9 +29,10 @@ from loopy.diagnostic import (warn_with_kernel, LoopyError,
 
 from pytools import MinRecursionLimit, ProcessLogger
 
-from pytools.persistent_dict import WriteOncePersistentDict
-from loopy.tools import LoopyKeyBuilder
+from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
 from loopy.version import DATA_MODEL_VERSION
+from loopy.instrumentation import (
+        instrumented_pass, record_pass, note_pass_cache_hit)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -708,7 +709,7 @@ def schedule_as_many_run_insns_as_possible(sched_state, template_insn):
 
     # }}}
 
-    preschedule = sched_state.preschedule[:]
+    preschedule = list(sched_state.preschedule)
     have_inames = template_insn.within_inames - sched_state.parallel_inames
     toposorted_insns = sched_state.insns_in_topologically_sorted_order
 
@@ -716,7 +717,7 @@ def schedule_as_many_run_insns_as_possible(sched_state, template_insn):
 
     def next_preschedule_insn_id():
         return (next(iter(sched_item_to_insn_id(preschedule[0])), None)
-                if sched_state.preschedule
+                if preschedule
                 else None)
 
     def is_similar_to_template(insn):
@@ -799,7 +800,7 @@ def schedule_as_many_run_insns_as_possible(sched_state, template_insn):
             schedule=updated_schedule,
             scheduled_insn_ids=updated_scheduled_insn_ids,
             unscheduled_insn_ids=updated_unscheduled_insn_ids,
-            preschedule=preschedule,
+            preschedule=tuple(preschedule),
             insn_ids_to_try=new_insn_ids_to_try,
             active_group_counts=new_active_group_counts,
             insns_in_topologically_sorted_order=left_over_toposorted_insns
@@ -810,10 +811,76 @@ def schedule_as_many_run_insns_as_possible(sched_state, template_insn):
 
 # {{{ scheduling algorithm
 
+class _ScheduleSearchFrame:
+    def __init__(self, steps, nfound_before):
+        self.steps = steps
+        self.nfound_before = nfound_before
+
+
 def generate_loop_schedules_internal(
-        sched_state, debug=None):
+        sched_state, debug=None, _frontier=None):
+    """Yield the schedules found by a depth-first search starting at
+    *sched_state*.
+
+    The search tree is traversed using an explicit stack of the
+    nodes (see :func:`_generate_loop_schedule_steps`) on the path from
+    *sched_state* to the current node, so that the depth of the tree (which
+    grows with the number of instructions and loops) is not limited by the
+    interpreter's recursion limit.
+    """
+
+    # The number of schedules found so far. A node learns whether its
+    # subtree contained a schedule by comparing this against the value at the
+    # time the node was entered.
+    nfound = 0
+
+    stack = [_ScheduleSearchFrame(
+        _generate_loop_schedule_steps(sched_state, debug), 0)]
+    send_value = None
+
+    while stack:
+        frame = stack[-1]
+
+        try:
+            item = frame.steps.send(send_value)
+        except StopIteration:
+            stack.pop()
+            send_value = nfound > frame.nfound_before
+            continue
+
+        send_value = None
+
+        if isinstance(item, SchedulerState):
+            if _frontier is not None and len(stack) >= _frontier.max_depth:
+                _frontier.add_state(item)
+                send_value = False
+            else:
+                stack.append(_ScheduleSearchFrame(
+                    _generate_loop_schedule_steps(item, debug), nfound))
+
+        elif _frontier is not None:
+            _frontier.add_schedule(item)
+
+        else:
+            nfound += 1
+            yield item
+
+
+def _generate_loop_schedule_steps(sched_state, debug):
+    """A generator describing the expansion of one node of the schedule
+    search tree. It yields
+
+    - a :class:`SchedulerState` to visit the subtree rooted at that state.
+      The value sent back once the subtree has been fully traversed is
+      whether it contained a schedule.
+
+    - a :class:`tuple` of schedule items for each completed schedule.
+
+    See :func:`generate_loop_schedules_internal` for the driver.
+    """
     # allow_insn is set to False initially and after entering each loop
     # to give loops containing high-priority instructions a chance.
+
     kernel = sched_state.kernel
     Fore = kernel.options._fore  # noqa
     Style = kernel.options._style  # noqa
@@ -865,26 +932,22 @@ def generate_loop_schedules_internal(
 
     if isinstance(next_preschedule_item, CallKernel):
         assert sched_state.within_subkernel is False
-        yield from generate_loop_schedules_internal(
-                sched_state.copy(
-                    schedule=sched_state.schedule + (next_preschedule_item,),
-                    preschedule=sched_state.preschedule[1:],
-                    within_subkernel=True,
-                    may_schedule_global_barriers=False,
-                    enclosing_subkernel_inames=sched_state.active_inames),
-                debug=debug)
+        yield sched_state.copy(
+                schedule=sched_state.schedule + (next_preschedule_item,),
+                preschedule=sched_state.preschedule[1:],
+                within_subkernel=True,
+                may_schedule_global_barriers=False,
+                enclosing_subkernel_inames=sched_state.active_inames)
 
     if isinstance(next_preschedule_item, ReturnFromKernel):
         assert sched_state.within_subkernel is True
         # Make sure all subkernel inames have finished.
         if sched_state.active_inames == sched_state.enclosing_subkernel_inames:
-            yield from generate_loop_schedules_internal(
-                    sched_state.copy(
-                        schedule=sched_state.schedule + (next_preschedule_item,),
-                        preschedule=sched_state.preschedule[1:],
-                        within_subkernel=False,
-                        may_schedule_global_barriers=True),
-                    debug=debug)
+            yield sched_state.copy(
+                    schedule=sched_state.schedule + (next_preschedule_item,),
+                    preschedule=sched_state.preschedule[1:],
+                    within_subkernel=False,
+                    may_schedule_global_barriers=True)
 
     # }}}
 
@@ -897,11 +960,9 @@ def generate_loop_schedules_internal(
     if (
             isinstance(next_preschedule_item, Barrier)
             and next_preschedule_item.originating_insn_id is None):
-        yield from generate_loop_schedules_internal(
-                    sched_state.copy(
-                        schedule=sched_state.schedule + (next_preschedule_item,),
-                        preschedule=sched_state.preschedule[1:]),
-                    debug=debug)
+        yield sched_state.copy(
+                schedule=sched_state.schedule + (next_preschedule_item,),
+                preschedule=sched_state.preschedule[1:])
 
     # }}}
 
@@ -1074,10 +1135,7 @@ def generate_loop_schedules_internal(
             # Don't be eager about entering/leaving loops--if progress has been
             # made, revert to top of scheduler and see if more progress can be
             # made.
-            for sub_sched in generate_loop_schedules_internal(
-                    new_sched_state,
-                    debug=debug):
-                yield sub_sched
+            yield new_sched_state
 
             if not sched_state.group_insn_counts:
                 # No groups: We won't need to backtrack on scheduling
@@ -1169,21 +1227,17 @@ def generate_loop_schedules_internal(
 
             if can_leave and not debug_mode:
 
-                for sub_sched in generate_loop_schedules_internal(
-                        sched_state.copy(
-                            schedule=(
-                                sched_state.schedule
-                                + (LeaveLoop(iname=last_entered_loop),)),
-                            active_inames=sched_state.active_inames[:-1],
-                            insn_ids_to_try=insn_ids_to_try,
-                            preschedule=(
-                                sched_state.preschedule
-                                if last_entered_loop
-                                not in sched_state.prescheduled_inames
-                                else sched_state.preschedule[1:]),
-                        ),
-                        debug=debug):
-                    yield sub_sched
+                yield sched_state.copy(
+                        schedule=(
+                            sched_state.schedule
+                            + (LeaveLoop(iname=last_entered_loop),)),
+                        active_inames=sched_state.active_inames[:-1],
+                        insn_ids_to_try=insn_ids_to_try,
+                        preschedule=(
+                            sched_state.preschedule
+                            if last_entered_loop
+                            not in sched_state.prescheduled_inames
+                            else sched_state.preschedule[1:]))
 
                 return
 
@@ -1382,25 +1436,23 @@ def generate_loop_schedules_internal(
                             iname),
                         reverse=True):
 
-                    for sub_sched in generate_loop_schedules_internal(
-                            sched_state.copy(
-                                schedule=(
-                                    sched_state.schedule
-                                    + (EnterLoop(iname=iname),)),
-                                active_inames=(
-                                    sched_state.active_inames + (iname,)),
-                                entered_inames=(
-                                    sched_state.entered_inames
-                                    | frozenset((iname,))),
-                                insn_ids_to_try=insn_ids_to_try,
-                                preschedule=(
-                                    sched_state.preschedule
-                                    if iname not in sched_state.prescheduled_inames
-                                    else sched_state.preschedule[1:]),
-                                ),
-                            debug=debug):
+                    found_schedule_in_subtree = yield sched_state.copy(
+                            schedule=(
+                                sched_state.schedule
+                                + (EnterLoop(iname=iname),)),
+                            active_inames=(
+                                sched_state.active_inames + (iname,)),
+                            entered_inames=(
+                                sched_state.entered_inames
+                                | frozenset((iname,))),
+                            insn_ids_to_try=insn_ids_to_try,
+                            preschedule=(
+                                sched_state.preschedule
+                                if iname not in sched_state.prescheduled_inames
+                                else sched_state.preschedule[1:]),
+                            )
+                    if found_schedule_in_subtree:
                         found_viable_schedule = True
-                        yield sub_sched
 
                 if found_viable_schedule:
                     return
@@ -1431,6 +1483,111 @@ def generate_loop_schedules_internal(
 # }}}
 
 
+# {{{ parallel schedule search
+
+class _ScheduleFrontier:
+    """Records the nodes at depth *max_depth* of the search tree traversed by
+    :func:`generate_loop_schedules_internal` instead of descending into them,
+    along with any schedules completed above that depth. The search is
+    continued as if every recorded node were a dead end, so that
+    :attr:`items` lists all nodes that the sequential search could visit, in
+    the order in which it would visit them.
+    """
+
+    def __init__(self, max_depth):
+        self.max_depth = max_depth
+        self.items = []
+
+    def add_state(self, sched_state):
+        self.items.append(sched_state.copy(
+            insn_ids_to_try=(
+                list(sched_state.insn_ids_to_try)
+                if sched_state.insn_ids_to_try is not None
+                else None)))
+
+    def add_schedule(self, schedule):
+        self.items.append(schedule)
+
+    @property
+    def has_states(self):
+        return any(isinstance(item, SchedulerState) for item in self.items)
+
+
+def _get_schedule_search_frontier(sched_state, debug, min_nitems):
+    max_depth = 1
+    while True:
+        frontier = _ScheduleFrontier(max_depth)
+        for _ in generate_loop_schedules_internal(
+                sched_state, debug=debug, _frontier=frontier):
+            raise AssertionError()
+
+        if len(frontier.items) >= min_nitems or not frontier.has_states:
+            return frontier.items
+
+        max_depth += 1
+
+
+_schedule_search_worker_kernel = None
+
+
+def _init_schedule_search_worker(kernel):
+    global _schedule_search_worker_kernel
+    _schedule_search_worker_kernel = kernel
+
+
+def _find_first_schedule_from_item(item):
+    if not isinstance(item, SchedulerState):
+        # a complete schedule
+        return item
+
+    return next(iter(generate_loop_schedules_internal(
+        item.copy(kernel=_schedule_search_worker_kernel),
+        debug=ScheduleDebugger(interactive=False))), None)
+
+
+def generate_loop_schedules_parallel(sched_state, debug, nprocesses):
+    """Yield the first schedule that :func:`generate_loop_schedules_internal`
+    would yield (and only that one), searching for it in *nprocesses* worker
+    processes.
+
+    The top levels of the search tree are traversed to obtain a list of
+    (at least 4 *nprocesses*, if possible) independent subtrees in the order
+    in which the sequential search would visit them. The subtrees are
+    searched in parallel, and the schedule found in the first subtree that
+    contains one is yielded. This is exactly the schedule the sequential
+    search would have found first, so that the result does not depend on the
+    number of processes.
+    """
+    items = _get_schedule_search_frontier(sched_state, debug,
+            min_nitems=4*nprocesses)
+
+    first_schedule = None
+    if items:
+        import multiprocessing
+        # The kernel is sent to each worker once, instead of with each
+        # search state.
+        with multiprocessing.Pool(
+                min(nprocesses, len(items)),
+                initializer=_init_schedule_search_worker,
+                initargs=(sched_state.kernel,)) as pool:
+            for schedule in pool.imap(
+                    _find_first_schedule_from_item,
+                    [item.copy(kernel=None)
+                        if isinstance(item, SchedulerState) else item
+                        for item in items]):
+                if schedule is not None:
+                    first_schedule = schedule
+                    break
+
+    if first_schedule is None:
+        return
+
+    debug.log_success(first_schedule)
+    yield first_schedule
+
+# }}}
+
+
 # {{{ convert barrier instructions to proper barriers
 
 def convert_barrier_instructions_to_barriers(kernel, schedule):
@@ -1928,33 +2085,163 @@ def insert_barriers(kernel, schedule, synchronization_kind, verify_only, level=0
 
 
 class MinRecursionLimitForScheduling(MinRecursionLimit):
+    """A context manager raising the recursion limit as was required by
+    earlier, recursive versions of the scheduler. It is no longer needed
+    for scheduling and only retained for compatibility.
+    """
+
     def __init__(self, kernel):
         MinRecursionLimit.__init__(self,
                 len(kernel.instructions) * 2 + len(kernel.all_inames()) * 4)
 
 
+# {{{ incremental linearization
+
+def _get_top_level_loop_nests(linearization):
+    """Return a list of lists of schedule items, one for each top-level loop
+    nest (or top-level instruction) in *linearization*, omitting kernel calls
+    and barriers not originating from an instruction, which the scheduler
+    inserts on its own.
+    """
+    result = []
+    current = []
+    depth = 0
+
+    for sched_item in linearization:
+        if isinstance(sched_item, (CallKernel, ReturnFromKernel)):
+            continue
+        if (isinstance(sched_item, Barrier)
+                and sched_item.originating_insn_id is None):
+            continue
+
+        current.append(sched_item)
+
+        if isinstance(sched_item, EnterLoop):
+            depth += 1
+        elif isinstance(sched_item, LeaveLoop):
+            depth -= 1
+
+        if depth == 0:
+            result.append(current)
+            current = []
+
+    assert not current
+    return result
+
+
+def _is_loop_nest_valid(kernel, loop_nest, parallel_inames,
+        loop_nest_around_map):
+    """Check whether the schedule items *loop_nest* of a prior linearization
+    would still be a sensible nesting of loops and instructions for *kernel*.
+    """
+    from loopy.kernel.data import IlpBaseTag, VectorizeTag
+    innermost_only_inames = {
+            iname for iname in kernel.all_inames()
+            if kernel.iname_tags_of_type(iname, (IlpBaseTag, VectorizeTag))}
+
+    all_inames = kernel.all_inames()
+    loop_priority = kernel.loop_priority
+    active_inames = []
+
+    for sched_item in loop_nest:
+        if isinstance(sched_item, EnterLoop):
+            iname = sched_item.iname
+            if iname not in all_inames or iname in parallel_inames:
+                return False
+
+            if any(outer in innermost_only_inames
+                    and iname not in innermost_only_inames
+                    for outer in active_inames):
+                return False
+
+            if not (loop_nest_around_map[iname]
+                    <= set(active_inames) | parallel_inames):
+                return False
+
+            # does a loop priority require *iname* to be outside an active loop?
+            for prio in loop_priority:
+                if iname in prio:
+                    iname_idx = prio.index(iname)
+                    if any(outer in prio[iname_idx+1:]
+                            for outer in active_inames):
+                        return False
+
+            active_inames.append(iname)
+
+        elif isinstance(sched_item, LeaveLoop):
+            active_inames.pop()
+
+        else:
+            for insn_id in sched_item_to_insn_id(sched_item):
+                if insn_id not in kernel.id_to_insn:
+                    return False
+
+                insn = kernel.id_to_insn[insn_id]
+                if (insn.within_inames - parallel_inames
+                        != frozenset(active_inames)):
+                    return False
+
+    return True
+
+
+def get_reusable_preschedule(kernel, prior_linearization):
+    """Return a tuple of schedule items of *prior_linearization* to be used as
+    a preschedule (see :func:`generate_loop_schedules`) when linearizing
+    *kernel*, which must be in the
+    :attr:`~loopy.kernel.KernelState.PREPROCESSED` state.
+
+    The result contains the top-level loop nests of *prior_linearization* (in
+    their original order) that refer only to instructions and sequential
+    loops existing in *kernel*, and that agree with the loop nesting
+    constraints and loop priorities of *kernel*. All other loop nests are
+    left to the scheduler.
+    """
+    from loopy.kernel.data import (IlpBaseTag, ConcurrentTag, VectorizeTag,
+                                   filter_iname_tags_by_type)
+    parallel_inames = {
+            name
+            for name, iname in kernel.inames.items()
+            if filter_iname_tags_by_type(iname.tags, ConcurrentTag)
+            and not filter_iname_tags_by_type(
+                iname.tags, (IlpBaseTag, VectorizeTag))}
+
+    loop_nest_around_map = find_loop_nest_around_map(kernel)
+
+    return tuple(
+            sched_item
+            for loop_nest in _get_top_level_loop_nests(prior_linearization)
+            if _is_loop_nest_valid(kernel, loop_nest, parallel_inames,
+                loop_nest_around_map)
+            for sched_item in loop_nest)
+
+# }}}
+
+
 # {{{ main scheduling entrypoint
 
-def generate_loop_schedules(kernel, callables_table, debug_args=None):
+class _NoScheduleForPrescheduleError(RuntimeError):
+    pass
+
+
+def generate_loop_schedules(kernel, callables_table, debug_args=None,
+        preschedule=None):
     """
-    .. warning::
-
-        This function needs to be called inside (another layer) of a
-        :class:`loopy.schedule.MinRecursionLimitForScheduling` context manager,
-        and the context manager needs to end *after* the last reference to the
-        generators has gone out of scope. Otherwise, the high-recursion-limit
-        generator chain may not be successfully garbage-collected and cause an
-        internal error in the Python runtime.
+    :arg preschedule: if not *None*, a sequence of schedule items for a
+        :attr:`~loopy.kernel.KernelState.PREPROCESSED` kernel that
+        must occur in the generated schedules in the given order. (For
+        linearized kernels, the existing linearization is used as
+        preschedule.) If no schedule respects it, no diagnostics are
+        printed before raising :exc:`RuntimeError`.
     """
     if debug_args is None:
         debug_args = {}
 
-    with MinRecursionLimitForScheduling(kernel):
-        yield from generate_loop_schedules_inner(kernel,
-                callables_table, debug_args=debug_args)
+    yield from generate_loop_schedules_inner(kernel,
+            callables_table, debug_args=debug_args, preschedule=preschedule)
 
 
-def generate_loop_schedules_inner(kernel, callables_table, debug_args=None):
+def generate_loop_schedules_inner(kernel, callables_table, debug_args=None,
+        preschedule=None):
     if debug_args is None:
         debug_args = {}
 
@@ -1967,9 +2254,16 @@ def generate_loop_schedules_inner(kernel, callables_table, debug_args=None):
 
     debug = ScheduleDebugger(**debug_args)
 
-    preschedule = (kernel.linearization
-                   if kernel.state == KernelState.LINEARIZED
-                   else ())
+    explicit_preschedule = preschedule is not None
+    if explicit_preschedule:
+        if kernel.state != KernelState.PREPROCESSED:
+            raise LoopyError("a preschedule may only be passed for "
+                    "kernels that have not been linearized")
+        preschedule = tuple(preschedule)
+    else:
+        preschedule = (kernel.linearization
+                       if kernel.state == KernelState.LINEARIZED
+                       else ())
 
     prescheduled_inames = {
             insn.iname
@@ -2067,9 +2361,15 @@ def generate_loop_schedules_inner(kernel, callables_table, debug_args=None):
 
                 break
 
+    if kernel.options.linearization_processes > 1:
+        gen_scheds = generate_loop_schedules_parallel(sched_state, debug,
+                nprocesses=kernel.options.linearization_processes)
+    else:
+        gen_scheds = generate_loop_schedules_internal(
+                sched_state, debug=debug, **schedule_gen_kwargs)
+
     try:
-        for gen_sched in generate_loop_schedules_internal(
-                sched_state, debug=debug, **schedule_gen_kwargs):
+        for gen_sched in gen_scheds:
             debug.stop()
 
             gen_sched = convert_barrier_instructions_to_barriers(
@@ -2079,15 +2379,17 @@ def generate_loop_schedules_inner(kernel, callables_table, debug_args=None):
                                                              return_dict=True)
 
             if (gsize or lsize):
-                if not kernel.options.disable_global_barriers:
-                    logger.debug("%s: barrier insertion: global" % kernel.name)
+                with record_pass("insert_barriers", kernel.name):
+                    if not kernel.options.disable_global_barriers:
+                        logger.debug("%s: barrier insertion: global"
+                                % kernel.name)
+                        gen_sched = insert_barriers(kernel, gen_sched,
+                                synchronization_kind="global", verify_only=True)
+
+                    logger.debug("%s: barrier insertion: local" % kernel.name)
                     gen_sched = insert_barriers(kernel, gen_sched,
-                            synchronization_kind="global", verify_only=True)
-
-                logger.debug("%s: barrier insertion: local" % kernel.name)
-                gen_sched = insert_barriers(kernel, gen_sched,
-                    synchronization_kind="local", verify_only=False)
-                logger.debug("%s: barrier insertion: done" % kernel.name)
+                        synchronization_kind="local", verify_only=False)
+                    logger.debug("%s: barrier insertion: done" % kernel.name)
 
             new_kernel = kernel.copy(
                     linearization=gen_sched,
@@ -2116,6 +2418,10 @@ def generate_loop_schedules_inner(kernel, callables_table, debug_args=None):
         raise
 
     debug.done_scheduling()
+    if not schedule_count and explicit_preschedule:
+        raise _NoScheduleForPrescheduleError(
+                "no valid schedules found that respect the preschedule")
+
     if not schedule_count:
         print(75*"-")
         print("ERROR: Sorry--loopy did not find a schedule for your kernel.")
@@ -2128,24 +2434,11 @@ def generate_loop_schedules_inner(kernel, callables_table, debug_args=None):
 # }}}
 
 
-schedule_cache = WriteOncePersistentDict(
+schedule_cache = LoopyWriteOncePersistentDict(
         "loopy-schedule-cache-v4-"+DATA_MODEL_VERSION,
         key_builder=LoopyKeyBuilder())
 
 
-def _get_one_scheduled_kernel_inner(kernel, callables_table):
-    # This helper function exists to ensure that the generator chain is fully
-    # out of scope after the function returns. This allows it to be
-    # garbage-collected in the exit handler of the
-    # MinRecursionLimitForScheduling context manager in the surrounding
-    # function, because it possilby cannot be safely collected with a lower
-    # recursion limit without crashing the Python runtime.
-    #
-    # See https://gitlab.tiker.net/inducer/sumpy/issues/31 for context.
-
-    return next(iter(generate_loop_schedules(kernel, callables_table)))
-
-
 def get_one_scheduled_kernel(kernel, callables_table):
     warn_with_kernel(
         kernel, "get_one_scheduled_kernel_deprecated",
@@ -2155,12 +2448,31 @@ def get_one_scheduled_kernel(kernel, callables_table):
     return get_one_linearized_kernel(kernel, callables_table)
 
 
-def get_one_linearized_kernel(kernel, callables_table):
+@instrumented_pass
+def get_one_linearized_kernel(kernel, callables_table, prior_linearization=None):
+    """
+    :arg prior_linearization: if given, a linearization of a previous version
+        of *kernel*, for example before applying
+        :func:`loopy.tag_inames` or :func:`loopy.prioritize_loops`. The loop
+        nests in it that are still valid for *kernel* are retained
+        (see :func:`get_reusable_preschedule`), and only the remaining
+        instructions are scheduled anew. Falls back to a full search if the
+        retained loop nests cannot be completed to a schedule.
+    """
     from loopy import CACHING_ENABLED
 
+    preschedule = None
+    if prior_linearization is not None:
+        preschedule = get_reusable_preschedule(kernel, prior_linearization)
+        if not preschedule:
+            preschedule = None
+
     # must include *callables_table* within the cache key as the preschedule
     # checks depend on it.
-    sched_cache_key = (kernel, callables_table)
+    if preschedule is None:
+        sched_cache_key = (kernel, callables_table)
+    else:
+        sched_cache_key = (kernel, callables_table, preschedule)
     from_cache = False
 
     if CACHING_ENABLED:
@@ -2172,11 +2484,28 @@ def get_one_linearized_kernel(kernel, callables_table):
         except KeyError:
             pass
 
+        note_pass_cache_hit(from_cache)
+
     if not from_cache:
-        with ProcessLogger(logger, "%s: schedule" % kernel.name):
-            with MinRecursionLimitForScheduling(kernel):
-                result = _get_one_scheduled_kernel_inner(kernel,
-                        callables_table)
+        result = None
+
+        if preschedule is not None:
+            with ProcessLogger(logger,
+                    "%s: incremental schedule" % kernel.name):
+                try:
+                    result = next(iter(generate_loop_schedules(
+                        kernel, callables_table,
+                        debug_args={"interactive": False},
+                        preschedule=preschedule)))
+                except _NoScheduleForPrescheduleError:
+                    logger.info("%s: retained loop nests cannot be completed "
+                            "to a schedule, rescheduling from scratch"
+                            % kernel.name)
+
+        if result is None:
+            with ProcessLogger(logger, "%s: schedule" % kernel.name):
+                result = next(iter(generate_loop_schedules(
+                    kernel, callables_table)))
 
     if CACHING_ENABLED and not from_cache:
         schedule_cache.store_if_not_present(sched_cache_key, result)
@@ -2184,7 +2513,24 @@ def get_one_linearized_kernel(kernel, callables_table):
     return result
 
 
-def linearize(t_unit):
+@instrumented_pass
+def linearize(t_unit, prior=None):
+    """Linearize each kernel in *t_unit* that has not been linearized yet.
+
+    :arg prior: if given, a linearized translation unit, typically an
+        earlier version of *t_unit* before transformations such as
+        :func:`loopy.tag_inames` or :func:`loopy.prioritize_loops`. The loop
+        nests of the linearizations of its kernels that are still valid are
+        retained, see :func:`get_one_linearized_kernel`. As transformations
+        may change the outcome of preprocessing (e.g. the realization of
+        reductions or the privatization of temporaries), they need to be
+        applied to the kernels before preprocessing, not to those of
+        *prior*, e.g.::
+
+            lin = lp.linearize(lp.preprocess_kernel(knl))
+            knl = lp.tag_inames(knl, "k:unr")
+            lin = lp.linearize(lp.preprocess_kernel(knl), prior=lin)
+    """
     from loopy.kernel.function_interface import (CallableKernel,
                                                  ScalarCallable)
     from loopy.check import pre_schedule_checks
@@ -2198,8 +2544,15 @@ def linearize(t_unit):
             from loopy.schedule import get_one_linearized_kernel
             knl = clbl.subkernel
             if knl.linearization is None:
+                prior_linearization = None
+                if prior is not None:
+                    prior_clbl = prior.callables_table.get(name)
+                    if isinstance(prior_clbl, CallableKernel):
+                        prior_linearization = prior_clbl.subkernel.linearization
+
                 knl = get_one_linearized_kernel(knl,
-                                                t_unit.callables_table)
+                        t_unit.callables_table,
+                        prior_linearization=prior_linearization)
             new_callables[name] = clbl.copy(subkernel=knl)
         elif isinstance(clbl, ScalarCallable):
             new_callables[name] = clbl
@@ -96,7 +96,131 @@ def _get_param_tuple(obj):
             for i in range(obj.dim(dim_type.param)))
 
 
+def _set_to_constraint_exprs(set):
+    """Return a list (a disjunction over the basic sets of *set*) of lists (a
+    conjunction over their constraints) of tuples ``(expr, is_equality)``,
+    representing the constraints ``expr == 0`` or ``expr >= 0``.
+    """
+    from loopy.symbolic import aff_to_expr
+    return [
+            [(aff_to_expr(cns.get_aff()), cns.is_equality())
+                for cns in bset.get_constraints()]
+            for bset in set.get_basic_sets()]
+
+
+def _qpolynomial_to_numerator_and_denominator(qpoly):
+    """Return a tuple ``(numerator, denominator)`` of an expression with
+    integer coefficients and an :class:`int`, whose quotient is *qpoly*.
+    """
+    from math import gcd
+    from pymbolic.primitives import Variable
+    from loopy.symbolic import aff_to_expr
+
+    terms = qpoly.get_terms()
+
+    denominator = 1
+    for term in terms:
+        term_denominator = term.get_coefficient_val().get_den_val().to_python()
+        denominator = (denominator * term_denominator
+                // gcd(denominator, term_denominator))
+
+    space = qpoly.space
+    numerator = 0
+    for term in terms:
+        term_expr = (term.get_coefficient_val() * denominator).to_python()
+        for dt in isl._CHECK_DIM_TYPES:
+            for i in range(term.dim(dt)):
+                exp = term.get_exp(dt, i)
+                if exp:
+                    term_expr = (term_expr
+                            * Variable(space.get_dim_name(dt, i))**exp)
+
+        for i in range(term.dim(dim_type.div)):
+            exp = term.get_exp(dim_type.div, i)
+            if exp:
+                term_expr = term_expr * aff_to_expr(term.get_div(i))**exp
+
+        numerator = numerator + term_expr
+
+    return numerator, denominator
+
+
+def _make_batch_evaluator(pwqpolynomial, valid_domain):
+    """Return a function that evaluates *pwqpolynomial* for the parameter
+    values given by a mapping from parameter names to (broadcastable) integer
+    arrays, as an array of :class:`numpy.int64`. The pieces of
+    *pwqpolynomial* are converted to expressions once, which are then
+    evaluated using :mod:`numpy` operations.
+
+    Returns *None* if the conversion is not possible (e.g. because a domain
+    involves existentially quantified variables that are not expressible
+    as integer divisions).
+    """
+    try:
+        valid_constraints = _set_to_constraint_exprs(valid_domain)
+        pieces = [
+                (_set_to_constraint_exprs(piece_set),)
+                + _qpolynomial_to_numerator_and_denominator(qpoly)
+                for piece_set, qpoly in pwqpolynomial.get_pieces()]
+    except isl.Error:
+        return None
+
+    param_names = _get_param_tuple(pwqpolynomial.space)
+
+    def evaluate(value_dict):
+        import numpy as np
+        from pymbolic.mapper.evaluator import EvaluationMapper
+
+        context = {name: np.asarray(value_dict[name], dtype=np.int64)
+                for name in param_names}
+        shape = (np.broadcast(*context.values()).shape
+                if context else ())
+        evaluate_expr = EvaluationMapper(context)
+
+        def evaluate_constraints(constraints):
+            result = np.zeros(shape, dtype=bool)
+            for conjunction in constraints:
+                conj_result = np.ones(shape, dtype=bool)
+                for expr, is_equality in conjunction:
+                    value = evaluate_expr(expr)
+                    conj_result &= (value == 0) if is_equality else (value >= 0)
+                result |= conj_result
+            return result
+
+        if not evaluate_constraints(valid_constraints).all():
+            raise ValueError("evaluation point outside of domain of "
+                    "definition of piecewise quasipolynomial")
+
+        result = np.zeros(shape, dtype=np.int64)
+        for constraints, numerator, denominator in pieces:
+            in_piece = evaluate_constraints(constraints)
+            numerator = np.broadcast_to(evaluate_expr(numerator), shape)
+            if (numerator[in_piece] % denominator).any():
+                raise ValueError("piecewise quasipolynomial evaluates to a "
+                        "non-integer value")
+
+            result = np.where(in_piece, numerator // denominator, result)
+
+        return result
+
+    return evaluate
+
+
+def _eval_with_arrays(poly, value_dict):
+    if isinstance(poly, GuardedPwQPolynomial):
+        return poly.eval_with_arrays(value_dict)
+    else:
+        return GuardedPwQPolynomial(poly,
+                isl.Set.universe(poly.domain().space)).eval_with_arrays(
+                        value_dict)
+
+
 class GuardedPwQPolynomial:
+    """
+    .. automethod:: eval_with_dict
+    .. automethod:: eval_with_arrays
+    """
+
     def __init__(self, pwqpolynomial, valid_domain):
         assert isinstance(pwqpolynomial, isl.PwQPolynomial)
         self.pwqpolynomial = pwqpolynomial
@@ -148,6 +272,42 @@ class GuardedPwQPolynomial:
 
         return self.pwqpolynomial.eval(pt).to_python()
 
+    @memoize_method
+    def _get_batch_evaluator(self):
+        return _make_batch_evaluator(self.pwqpolynomial, self.valid_domain)
+
+    def eval_with_arrays(self, value_dict):
+        """Evaluate for many sets of parameter values at once.
+
+        :arg value_dict: a mapping from parameter names to integers or
+            integer arrays, broadcastable against each other.
+        :return: a :class:`numpy.ndarray` of :class:`numpy.int64` of the
+            broadcast shape of the values in *value_dict*.
+
+        On first use, the piecewise quasi-polynomial is converted into a
+        function evaluating it via :mod:`numpy`, which is much faster than
+        repeated calls to :meth:`eval_with_dict` for large numbers of
+        parameter values.
+        """
+        evaluator = self._get_batch_evaluator()
+
+        if evaluator is None:
+            # fall back to evaluating each point separately
+            import numpy as np
+            names = _get_param_tuple(self.space)
+            arrays = np.broadcast_arrays(
+                    *[np.asarray(value_dict[name], dtype=np.int64)
+                        for name in names])
+            shape = arrays[0].shape if arrays else ()
+            result = np.empty(shape, dtype=np.int64)
+            for idx in np.ndindex(shape):
+                result[idx] = self.eval_with_dict({
+                    name: int(values[idx])
+                    for name, values in zip(names, arrays)})
+            return result
+
+        return evaluator(value_dict)
+
     @staticmethod
     def zero():
         p = isl.PwQPolynomial("{ 0 }")
@@ -465,6 +625,8 @@ class ToCountPolynomialMap(ToCountMap):
     :class:`~loopy.statistics.GuardedPwQPolynomial`.
 
     .. automethod:: eval_and_sum
+    .. automethod:: eval_with_arrays
+    .. automethod:: eval_and_sum_with_arrays
     """
 
     def __init__(self, space, count_map=None):
@@ -527,6 +689,33 @@ class ToCountPolynomialMap(ToCountMap):
 
         return self.sum().eval_with_dict(params)
 
+    def eval_with_arrays(self, params):
+        """Evaluate each count for many sets of parameter values at once, see
+        :meth:`~loopy.statistics.GuardedPwQPolynomial.eval_with_arrays`.
+
+        :return: A :class:`ToCountMap` mapping the keys of *self* to
+            :class:`numpy.ndarray` instances.
+
+        Example usage::
+
+            params = {"n": np.arange(1, 10**5), "m": 256}
+            op_map = lp.get_op_map(knl, subgroup_size=32)
+            f32_mul = op_map.filter_by(dtype=[np.float32], name=["mul"])
+            f32_mul_counts = f32_mul.eval_with_arrays(params)
+        """
+        return ToCountMap({
+                key: _eval_with_arrays(value, params)
+                for key, value in self.count_map.items()})
+
+    def eval_and_sum_with_arrays(self, params):
+        """Add all counts and evaluate them for many sets of parameter values
+        at once, see
+        :meth:`~loopy.statistics.GuardedPwQPolynomial.eval_with_arrays`.
+
+        :return: A :class:`numpy.ndarray` of the sums.
+        """
+        return _eval_with_arrays(self.sum(), params)
+
 # }}}
 
 
@@ -1580,6 +1769,7 @@ def get_unused_hw_axes_factor(knl, callables_table, insn, disregard_local_axes):
     return add_assumptions_guard(knl, result)
 
 
+@memoize_method
 def count_inames_domain(knl, inames):
     space = get_kernel_parameter_space(knl)
     if not inames:
@@ -1612,6 +1802,40 @@ def count_insn_runs(knl, callables_table, insn, count_redundant_work,
         return c
 
 
+def _get_workgroup_size_upper_bound(knl, callables_table):
+    from loopy.symbolic import aff_to_expr
+    _, local_size = knl.get_grid_size_upper_bounds(callables_table)
+    workgroup_size = 1
+    if local_size:
+        for size in local_size:
+            if size.n_piece() != 1:
+                raise LoopyError("Workgroup size found to be genuinely "
+                    "piecewise defined, which is not allowed in stats gathering")
+
+            (valid_set, aff), = size.get_pieces()
+
+            assert ((valid_set.n_basic_set() == 1)
+                    and (valid_set.get_basic_sets()[0].is_universe()))
+
+            s = aff_to_expr(aff)
+            if not isinstance(s, int):
+                raise LoopyError("Cannot count insn with %s granularity, "
+                                 "work-group size is not integer: %s"
+                                 % (CountGranularity.SUBGROUP, local_size))
+            workgroup_size *= s
+
+    return workgroup_size
+
+
+def _warn_subgroup_count_upper_bound(knl, insn_id, workgroup_size):
+    warn_with_kernel(knl, "insn_count_subgroups_upper_bound",
+            "get_insn_count: when counting instruction %s with "
+            "count_granularity=%s, using upper bound for work-group size "
+            "(%d work-items) to compute sub-groups per work-group. When "
+            "multiple device programs present, actual sub-group count may be "
+            "lower." % (insn_id, CountGranularity.SUBGROUP, workgroup_size))
+
+
 def _get_insn_count(knl, callables_table, insn_id, subgroup_size,
         count_redundant_work, count_granularity=CountGranularity.WORKITEM):
     insn = knl.id_to_insn[insn_id]
@@ -1636,37 +1860,8 @@ def _get_insn_count(knl, callables_table, insn_id, subgroup_size,
     if count_granularity == CountGranularity.WORKGROUP:
         return ct_disregard_local
     elif count_granularity == CountGranularity.SUBGROUP:
-        # {{{ compute workgroup_size
-
-        from loopy.symbolic import aff_to_expr
-        _, local_size = knl.get_grid_size_upper_bounds(callables_table)
-        workgroup_size = 1
-        if local_size:
-            for size in local_size:
-                if size.n_piece() != 1:
-                    raise LoopyError("Workgroup size found to be genuinely "
-                        "piecewise defined, which is not allowed in stats gathering")
-
-                (valid_set, aff), = size.get_pieces()
-
-                assert ((valid_set.n_basic_set() == 1)
-                        and (valid_set.get_basic_sets()[0].is_universe()))
-
-                s = aff_to_expr(aff)
-                if not isinstance(s, int):
-                    raise LoopyError("Cannot count insn with %s granularity, "
-                                     "work-group size is not integer: %s"
-                                     % (CountGranularity.SUBGROUP, local_size))
-                workgroup_size *= s
-
-        # }}}
-
-        warn_with_kernel(knl, "insn_count_subgroups_upper_bound",
-                "get_insn_count: when counting instruction %s with "
-                "count_granularity=%s, using upper bound for work-group size "
-                "(%d work-items) to compute sub-groups per work-group. When "
-                "multiple device programs present, actual sub-group count may be "
-                "lower." % (insn_id, CountGranularity.SUBGROUP, workgroup_size))
+        workgroup_size = _get_workgroup_size_upper_bound(knl, callables_table)
+        _warn_subgroup_count_upper_bound(knl, insn_id, workgroup_size)
 
         from pytools import div_ceil
         return ct_disregard_local*div_ceil(workgroup_size, subgroup_size)
@@ -1677,6 +1872,43 @@ def _get_insn_count(knl, callables_table, insn_id, subgroup_size,
                 "not allowed. count_granularity options: %s"
                 % (count_granularity, CountGranularity.ALL+[None]))
 
+
+class _InsnCountCache:
+    """Memoizes :func:`_get_insn_count` for instructions of *knl*. Since the
+    count of an instruction depends only on its
+    :attr:`~loopy.InstructionBase.within_inames`, it is computed once for
+    each combination of those and the count granularity. As without
+    memoization, a warning about the use of an upper bound for the
+    work-group size is issued for each instruction counted with
+    :attr:`CountGranularity.SUBGROUP` granularity.
+    """
+
+    def __init__(self, knl, callables_table, subgroup_size,
+            count_redundant_work):
+        self.knl = knl
+        self.callables_table = callables_table
+        self.subgroup_size = subgroup_size
+        self.count_redundant_work = count_redundant_work
+        self.cache = {}
+
+    def __call__(self, insn, count_granularity):
+        cache_key = (insn.within_inames, count_granularity)
+        try:
+            result = self.cache[cache_key]
+        except KeyError:
+            result = _get_insn_count(self.knl, self.callables_table, insn.id,
+                    self.subgroup_size, self.count_redundant_work,
+                    count_granularity)
+            self.cache[cache_key] = result
+            return result
+
+        if count_granularity == CountGranularity.SUBGROUP:
+            _warn_subgroup_count_upper_bound(self.knl, insn.id,
+                    _get_workgroup_size_upper_bound(
+                        self.knl, self.callables_table))
+
+        return result
+
 # }}}
 
 
@@ -1696,7 +1928,9 @@ def _get_op_map_for_single_kernel(knl, callables_table,
 
     op_counter = ExpressionOpCounter(knl, callables_table, kernel_rec,
             count_within_subscripts)
-    op_map = op_counter.new_zero_poly_map()
+    get_insn_count = _InsnCountCache(knl, callables_table, subgroup_size,
+            count_redundant_work)
+    op_count_map = {}
 
     from loopy.kernel.instruction import (
             CallInstruction, CInstruction, Assignment,
@@ -1706,10 +1940,8 @@ def _get_op_map_for_single_kernel(knl, callables_table,
         if isinstance(insn, (CallInstruction, CInstruction, Assignment)):
             ops = op_counter(insn.assignees) + op_counter(insn.expression)
             for key, val in ops.count_map.items():
-                count = _get_insn_count(knl, callables_table, insn.id,
-                            subgroup_size, count_redundant_work,
-                            key.count_granularity)
-                op_map = op_map + ToCountMap({key: val}) * count
+                count = get_insn_count(insn, key.count_granularity)
+                op_count_map[key] = op_count_map.get(key, 0) + count*val
 
         elif isinstance(insn, (NoOpInstruction, BarrierInstruction)):
             pass
@@ -1717,7 +1949,7 @@ def _get_op_map_for_single_kernel(knl, callables_table,
             raise NotImplementedError("unexpected instruction item type: '%s'"
                     % type(insn).__name__)
 
-    return op_map
+    return op_counter.new_poly_map(op_count_map)
 
 
 def get_op_map(program, numpy_types=True, count_redundant_work=False,
@@ -1879,7 +2111,9 @@ def _get_mem_access_map_for_single_kernel(knl, callables_table,
             knl, callables_table, kernel_rec)
     access_counter_l = LocalMemAccessCounter(
             knl, callables_table, kernel_rec)
-    access_map = access_counter_g.new_zero_poly_map()
+    get_insn_count = _InsnCountCache(knl, callables_table, subgroup_size,
+            count_redundant_work)
+    access_count_map = {}
 
     from loopy.kernel.instruction import (
             CallInstruction, CInstruction, Assignment,
@@ -1898,10 +2132,9 @@ def _get_mem_access_map_for_single_kernel(knl, callables_table,
                         ).with_set_attributes(direction="store")
 
             for key, val in insn_access_map.count_map.items():
-                count = _get_insn_count(knl, callables_table, insn.id,
-                            subgroup_size, count_redundant_work,
-                            key.count_granularity)
-                access_map = access_map + ToCountMap({key: val}) * count
+                count = get_insn_count(insn, key.count_granularity)
+                access_count_map[key] = (
+                        access_count_map.get(key, 0) + count*val)
 
         elif isinstance(insn, (NoOpInstruction, BarrierInstruction)):
             pass
@@ -1910,7 +2143,7 @@ def _get_mem_access_map_for_single_kernel(knl, callables_table,
             raise NotImplementedError("unexpected instruction item type: '%s'"
                     % type(insn).__name__)
 
-    return access_map
+    return access_counter_g.new_poly_map(access_count_map)
 
 
 def get_mem_access_map(program, numpy_types=None, count_redundant_work=False,
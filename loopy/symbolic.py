@@ -27,7 +27,7 @@ THE SOFTWARE.
 from functools import reduce
 from sys import intern
 
-from pytools import memoize, memoize_method, memoize_on_first_arg, ImmutableRecord
+from pytools import memoize_method, memoize_on_first_arg, ImmutableRecord
 import pytools.lex
 from pytools.tag import Taggable
 
@@ -59,6 +59,7 @@ from pymbolic.parser import Parser as ParserBase
 from loopy.diagnostic import LoopyError
 from loopy.diagnostic import (ExpressionToAffineConversionError,
                               UnableToDetermineAccessRangeError)
+from loopy.memo import memoize_lru
 
 
 import islpy as isl
@@ -1007,7 +1008,7 @@ class DependencyMapperWithReductionInames(DependencyMapper):
         return super().map_reduction(expr, *args, **kwargs)
 
 
-@memoize
+@memoize_lru()
 def _get_dependencies_and_reduction_inames(expr):
     dep_mapper = DependencyMapperWithReductionInames(composite_leaves=False)
     deps = frozenset(dep.name for dep in dep_mapper(expr))
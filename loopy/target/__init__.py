@@ -38,6 +38,7 @@ __doc__ = """
 .. autoclass:: ISPCTarget
 .. autoclass:: NumbaTarget
 .. autoclass:: NumbaCudaTarget
+.. autoclass:: NumpyTarget
 
 References to Canonical Names
 -----------------------------
@@ -241,6 +242,14 @@ class ASTBuilderBase:
     def can_implement_conditionals(self):
         return False
 
+    @property
+    def can_implement_simd_loops(self):
+        """If *True*, loops over vectorized inames are emitted via
+        :meth:`emit_sequential_loop` (which is expected to annotate them for
+        SIMD execution) instead of being mapped onto vector types or unrolled.
+        """
+        return False
+
     def emit_if(self, condition_str, ast):
         raise NotImplementedError()
 
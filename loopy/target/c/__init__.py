@@ -1197,6 +1197,55 @@ class CFamilyASTBuilder(ASTBuilderBase):
         return node
 
 
+# {{{ simd loop helpers
+
+def _has_nested_loops(kernel, iname):
+    """Return *True* if the loop over *iname* in *kernel*'s linearization
+    contains other loops that are not unrolled.
+    """
+    from loopy.schedule import EnterLoop, LeaveLoop
+    from loopy.kernel.data import UnrollTag, UnrolledIlpTag
+
+    in_loop = False
+    for sched_item in kernel.linearization:
+        if isinstance(sched_item, EnterLoop):
+            if sched_item.iname == iname:
+                in_loop = True
+            elif in_loop and not kernel.iname_tags_of_type(
+                    sched_item.iname, (UnrollTag, UnrolledIlpTag)):
+                return True
+        elif isinstance(sched_item, LeaveLoop) and sched_item.iname == iname:
+            in_loop = False
+
+    return False
+
+
+def _get_arrays_accessed_within(kernel, iname):
+    """Return the names of the arrays accessed by the instructions within
+    *iname* that are referred to by a single pointer in the generated code.
+    """
+    from loopy.kernel.array import ArrayBase, SeparateArrayArrayDimTag
+
+    result = set()
+    for insn in kernel.instructions:
+        if iname not in insn.within_inames:
+            continue
+
+        for name in insn.dependency_names():
+            var_descr = kernel.arg_dict.get(name,
+                    kernel.temporary_variables.get(name))
+
+            if (isinstance(var_descr, ArrayBase)
+                    and var_descr.shape
+                    and not any(isinstance(dim_tag, SeparateArrayArrayDimTag)
+                        for dim_tag in var_descr.dim_tags or ())):
+                result.add(name)
+
+    return result
+
+# }}}
+
+
 # {{{ header generation
 
 class CFunctionDeclExtractor(CASTIdentityMapper):
@@ -1245,8 +1294,31 @@ class CTarget(CFamilyTarget):
     """This target may emit code using all features of C99.
     For a target base supporting "least-common-denominator" C,
     see :class:`CFamilyTarget`.
+
+    .. automethod:: __init__
     """
 
+    hash_fields = CFamilyTarget.hash_fields + ("openmp", "openmp_simd")
+    comparison_fields = CFamilyTarget.comparison_fields + (
+            "openmp", "openmp_simd")
+
+    def __init__(self, fortran_abi=False, openmp=False, openmp_simd=False):
+        """
+        :arg openmp: If *True*, inames tagged as group axes (``g.*``) are
+            mapped to the iterations of ``#pragma omp parallel for`` loops
+            that surround the body of each device program. Local axes
+            (``l.*``) remain unsupported.
+        :arg openmp_simd: If *True*, innermost loops over ``vec``- and
+            ``ilp.seq``-tagged inames are emitted as loops annotated with
+            ``#pragma omp simd``, rather than being unrolled. Arrays
+            accessed in such a loop that have a known
+            :attr:`~loopy.ArrayArg.alignment` are listed in an ``aligned``
+            clause.
+        """
+        self.openmp = openmp
+        self.openmp_simd = openmp_simd
+        super().__init__(fortran_abi=fortran_abi)
+
     def get_device_ast_builder(self):
         return CASTBuilder(self)
 
@@ -1268,6 +1340,104 @@ class CASTBuilder(CFamilyASTBuilder):
                     c99_preamble_generator,
                     ])
 
+    # {{{ openmp
+
+    def get_function_definition(self, codegen_state, codegen_result,
+            schedule_index, function_decl, function_body):
+        if self.target.openmp and codegen_state.is_generating_device_code:
+            function_body = self.wrap_in_openmp_group_loops(
+                    codegen_state, schedule_index, function_body)
+
+        return super().get_function_definition(
+                codegen_state, codegen_result, schedule_index,
+                function_decl, function_body)
+
+    def wrap_in_openmp_group_loops(self, codegen_state, schedule_index, ast):
+        """Wrap *ast* (the body of the device program starting at
+        *schedule_index*) in one loop per group axis, with the iterations
+        distributed across OpenMP threads.
+        """
+        kernel = codegen_state.kernel
+
+        from loopy.schedule import get_insn_ids_for_block_at
+        gsize, lsize = kernel.get_grid_sizes_for_insn_ids_as_exprs(
+                get_insn_ids_for_block_at(kernel.linearization, schedule_index),
+                codegen_state.callables_table)
+
+        if lsize:
+            raise LoopyError("OpenMP C target does not support local axes "
+                    "(found in '%s')" % kernel.name)
+
+        if not gsize:
+            return ast
+
+        from cgen import Block, For, InlineInitializer, Pragma
+        ecm = self.get_expression_to_code_mapper(codegen_state)
+
+        for axis in reversed(range(len(gsize))):
+            gid = "_lpy_gid_%d" % axis
+            ast = For(
+                    InlineInitializer(POD(self, kernel.index_dtype, gid), 0),
+                    "{} < {}".format(gid, ecm(gsize[axis], PREC_NONE, "i")),
+                    "++%s" % gid,
+                    ast)
+
+        collapse = "" if len(gsize) == 1 else " collapse(%d)" % len(gsize)
+        return Block([Pragma("omp parallel for" + collapse), ast])
+
+    @property
+    def can_implement_simd_loops(self):
+        return self.target.openmp_simd
+
+    def emit_sequential_loop(self, codegen_state, iname, iname_dtype,
+            lbound, ubound, inner):
+        loop = super().emit_sequential_loop(
+                codegen_state, iname, iname_dtype, lbound, ubound, inner)
+
+        kernel = codegen_state.kernel
+
+        from loopy.kernel.data import VectorizeTag, LoopedIlpTag
+        if not (self.target.openmp_simd
+                and kernel.iname_tags_of_type(
+                    iname, (VectorizeTag, LoopedIlpTag))
+                and not _has_nested_loops(kernel, iname)):
+            return loop
+
+        clauses = []
+
+        vec_tag = kernel.iname_tags_of_type(iname, VectorizeTag)
+        if vec_tag:
+            from loopy.isl_helpers import static_max_of_pw_aff
+            length_aff = static_max_of_pw_aff(
+                    kernel.get_iname_bounds(iname, constants_only=True).size,
+                    constants_only=True)
+            if length_aff.is_cst():
+                clauses.append("safelen(%d)"
+                        % length_aff.get_constant_val().to_python())
+
+        names_by_alignment = {}
+        for ary_name in sorted(_get_arrays_accessed_within(kernel, iname)):
+            ary = kernel.get_var_descriptor(ary_name)
+            if ary.alignment is not None:
+                names_by_alignment.setdefault(ary.alignment, []).append(ary_name)
+
+        for alignment, names in sorted(names_by_alignment.items()):
+            clauses.append("aligned({}: {})".format(", ".join(names), alignment))
+
+        from cgen import Block, Pragma
+        return Block([Pragma(" ".join(["omp simd"] + clauses)), loop])
+
+    def get_expression_to_c_expression_mapper(self, codegen_state):
+        if self.target.openmp:
+            from loopy.target.c.codegen.expression import (
+                    OpenMPExpressionToCExpressionMapper)
+            return OpenMPExpressionToCExpressionMapper(
+                    codegen_state, fortran_abi=self.target.fortran_abi)
+
+        return super().get_expression_to_c_expression_mapper(codegen_state)
+
+    # }}}
+
 # }}}
 
 
@@ -1276,11 +1446,27 @@ class CASTBuilder(CFamilyASTBuilder):
 class ExecutableCTarget(CTarget):
     """
     An executable CFamilyTarget that uses (by default) JIT compilation of C-code
+
+    .. automethod:: __init__
     """
-    def __init__(self, compiler=None, fortran_abi=False):
-        super().__init__(fortran_abi=fortran_abi)
+    def __init__(self, compiler=None, fortran_abi=False, openmp=False,
+            openmp_simd=False):
+        """
+        :arg compiler: An instance of
+            :class:`loopy.target.c.c_execution.CCompiler`. If not given, one
+            is created, passing along *openmp* and *openmp_simd*. A compiler
+            passed in explicitly along with these options must itself have
+            been created with them.
+        :arg openmp: See :meth:`CTarget.__init__`. The number of threads used
+            may be controlled per call by passing *num_threads* when
+            invoking the kernel.
+        :arg openmp_simd: See :meth:`CTarget.__init__`.
+        """
+        super().__init__(fortran_abi=fortran_abi, openmp=openmp,
+                openmp_simd=openmp_simd)
         from loopy.target.c.c_execution import CCompiler
-        self.compiler = compiler or CCompiler()
+        self.compiler = compiler or CCompiler(
+                openmp=openmp, openmp_simd=openmp_simd)
 
     def get_kernel_executor_cache_key(self, *args, **kwargs):
         # This is for things like the context in OpenCL. There is no such
@@ -209,13 +209,21 @@ class CCompiler:
     3.  The resulting shared library is turned into a :class:`ctypes.CDLL`
         to enable calling by the invoker generated by, e.g.,
         :class:`CExecutionWrapperGenerator`
+
+    If *openmp* is *True*, the flags needed to compile and link code
+    containing OpenMP pragmas (``-fopenmp``) are added to the toolchain.
+    If only *openmp_simd* is *True*, just the flag enabling ``omp simd``
+    pragmas (``-fopenmp-simd``) is added, which requires no OpenMP runtime.
     """
 
+    openmp_flags = ["-fopenmp"]
+    openmp_simd_flags = ["-fopenmp-simd"]
+
     def __init__(self, toolchain=None,
                  cc="gcc", cflags=None,
                  ldflags=None, libraries=None,
                  include_dirs=None, library_dirs=None, defines=None,
-                 source_suffix="c"):
+                 source_suffix="c", openmp=False, openmp_simd=False):
         if cflags is None:
             cflags = "-std=c99 -O3 -fPIC".split()
         if ldflags is None:
@@ -270,6 +278,23 @@ class CCompiler:
                     if v and (not hasattr(self.toolchain, k) or
                               getattr(self.toolchain, k) != v)}
             self.toolchain = self.toolchain.copy(**diff)
+
+        self.openmp = openmp
+        self.openmp_simd = openmp_simd
+        if openmp:
+            self.toolchain = self.toolchain.copy(
+                    cflags=self.toolchain.cflags + [
+                        flag for flag in self.openmp_flags
+                        if flag not in self.toolchain.cflags],
+                    ldflags=self.toolchain.ldflags + [
+                        flag for flag in self.openmp_flags
+                        if flag not in self.toolchain.ldflags])
+        elif openmp_simd:
+            self.toolchain = self.toolchain.copy(
+                    cflags=self.toolchain.cflags + [
+                        flag for flag in self.openmp_simd_flags
+                        if flag not in self.toolchain.cflags])
+
         self.tempdir = tempfile.mkdtemp(prefix="tmp_loopy")
         self.source_suffix = source_suffix
 
@@ -277,16 +302,28 @@ class CCompiler:
         """Build temporary filename path in tempdir."""
         return os.path.join(self.tempdir, name)
 
-    def build(self, name, code, debug=False, wait_on_error=None,
+    def compile(self, name, code, debug=False, wait_on_error=None,
                      debug_recompile=True):
-        """Compile code, build and load shared library."""
+        """Compile code and build a shared library.
+
+        :returns: the file name of the shared library.
+
+        Compilations of differing *code* do not contend for a lock and may
+        hence safely proceed concurrently from multiple threads.
+        """
         logger.debug(code)
-        c_fname = self._tempname("code." + self.source_suffix)
+
+        # codepy locks its entire cache directory while compiling, so give
+        # each distinct piece of code a cache directory of its own.
+        from hashlib import sha256
+        cache_dir = self._tempname(sha256(code.encode()).hexdigest())
+        os.makedirs(cache_dir, exist_ok=True)
 
         # build object
         _, mod_name, ext_file, recompiled = \
-            compile_from_string(self.toolchain, name, code, c_fname,
-                                self.tempdir, debug, wait_on_error,
+            compile_from_string(self.toolchain, name, code,
+                                "code." + self.source_suffix,
+                                cache_dir, debug, wait_on_error,
                                 debug_recompile, False)
 
         if recompiled:
@@ -294,8 +331,14 @@ class CCompiler:
         else:
             logger.debug(f"Kernel {name} retrieved from cache")
 
+        return ext_file
+
+    def build(self, name, code, debug=False, wait_on_error=None,
+                     debug_recompile=True):
+        """Compile code, build and load shared library."""
         # and return compiled
-        return ctypes.CDLL(ext_file)
+        return ctypes.CDLL(self.compile(name, code, debug, wait_on_error,
+            debug_recompile))
 
 
 class CPlusPlusCompiler(CCompiler):
@@ -305,12 +348,13 @@ class CPlusPlusCompiler(CCompiler):
                  cc="g++", cflags=None,
                  ldflags=None, libraries=None,
                  include_dirs=None, library_dirs=None, defines=None,
-                 source_suffix="cpp"):
+                 source_suffix="cpp", openmp=False, openmp_simd=False):
 
         super().__init__(
             toolchain=toolchain, cc=cc, cflags=cflags, ldflags=ldflags,
             libraries=libraries, include_dirs=include_dirs,
-            library_dirs=library_dirs, defines=defines, source_suffix=source_suffix)
+            library_dirs=library_dirs, defines=defines, source_suffix=source_suffix,
+            openmp=openmp, openmp_simd=openmp_simd)
 
 
 # {{{ placeholder till ctypes fixes: bugs.python.org/issue16899
@@ -379,7 +423,12 @@ class CompiledCKernel:
     to automatically map argument types.
     """
 
-    def __init__(self, knl, idi, dev_code, target, comp=None):
+    def __init__(self, knl, idi, dev_code, target, comp=None, dll=None):
+        """
+        :arg dll: If given, a :class:`ctypes.CDLL` built from *dev_code*, e.g.
+            shared with the other device programs of the same translation
+            unit. Otherwise, *dev_code* is built using *comp*.
+        """
         from loopy.target.c import ExecutableCTarget
         assert isinstance(target, ExecutableCTarget)
         self.target = target
@@ -387,7 +436,9 @@ class CompiledCKernel:
         # get code and build
         self.code = dev_code
         self.comp = comp if comp is not None else CCompiler()
-        self.dll = self.comp.build(self.name, self.code)
+        if dll is None:
+            dll = self.comp.build(self.name, self.code)
+        self.dll = dll
 
         # get the function declaration for interface with ctypes
         func_decl = IDIToCDLL(self.target)
@@ -395,22 +446,68 @@ class CompiledCKernel:
         self._fn = getattr(self.dll, self.name)
         # kernels are void by defn.
         self._fn.restype = None
-        self._fn.argtypes = [ctype for ctype in arg_info]
+
+        # Pointers are passed as plain addresses, which spares creating a
+        # ctypes pointer object per argument and call. Scalars of simple types
+        # are converted by ctypes itself, based on argtypes.
+        self._fn.argtypes = [
+                ctypes.c_void_p if issubclass(arg_t, ctypes._Pointer) else arg_t
+                for arg_t in arg_info]
+        self._arg_converters = tuple(
+                _get_arg_converter(arg_t) for arg_t in arg_info)
 
     def __call__(self, *args):
         """Execute kernel with given args mapped to ctypes equivalents."""
-        args_ = []
-        for arg, arg_t in zip(args, self._fn.argtypes):
-            if hasattr(arg, "ctypes"):
-                if arg.size == 0:
-                    # TODO eliminate unused arguments from kernel
-                    arg_ = arg_t(0.0)
-                else:
-                    arg_ = arg.ctypes.data_as(arg_t)
-            else:
-                arg_ = arg_t(arg)
-            args_.append(arg_)
-        self._fn(*args_)
+        self._fn(*[
+            arg if convert is None else convert(arg)
+            for arg, convert in zip(args, self._arg_converters)])
+
+
+class _ArrayDataPointer:
+    """Maps an array to the address of its data, remembering the address for
+    the array seen last. Only a weak reference to that array is kept, so that
+    its lifetime is not extended. The cached address stays valid as long as
+    the array is alive and has not been resized in place (which would change
+    its size).
+    """
+
+    def __init__(self):
+        # (weak reference to the array, its size, its address), replaced as
+        # a whole so that concurrent calls never see a mix of entries
+        self.last_seen = None
+
+    def __call__(self, ary):
+        last_seen = self.last_seen
+        if last_seen is not None:
+            ary_ref, nbytes, address = last_seen
+            if ary_ref() is ary and ary.nbytes == nbytes:
+                return address
+
+        address = ary.__array_interface__["data"][0]
+
+        from weakref import ref
+        try:
+            self.last_seen = (ref(ary), ary.nbytes, address)
+        except TypeError:
+            # not weak-referenceable
+            self.last_seen = None
+
+        return address
+
+
+def _get_arg_converter(arg_t):
+    """
+    :returns: a callable turning a kernel argument into a value that may be
+        passed in place of an argument of ctypes type *arg_t*, or *None* if no
+        conversion is necessary.
+    """
+    if issubclass(arg_t, ctypes._Pointer):
+        return _ArrayDataPointer()
+    elif issubclass(arg_t, ctypes.Structure):
+        # complex scalars
+        return lambda arg: arg_t(arg.real, arg.imag)
+    else:
+        return None
 
 
 class CKernelExecutor(KernelExecutorBase):
@@ -419,6 +516,7 @@ class CKernelExecutor(KernelExecutorBase):
 
     .. automethod:: __init__
     .. automethod:: __call__
+    .. automethod:: bind
     """
 
     def __init__(self, program, entrypoint, compiler=None):
@@ -440,8 +538,12 @@ class CKernelExecutor(KernelExecutorBase):
         return CExecutionWrapperGenerator()
 
     @memoize_method
-    def program_info(self, entrypoint, arg_to_dtype_set=frozenset(),
-            all_kwargs=None):
+    def translation_unit_code(self, entrypoint, arg_to_dtype_set=frozenset()):
+        """
+        :returns: a tuple ``(program, codegen_result, all_code)`` of the
+            typed and scheduled translation unit, the result of code
+            generation for it and the full C source to be compiled.
+        """
         program = self.get_typed_and_scheduled_translation_unit(
                 entrypoint, arg_to_dtype_set)
 
@@ -469,12 +571,34 @@ class CKernelExecutor(KernelExecutorBase):
             # update code from editor
             all_code = "\n".join([dev_code, "", host_code])
 
+        return program, codegen_result, all_code
+
+    @memoize_method
+    def program_info(self, entrypoint, arg_to_dtype_set=frozenset(),
+            all_kwargs=None):
+        program, codegen_result, all_code = self.translation_unit_code(
+                entrypoint, arg_to_dtype_set)
+
+        # All device programs live in the same translation unit, build it once.
+        dll = self.compiler.build(entrypoint, all_code)
+
+        # Only the device programs of *entrypoint* are invoked, not those of
+        # its callees or of other entrypoints.
+        from loopy.schedule import CallKernel
+        entrypoint_dev_prog_names = {
+                sched_item.kernel_name
+                for sched_item in program[entrypoint].linearization
+                if isinstance(sched_item, CallKernel)}
+
         c_kernels = []
 
         for dp in codegen_result.device_programs:
+            if dp.name not in entrypoint_dev_prog_names:
+                continue
+
             c_kernels.append(CompiledCKernel(dp,
                 codegen_result.implemented_data_infos[entrypoint], all_code,
-                self.program.target, self.compiler))
+                self.program.target, self.compiler, dll=dll))
 
         return _KernelInfo(
                 program=program,
@@ -485,8 +609,39 @@ class CKernelExecutor(KernelExecutorBase):
 
     # }}}
 
-    def __call__(self, *args, entrypoint=None, **kwargs):
+    def get_kernel_info_and_system_args(self, entrypoint, arg_to_dtype_set,
+            *args):
+        program_info = self.program_info(entrypoint, arg_to_dtype_set)
+        return program_info, (program_info.c_kernels,) + args
+
+    def _check_num_threads(self, num_threads):
+        if num_threads is not None and not self.program.target.openmp:
+            from loopy.diagnostic import LoopyError
+            raise LoopyError("num_threads may only be passed to kernels "
+                    "using an OpenMP-enabled target")
+
+    def bind(self, *args, entrypoint=None, num_threads=None, **kwargs):
         """
+        :arg num_threads: If not *None*, the number of OpenMP threads to use
+            for each call. See :meth:`__call__`.
+        :returns: a :class:`loopy.BoundKernelCall`.
+        """
+        self._check_num_threads(num_threads)
+
+        bound_call = super().bind(*args, entrypoint=entrypoint, **kwargs)
+
+        if num_threads is not None:
+            from functools import partial
+            bound_call.invoker = partial(_invoke_with_num_threads,
+                    num_threads, bound_call.invoker)
+
+        return bound_call
+
+    def __call__(self, *args, entrypoint=None, num_threads=None, **kwargs):
+        """
+        :arg num_threads: If not *None*, the number of OpenMP threads to use
+            for this invocation. Only valid if the target was created with
+            *openmp=True*.
         :returns: ``(None, output)`` the output is a tuple of output arguments
             (arguments that are written as part of the kernel). The order is given
             by the order of kernel arguments. If this order is unspecified
@@ -506,5 +661,95 @@ class CKernelExecutor(KernelExecutorBase):
         program_info = self.program_info(entrypoint,
                 self.arg_to_dtype_set(kwargs))
 
-        return program_info.invoker(
+        if num_threads is None:
+            return program_info.invoker(
+                    program_info.c_kernels, *args, **kwargs)
+
+        self._check_num_threads(num_threads)
+
+        return _invoke_with_num_threads(num_threads, program_info.invoker,
                 program_info.c_kernels, *args, **kwargs)
+
+
+def _invoke_with_num_threads(num_threads, invoker, c_kernels, *args, **kwargs):
+    # omp_{get,set}_* are resolved through the dependencies of the kernel's
+    # shared library, i.e. the OpenMP runtime it was linked against. Kernels
+    # without OpenMP constructs are not linked against it, and run in a
+    # single thread anyway.
+    dll = c_kernels[0].dll
+    try:
+        omp_get_max_threads = dll.omp_get_max_threads
+        omp_set_num_threads = dll.omp_set_num_threads
+    except AttributeError:
+        return invoker(c_kernels, *args, **kwargs)
+
+    prev_num_threads = omp_get_max_threads()
+    omp_set_num_threads(num_threads)
+    try:
+        return invoker(c_kernels, *args, **kwargs)
+    finally:
+        omp_set_num_threads(prev_num_threads)
+
+
+def build_translation_units(t_units, max_workers=None, return_exceptions=False):
+    r"""Generate code for and compile all entrypoints of each of the
+    :class:`~loopy.TranslationUnit`\ s in *t_units*, running up to
+    *max_workers* compilers concurrently (by default, as many as
+    :func:`os.cpu_count` returns). Subsequent calls to the translation units
+    find their code compiled already.
+
+    The translation units must target :class:`~loopy.ExecutableCTarget` and
+    have the types of all their arguments specified.
+
+    :arg return_exceptions: if *True*, a failure to generate code for or to
+        compile a translation unit does not propagate, and a list with the
+        exception (or *None*) for each of *t_units* is returned instead.
+    """
+    from loopy.target.c import ExecutableCTarget
+
+    for t_unit in t_units:
+        if not isinstance(t_unit.target, ExecutableCTarget):
+            from loopy.diagnostic import LoopyError
+            raise LoopyError("build_translation_units requires translation "
+                    f"units targeting ExecutableCTarget, got {t_unit.target}")
+
+    errors = [None] * len(t_units)
+
+    def call(i, f, *args):
+        if errors[i] is None:
+            try:
+                return f(*args)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                errors[i] = e
+
+    pending = []
+    for i, t_unit in enumerate(t_units):
+        for entrypoint in sorted(t_unit.entrypoints):
+            pex = t_unit._get_kernel_executor(entrypoint=entrypoint)
+            code = call(i, pex.translation_unit_code,
+                    entrypoint, pex.arg_to_dtype_set({}))
+            if code is not None:
+                pending.append((i, pex, entrypoint, code[2]))
+
+    # The compilers run as subprocesses, which is where the time is spent, so
+    # a thread pool provides all the concurrency that's needed.
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Identical code (which would contend for the same cache directory)
+        # is compiled once.
+        futures = {}
+        for _, pex, entrypoint, all_code in pending:
+            if (pex.compiler, all_code) not in futures:
+                futures[pex.compiler, all_code] = pool.submit(
+                        pex.compiler.compile, entrypoint, all_code)
+
+        for i, pex, _, all_code in pending:
+            call(i, futures[pex.compiler, all_code].result)
+
+    for i, pex, entrypoint, _ in pending:
+        call(i, pex.program_info, entrypoint, pex.arg_to_dtype_set({}))
+
+    if return_exceptions:
+        return errors
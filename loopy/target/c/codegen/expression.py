@@ -47,6 +47,7 @@ __doc__ = """
 .. currentmodule:: loopy.target.c.codegen.expression
 
 .. autoclass:: ExpressionToCExpressionMapper
+.. autoclass:: OpenMPExpressionToCExpressionMapper
 """
 
 
@@ -541,6 +542,20 @@ class ExpressionToCExpressionMapper(IdentityMapper):
     def map_local_hw_index(self, expr, type_context):
         raise LoopyError("plain C does not have local hw axes")
 
+
+class OpenMPExpressionToCExpressionMapper(ExpressionToCExpressionMapper):
+    """
+    Maps group hardware axes onto the induction variables of the
+    ``#pragma omp parallel for`` loops wrapped around the body of each
+    device program by :class:`loopy.target.c.CASTBuilder`.
+    """
+
+    def map_group_hw_index(self, expr, type_context):
+        return var("_lpy_gid_%d" % expr.axis)
+
+    def map_local_hw_index(self, expr, type_context):
+        raise LoopyError("OpenMP C target does not support local hw axes")
+
 # }}}
 
 
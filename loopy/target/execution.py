@@ -31,8 +31,7 @@ from pytools.py_codegen import (
 import logging
 logger = logging.getLogger(__name__)
 
-from pytools.persistent_dict import WriteOncePersistentDict
-from loopy.tools import LoopyKeyBuilder
+from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
 from loopy.version import DATA_MODEL_VERSION
 
 
@@ -117,8 +116,21 @@ class ExecutionWrapperGeneratorBase(ABC):
     A set of common methods for generating a wrapper
     for execution
 
+    Unless :attr:`loopy.Options.skip_arg_checks` is set, the generated
+    invokers remember the signatures (see :meth:`generate_arg_signature`)
+    of the arguments they were called with. The integer arguments found
+    from shapes, offsets and strides for a signature are reused, and
+    the checks on the arguments are skipped, in calls with the same
+    signature.
+
+    .. attribute:: max_cached_arg_signatures
+
+        The number of signatures remembered by each invoker. Once exceeded,
+        all remembered signatures are discarded.
     """
 
+    max_cached_arg_signatures = 64
+
     def __init__(self, system_args):
         self.system_args = system_args[:]
 
@@ -340,6 +352,66 @@ class ExecutionWrapperGeneratorBase(ABC):
 
     # }}}
 
+    # {{{ argument signature
+
+    def get_arg_signature_names(self, implemented_data_info):
+        """Return a :class:`list` of the names of the non-array arguments
+        whose values are part of the argument signature: those that are
+        found from offsets or strides and those on which the shapes or
+        strides of array arguments depend.
+        """
+        from loopy.kernel.data import KernelArgument
+        from loopy.kernel.array import ArrayBase
+        from loopy.symbolic import get_dependencies
+
+        shape_and_stride_deps = set()
+        for arg in implemented_data_info:
+            if issubclass(arg.arg_class, ArrayBase):
+                for expr in (arg.unvec_shape or ()) + (arg.unvec_strides or ()):
+                    if expr is not None:
+                        shape_and_stride_deps.update(get_dependencies(expr))
+
+        return [arg.name
+                for arg in implemented_data_info
+                if issubclass(arg.arg_class, KernelArgument)
+                and not issubclass(arg.arg_class, ArrayBase)
+                and (arg.offset_for_name is not None
+                    or arg.stride_for_name_and_axis is not None
+                    or arg.name in shape_and_stride_deps)]
+
+    def generate_arg_signature(self, gen, implemented_data_info,
+            signature_names):
+        """Generate code assigning to ``_lpy_sig`` a hashable summary of the
+        arguments that determines the outcome of the argument checks and
+        the integer arguments found from the passed arrays: the data type,
+        shape, strides and offset of each array argument, the values of
+        the arguments in *signature_names*, and whether each remaining
+        argument was passed.
+        """
+        import loopy as lp
+        from loopy.kernel.data import KernelArgument
+        from loopy.kernel.array import ArrayBase
+
+        sig_entries = []
+        for arg in implemented_data_info:
+            if not issubclass(arg.arg_class, KernelArgument):
+                continue
+
+            if arg.arg_class in [lp.ArrayArg, lp.ConstantArg]:
+                sig_entries.append(
+                        "None if {name} is None else ({name}.dtype, "
+                        "{name}.shape, {name}.strides, "
+                        'getattr({name}, "offset", 0))'.format(name=arg.name))
+            elif (not issubclass(arg.arg_class, ArrayBase)
+                    and arg.name in signature_names):
+                sig_entries.append(arg.name)
+            else:
+                sig_entries.append("%s is None" % arg.name)
+
+        gen("_lpy_sig = (%s)" % "".join("%s, " % entry for entry in sig_entries))
+
+    # }}}
+
     # {{{ handle non numpy arguements
 
     def handle_non_numpy_arg(self, gen, arg):
@@ -658,16 +730,72 @@ class ExecutionWrapperGeneratorBase(ABC):
 
         self.initialize_system_args(gen)
 
-        self.generate_integer_arg_finding_from_shapes(
-            gen, program[entrypoint], implemented_data_info)
-        self.generate_integer_arg_finding_from_offsets(
-            gen, program[entrypoint], implemented_data_info)
-        self.generate_integer_arg_finding_from_strides(
-            gen, program[entrypoint], implemented_data_info)
-        self.generate_value_arg_check(
-            gen, program[entrypoint], implemented_data_info)
-        args = self.generate_arg_setup(
-            gen, program[entrypoint], implemented_data_info, options)
+        def generate_checked_arg_setup():
+            self.generate_integer_arg_finding_from_shapes(
+                gen, program[entrypoint], implemented_data_info)
+            self.generate_integer_arg_finding_from_offsets(
+                gen, program[entrypoint], implemented_data_info)
+            self.generate_integer_arg_finding_from_strides(
+                gen, program[entrypoint], implemented_data_info)
+            self.generate_value_arg_check(
+                gen, program[entrypoint], implemented_data_info)
+            return self.generate_arg_setup(
+                gen, program[entrypoint], implemented_data_info, options)
+
+        if options.skip_arg_checks:
+            args = generate_checked_arg_setup()
+        else:
+            signature_names = self.get_arg_signature_names(
+                    implemented_data_info)
+            signature_values = "(%s)" % "".join(
+                    "%s," % name for name in signature_names)
+
+            gen.add_to_preamble("_lpy_arg_signatures = {}")
+
+            gen("# {{{ look up argument signature")
+            gen("")
+            self.generate_arg_signature(
+                    gen, implemented_data_info, signature_names)
+            gen("try:")
+            with Indentation(gen):
+                gen("_lpy_sig_values = _lpy_arg_signatures.get(_lpy_sig)")
+            gen("except TypeError:")
+            with Indentation(gen):
+                gen("# unhashable argument values, do not remember them")
+                gen("_lpy_sig = None")
+                gen("_lpy_sig_values = None")
+            gen("")
+            gen("# }}}")
+            gen("")
+
+            gen("if _lpy_sig_values is None:")
+            with Indentation(gen):
+                args = generate_checked_arg_setup()
+
+                gen("if _lpy_sig is not None:")
+                with Indentation(gen):
+                    gen("if len(_lpy_arg_signatures) >= %d:"
+                            % self.max_cached_arg_signatures)
+                    with Indentation(gen):
+                        gen("_lpy_arg_signatures.clear()")
+                    gen("_lpy_arg_signatures[_lpy_sig] = %s"
+                            % signature_values)
+
+            gen("else:")
+            with Indentation(gen):
+                gen("# arguments with this signature have been checked")
+                if signature_names:
+                    gen("%s = _lpy_sig_values" % signature_values)
+                gen("")
+
+                unchecked_args = self.generate_arg_setup(
+                    gen, program[entrypoint], implemented_data_info,
+                    options.copy(skip_arg_checks=True))
+                assert unchecked_args == args
+
+            gen("del _lpy_sig")
+            gen("del _lpy_sig_values")
+            gen("")
 
         #FIXME: should we make this as a dict as well.
         host_program_name = codegen_result.host_programs[entrypoint].name
@@ -700,17 +828,107 @@ class _KernelInfo(ImmutableRecord):
     pass
 
 
+# {{{ bound kernel calls
+
+class BoundKernelCall:
+    """A call to a kernel, with the generated code and the values of its
+    arguments resolved once, so that the call may be repeated with little
+    overhead. Obtained from :meth:`loopy.TranslationUnit.bind`.
+
+    .. attribute:: arg_names
+
+        A :class:`frozenset` of the names of the arguments whose values may
+        be passed to :meth:`__call__`.
+
+    .. automethod:: __call__
+    """
+
+    def __init__(self, invoker, system_args, kwargs, arg_names,
+            packing_controller=None):
+        # skip the wrapper of a PicklableFunction
+        self.invoker = getattr(invoker, "func", invoker)
+        self.system_args = tuple(system_args)
+        self.kwargs = kwargs
+        self.arg_names = arg_names
+        self.packing_controller = packing_controller
+
+        if packing_controller is not None:
+            self.packed_kwargs = packing_controller(kwargs)
+        else:
+            self.packed_kwargs = kwargs
+
+    def __call__(self, **kwargs):
+        """Invoke the kernel with the bound argument values, any of which
+        may be replaced by passing a new value by keyword. The replacing
+        values must have the same data types as the ones they replace, as
+        the generated code is not redetermined.
+
+        :returns: the same as invoking the kernel directly.
+        """
+        if kwargs:
+            kwargs = {**self.kwargs, **kwargs}
+            if self.packing_controller is not None:
+                kwargs = self.packing_controller(kwargs)
+        else:
+            kwargs = self.packed_kwargs
+
+        return self.invoker(*self.system_args, **kwargs)
+
+
+class KernelCallSequence:
+    """A sequence of :class:`BoundKernelCall` instances, invoked in order by
+    :meth:`__call__`. For kernels executed by
+    :class:`~loopy.PyOpenCLTarget`, the kernels are enqueued back to back
+    without waiting for their completion.
+
+    .. attribute:: calls
+
+    .. attribute:: arg_names
+
+        A :class:`frozenset` of the names of the arguments whose values may
+        be passed to :meth:`__call__`.
+
+    .. automethod:: __call__
+    """
+
+    def __init__(self, calls):
+        self.calls = tuple(calls)
+        self.arg_names = frozenset().union(*(call.arg_names for call in calls))
+
+    def __call__(self, **kwargs):
+        """Invoke each of :attr:`calls`. Values passed by keyword replace
+        the bound values of the arguments of this name in each of the calls
+        taking such an argument.
+
+        :returns: a :class:`tuple` of the results of the calls.
+        """
+        if not kwargs:
+            return tuple([call() for call in self.calls])
+
+        unknown_names = set(kwargs) - self.arg_names
+        if unknown_names:
+            raise TypeError("no kernel in the sequence takes the arguments "
+                    f"{', '.join(sorted(unknown_names))}")
+
+        return tuple([
+            call(**{name: value for name, value in kwargs.items()
+                if name in call.arg_names})
+            for call in self.calls])
+
+# }}}
+
+
 class _Kernels:
     pass
 
 
-typed_and_scheduled_cache = WriteOncePersistentDict(
+typed_and_scheduled_cache = LoopyWriteOncePersistentDict(
         "loopy-typed-and-scheduled-cache-v1-"+DATA_MODEL_VERSION,
         key_builder=LoopyKeyBuilder())
 
 
-invoker_cache = WriteOncePersistentDict(
-        "loopy-invoker-cache-v10-"+DATA_MODEL_VERSION,
+invoker_cache = LoopyWriteOncePersistentDict(
+        "loopy-invoker-cache-v11-"+DATA_MODEL_VERSION,
         key_builder=LoopyKeyBuilder())
 
 
@@ -722,6 +940,7 @@ class KernelExecutorBase:
 
     .. automethod:: __init__
     .. automethod:: __call__
+    .. automethod:: bind
     """
 
     def __init__(self, program, entrypoint):
@@ -897,6 +1116,43 @@ class KernelExecutorBase:
 
     # {{{ call and info generator
 
+    def get_kernel_info_and_system_args(self, entrypoint, arg_to_dtype_set,
+            *args):
+        """Return a tuple ``(kernel_info, system_args)`` of the information
+        on the generated code of *entrypoint* and the leading arguments
+        with which to call its invoker, given the remaining arguments *args*
+        passed to :meth:`__call__` before the kernel arguments.
+        """
+        raise NotImplementedError()
+
+    def bind(self, *args, entrypoint=None, **kwargs):
+        """Resolve the generated code of *entrypoint* for the arguments
+        *kwargs* (and any further arguments *args*, as taken by
+        :meth:`__call__`) once.
+
+        :returns: a :class:`BoundKernelCall`.
+        """
+        assert entrypoint is not None
+
+        if __debug__:
+            self.check_for_required_array_arguments(kwargs.keys())
+
+        if self.packing_controller is not None:
+            packed_kwargs = self.packing_controller(kwargs)
+        else:
+            packed_kwargs = kwargs
+
+        kernel_info, system_args = self.get_kernel_info_and_system_args(
+                entrypoint, self.arg_to_dtype_set(packed_kwargs), *args)
+
+        arg_names = (
+                frozenset(arg.name for arg in self.program[entrypoint].args)
+                | frozenset(idi.name
+                    for idi in kernel_info.implemented_data_info))
+
+        return BoundKernelCall(kernel_info.invoker, system_args, kwargs,
+                arg_names, self.packing_controller)
+
     def __call__(self, queue, **kwargs):
         raise NotImplementedError()
 
@@ -25,11 +25,12 @@ THE SOFTWARE.
 
 
 from pytools import memoize_method
+from genpy import Suite
 
 from loopy.target.python import ExpressionToPythonMapper, PythonASTBuilderBase
 from loopy.target import TargetBase, DummyHostASTBuilder
 
-from loopy.diagnostic import LoopyWarning
+from loopy.diagnostic import LoopyError, LoopyWarning
 
 
 # {{{ base numba
@@ -79,19 +80,114 @@ class NumbaBaseASTBuilder(PythonASTBuilderBase):
                 ))
 
 
+class NumbaJITExpressionToPythonMapper(ExpressionToPythonMapper):
+    """
+    Maps group hardware axes onto the induction variables of the
+    :func:`numba.prange` loops wrapped around the body of each device program
+    by :class:`NumbaJITASTBuilder`.
+    """
+
+    def map_group_hw_index(self, expr, enclosing_prec):
+        return "_lpy_gid_%d" % expr.axis
+
+    def map_local_hw_index(self, expr, enclosing_prec):
+        raise LoopyError("Numba target does not support local hw axes")
+
+
 class NumbaJITASTBuilder(NumbaBaseASTBuilder):
+    @property
+    def known_callables(self):
+        from loopy.target.numpy import get_numpy_callables
+        callables = super().known_callables
+        callables.update(get_numpy_callables())
+        return callables
+
+    def symbol_manglers(self):
+        from loopy.target.numpy import numpy_symbol_mangler
+        return (
+                super().symbol_manglers() + [
+                    numpy_symbol_mangler
+                    ])
+
     def get_python_function_decorators(self):
-        return ("@_lpy_numba.jit",)
+        return ("@_lpy_numba.njit(parallel=%r, fastmath=%r, cache=%r)"
+                % (self.target.parallel, self.target.fastmath, self.target.cache),)
+
+    def get_expression_to_code_mapper(self, codegen_state):
+        return NumbaJITExpressionToPythonMapper(codegen_state)
+
+    def get_function_definition(self, codegen_state, codegen_result,
+            schedule_index, function_decl, function_body):
+        if codegen_state.is_generating_device_code:
+            function_body = self.wrap_in_prange_group_loops(
+                    codegen_state, schedule_index, function_body)
+
+        return super().get_function_definition(
+                codegen_state, codegen_result, schedule_index,
+                function_decl, function_body)
+
+    def wrap_in_prange_group_loops(self, codegen_state, schedule_index, ast):
+        """Wrap *ast* (the body of the device program starting at
+        *schedule_index*) in one :func:`numba.prange` loop per group axis.
+        Numba runs the iterations of the outermost of these loops in
+        parallel if :attr:`NumbaTarget.parallel` is set.
+        """
+        kernel = codegen_state.kernel
+
+        from loopy.schedule import get_insn_ids_for_block_at
+        gsize, lsize = kernel.get_grid_sizes_for_insn_ids_as_exprs(
+                get_insn_ids_for_block_at(kernel.linearization, schedule_index),
+                codegen_state.callables_table)
+
+        if lsize:
+            raise LoopyError("Numba target does not support local axes "
+                    "(found in '%s')" % kernel.name)
+
+        from pymbolic.mapper.stringifier import PREC_NONE
+        from genpy import For
+        ecm = self.get_expression_to_code_mapper(codegen_state)
+
+        for axis in reversed(range(len(gsize))):
+            ast = For(
+                    ("_lpy_gid_%d" % axis,),
+                    "_lpy_numba.prange(%s)" % ecm(gsize[axis], PREC_NONE, "i"),
+                    Suite(ast))
+
+        return ast
 
 
 class NumbaTarget(TargetBase):
-    """A target for plain Python as understood by Numba, without any parallel extensions.
+    """A target for plain Python as understood by Numba, compiled with
+    :func:`numba.njit`. Calling a :class:`loopy.TranslationUnit` with this
+    target runs its entrypoint on the :class:`numpy.ndarray` arguments
+    passed in.
+
+    Inames tagged as group axes (``g.*``) are executed as
+    :func:`numba.prange` loops around the body of the kernel. Local axes
+    (``l.*``) are not supported.
+
+    .. automethod:: __init__
     """
 
-    def __init__(self):
-        from warnings import warn
-        warn("The Numba targets are not yet feature-complete",
-                LoopyWarning, stacklevel=2)
+    hash_fields = TargetBase.hash_fields + ("parallel", "fastmath", "cache")
+    comparison_fields = TargetBase.comparison_fields + (
+            "parallel", "fastmath", "cache")
+
+    def __init__(self, parallel=True, fastmath=False, cache=True):
+        """
+        :arg parallel: If *True*, the iterations of the loop over the
+            outermost group axis run in parallel threads, see the
+            *parallel* argument of :func:`numba.njit`.
+        :arg fastmath: Passed on to :func:`numba.njit`, allowing Numba to
+            disregard strict IEEE 754 semantics.
+        :arg cache: If *True*, the generated code is stored (by its hash)
+            alongside :mod:`loopy`'s cache of invokers and the machine code
+            that Numba compiles from it is kept in Numba's on-disk cache,
+            so that it is not recompiled in other processes.
+        """
+        self.parallel = parallel
+        self.fastmath = fastmath
+        self.cache = cache
 
     def split_kernel_at_global_barriers(self):
         return False
@@ -130,6 +226,13 @@ class NumbaTarget(TargetBase):
 
     # }}}
 
+    def get_kernel_executor_cache_key(self, *args, **kwargs):
+        return None
+
+    def get_kernel_executor(self, t_unit, *args, **kwargs):
+        from loopy.target.numba_execution import NumbaKernelExecutor
+        return NumbaKernelExecutor(t_unit, entrypoint=kwargs.pop("entrypoint"))
+
 # }}}
 
 
@@ -0,0 +1,87 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import os
+import sys
+
+from loopy.target.numpy_execution import NumpyKernelExecutor
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class NumbaKernelExecutor(NumpyKernelExecutor):
+    """An object connecting a kernel to the functions compiled by Numba from
+    the code generated for it by :class:`loopy.NumbaTarget`.
+
+    If :attr:`loopy.NumbaTarget.cache` is set, the generated code is written
+    to a module file named by its hash in the directory of
+    :data:`loopy.target.execution.invoker_cache` and imported from there.
+    Numba keeps the machine code compiled for the functions of this module
+    in its on-disk cache next to the file, so that processes invoking the
+    same kernel share both the invoker and the compiled code. Both files
+    count towards the disk usage of the invoker cache and are pruned along
+    with it, see :func:`loopy.tools.prune_caches`.
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    """
+
+    def load_device_code(self, entrypoint, dev_code):
+        if not self.program.target.cache:
+            return super().load_device_code(entrypoint, dev_code)
+
+        from hashlib import sha256
+        module_name = "_lpy_numba_%s" % sha256(dev_code.encode()).hexdigest()
+
+        from loopy.target.execution import invoker_cache
+        module_dir = os.path.join(invoker_cache.container_dir, "numba")
+        os.makedirs(module_dir, exist_ok=True)
+        module_path = os.path.join(module_dir, module_name + ".py")
+
+        if not os.path.exists(module_path):
+            logger.debug("%s: writing numba module '%s'"
+                    % (entrypoint, module_path))
+
+            # Write to a temporary file first so that other processes never
+            # see a partially written module.
+            from tempfile import NamedTemporaryFile
+            with NamedTemporaryFile("w", dir=module_dir, suffix=".py.tmp",
+                    delete=False) as outf:
+                outf.write(dev_code)
+            os.replace(outf.name, module_path)
+
+        module = sys.modules.get(module_name)
+        if module is None:
+            from importlib.util import spec_from_file_location, module_from_spec
+            spec = spec_from_file_location(module_name, module_path)
+            module = module_from_spec(spec)
+
+            # Numba looks up the module of a function in sys.modules when
+            # loading the function's machine code from its cache.
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+
+        return vars(module)
+
+# vim: foldmethod=marker
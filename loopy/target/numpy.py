@@ -0,0 +1,791 @@
+"""Python target operating on :mod:`numpy` arrays, with loop vectorization."""
+
+
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+
+from pytools import memoize_method
+from pymbolic.mapper.stringifier import PREC_NONE, PREC_CALL
+from genpy import Generable, Suite, Collection, Comment, Line
+
+from loopy.diagnostic import LoopyError
+from loopy.kernel.function_interface import ScalarCallable
+from loopy.symbolic import get_dependencies
+from loopy.target import TargetBase, DummyHostASTBuilder
+from loopy.target.python import ExpressionToPythonMapper, PythonASTBuilderBase
+from loopy.types import NumpyType
+
+
+class _UnvectorizableError(Exception):
+    pass
+
+
+# {{{ functions and symbols
+
+_NUMPY_UNARY_FUNCTIONS = {
+        "abs": "absolute", "fabs": "absolute",
+        "acos": "arccos", "asin": "arcsin", "atan": "arctan",
+        "cos": "cos", "cosh": "cosh", "sin": "sin", "sinh": "sinh",
+        "tan": "tan", "tanh": "tanh",
+        "exp": "exp", "log": "log", "log10": "log10", "sqrt": "sqrt",
+        "ceil": "ceil", "floor": "floor",
+        "real": "real", "imag": "imag", "conj": "conjugate",
+        "isnan": "isnan",
+        }
+
+_NUMPY_BINARY_FUNCTIONS = {
+        "max": "maximum", "min": "minimum", "fmax": "fmax", "fmin": "fmin",
+        "pow": "power", "atan2": "arctan2", "copysign": "copysign",
+        }
+
+
+class NumpyMathCallable(ScalarCallable):
+    """
+    The math functions known to :class:`loopy.NumpyTarget`, implemented by
+    :mod:`numpy` functions that apply equally to scalars and arrays.
+    """
+
+    def with_types(self, arg_id_to_dtype, callables_table):
+        name = self.name
+
+        if name in _NUMPY_UNARY_FUNCTIONS:
+            nargs = 1
+            numpy_name = _NUMPY_UNARY_FUNCTIONS[name]
+        else:
+            nargs = 2
+            numpy_name = _NUMPY_BINARY_FUNCTIONS[name]
+
+        for id in arg_id_to_dtype:
+            if not -1 <= id < nargs:
+                raise LoopyError(f"'{name}' can take only {nargs} argument(s).")
+
+        if any(arg_id_to_dtype.get(id) is None for id in range(nargs)):
+            # the types provided aren't mature enough to specialize the
+            # callable
+            return (
+                    self.copy(arg_id_to_dtype=arg_id_to_dtype),
+                    callables_table)
+
+        # Let numpy decide the type of the result.
+        result_dtype = getattr(np, numpy_name)(*[
+            np.empty(0, dtype=arg_id_to_dtype[id].numpy_dtype)
+            for id in range(nargs)]).dtype
+
+        new_arg_id_to_dtype = {id: arg_id_to_dtype[id] for id in range(nargs)}
+        new_arg_id_to_dtype[-1] = NumpyType(result_dtype)
+
+        return (
+                self.copy(name_in_target=f"_lpy_np.{numpy_name}",
+                    arg_id_to_dtype=new_arg_id_to_dtype),
+                callables_table)
+
+
+def get_numpy_callables():
+    """
+    Returns a mapping from the identifiers of the functions known to
+    :class:`loopy.NumpyTarget` to instances of :class:`NumpyMathCallable`.
+    """
+    return {id_: NumpyMathCallable(id_)
+            for id_ in list(_NUMPY_UNARY_FUNCTIONS) + list(_NUMPY_BINARY_FUNCTIONS)}
+
+
+_NUMPY_SYMBOLS = {
+        "INFINITY": (np.float32, "_lpy_np.float32(_lpy_np.inf)"),
+        "HUGE_VAL": (np.float64, "_lpy_np.inf"),
+        "NAN": (np.float32, "_lpy_np.float32(_lpy_np.nan)"),
+        "INT_MAX": (np.int32, str(np.iinfo(np.int32).max)),
+        "INT_MIN": (np.int32, str(np.iinfo(np.int32).min)),
+        "LONG_MAX": (np.int64, str(np.iinfo(np.int64).max)),
+        "LONG_MIN": (np.int64, str(np.iinfo(np.int64).min)),
+        }
+
+
+def numpy_symbol_mangler(kernel, name):
+    try:
+        dtype, name_in_target = _NUMPY_SYMBOLS[name]
+    except KeyError:
+        return None
+
+    return NumpyType(np.dtype(dtype)), name_in_target
+
+# }}}
+
+
+# {{{ expression to code
+
+class _VectorizedLoop:
+    """A loop over *iname* from *lbound* to *ubound* (inclusive) that is
+    implemented by operating on arrays rather than by iteration.
+    """
+
+    def __init__(self, iname, lbound, ubound):
+        self.iname = iname
+        self.lbound = lbound
+        self.ubound = ubound
+
+
+class ExpressionToNumpyMapper(ExpressionToPythonMapper):
+    """Maps expressions to Python code, where the values of the expressions
+    across the iterations of the loops *loops* (a sequence of
+    :class:`_VectorizedLoop`, outermost first) are computed at once as
+    :mod:`numpy` arrays.
+
+    An expression depending on the inames of the loops in *context* is
+    mapped to an array with one axis per iname of *context* (in that order),
+    some of which may have length 1, so that such arrays broadcast against
+    each other. Expressions not depending on these inames are mapped to
+    scalars.
+
+    :arg vector_temporaries: a mapping from the names of temporaries holding
+        arrays computed in this way to the inames of their axes.
+    """
+
+    def __init__(self, codegen_state, type_inf_mapper=None,
+            loops=(), context=None, vector_temporaries=None):
+        super().__init__(codegen_state, type_inf_mapper)
+
+        if context is None:
+            context = tuple(loop.iname for loop in loops)
+        if vector_temporaries is None:
+            vector_temporaries = {}
+
+        self.loops = {loop.iname: loop for loop in loops}
+        self.context = context
+        self.vector_temporaries = vector_temporaries
+
+    def get_vector_dependencies(self, expr):
+        """Return the inames of the context on which *expr* depends."""
+        result = set()
+        for name in get_dependencies(expr):
+            if name in self.codegen_state.var_subst_map:
+                result.update(self.get_vector_dependencies(
+                    self.codegen_state.var_subst_map[name]))
+            elif name in self.context:
+                result.add(name)
+            elif name in self.vector_temporaries:
+                result.update(self.vector_temporaries[name])
+
+        return result
+
+    def broadcast_to_context(self, code, axes):
+        """Return code for the array *code*, whose axes correspond to the
+        inames *axes*, transposed and extended by axes of length 1 to have
+        one axis per iname of the context.
+        """
+        perm = sorted(range(len(axes)), key=lambda i: self.context.index(axes[i]))
+        if perm != list(range(len(axes))):
+            code = "_lpy_np.transpose({}, {})".format(code, tuple(perm))
+
+        if len(axes) < len(self.context):
+            code = "{}[{}]".format(code, ", ".join(
+                ":" if iname in axes else "None" for iname in self.context))
+
+        return code
+
+    def map_vector_subscript(self, expr):
+        """Return a tuple ``(code, axes)`` of the code for the section of an
+        array accessed by *expr* across the iterations of the loops of the
+        context, and the inames corresponding to the axes of the section.
+
+        :raises _UnvectorizableError: if the section is not expressible as a
+            slice of the array.
+        """
+        from pymbolic import var
+        from pymbolic.mapper import UnsupportedExpressionError
+        from loopy.diagnostic import ExpressionNotAffineError
+        from loopy.symbolic import CoefficientCollector
+
+        index_strs = []
+        axes = []
+
+        for index in expr.index_tuple:
+            index_inames = self.get_vector_dependencies(index)
+            if not index_inames:
+                index_strs.append(self.rec(index, PREC_NONE))
+                continue
+
+            if (len(index_inames) > 1
+                    or get_dependencies(index) & set(self.vector_temporaries)):
+                raise _UnvectorizableError()
+
+            iname, = index_inames
+            if iname in axes:
+                raise _UnvectorizableError()
+
+            try:
+                coeffs = CoefficientCollector([iname])(index)
+            except (ExpressionNotAffineError, UnsupportedExpressionError):
+                raise _UnvectorizableError()
+
+            stride = coeffs.pop(var(iname), 0)
+            offset = coeffs.pop(1, 0)
+
+            if (coeffs
+                    or not isinstance(stride, (int, np.integer))
+                    or stride <= 0
+                    or self.get_vector_dependencies(offset)):
+                raise _UnvectorizableError()
+
+            loop = self.loops[iname]
+            slice_str = "{}:{}".format(
+                    self.rec(self._simplify(stride*loop.lbound + offset),
+                        PREC_NONE),
+                    self.rec(self._simplify(stride*loop.ubound + offset + 1),
+                        PREC_NONE))
+            if stride != 1:
+                slice_str += ":%d" % stride
+
+            index_strs.append(slice_str)
+            axes.append(iname)
+
+        return ("{}[{}]".format(
+                    self.rec(expr.aggregate, PREC_CALL), ", ".join(index_strs)),
+                tuple(axes))
+
+    def _simplify(self, expr):
+        from pymbolic.mapper.flattener import flatten
+        from loopy.symbolic import ConstantFoldingMapper
+        return ConstantFoldingMapper()(flatten(expr))
+
+    def _is_vector(self, *exprs):
+        return any(self.get_vector_dependencies(expr) for expr in exprs)
+
+    def map_constant(self, expr, enclosing_prec):
+        if isinstance(expr, np.generic):
+            return "_lpy_np.{}({!r})".format(expr.dtype.name, expr.item())
+
+        return super().map_constant(expr, enclosing_prec)
+
+    def map_variable(self, expr, enclosing_prec):
+        name = expr.name
+
+        if name in self.codegen_state.var_subst_map:
+            return super().map_variable(expr, enclosing_prec)
+
+        if name in self.context:
+            loop = self.loops[name]
+            return self.broadcast_to_context(
+                    "_lpy_np.arange({}, {})".format(
+                        self.rec(loop.lbound, PREC_NONE),
+                        self.rec(self._simplify(loop.ubound + 1), PREC_NONE)),
+                    (name,))
+
+        if name in self.vector_temporaries:
+            return self.broadcast_to_context(name, self.vector_temporaries[name])
+
+        return super().map_variable(expr, enclosing_prec)
+
+    def map_subscript(self, expr, enclosing_prec):
+        if not self._is_vector(expr):
+            return super().map_subscript(expr, enclosing_prec)
+
+        return self.broadcast_to_context(*self.map_vector_subscript(expr))
+
+    def map_if(self, expr, enclosing_prec):
+        if not self._is_vector(expr):
+            return super().map_if(expr, enclosing_prec)
+
+        return "_lpy_np.where({}, {}, {})".format(
+                self.rec(expr.condition, PREC_NONE),
+                self.rec(expr.then, PREC_NONE),
+                self.rec(expr.else_, PREC_NONE))
+
+    def _map_logical_function(self, func_name, children, enclosing_prec):
+        result = self.rec(children[-1], PREC_NONE)
+        for child in children[-2::-1]:
+            result = "_lpy_np.{}({}, {})".format(
+                    func_name, self.rec(child, PREC_NONE), result)
+        return result
+
+    def map_logical_and(self, expr, enclosing_prec):
+        if not self._is_vector(expr):
+            return super().map_logical_and(expr, enclosing_prec)
+
+        return self._map_logical_function(
+                "logical_and", expr.children, enclosing_prec)
+
+    def map_logical_or(self, expr, enclosing_prec):
+        if not self._is_vector(expr):
+            return super().map_logical_or(expr, enclosing_prec)
+
+        return self._map_logical_function(
+                "logical_or", expr.children, enclosing_prec)
+
+    def map_logical_not(self, expr, enclosing_prec):
+        if not self._is_vector(expr):
+            return super().map_logical_not(expr, enclosing_prec)
+
+        return "_lpy_np.logical_not(%s)" % self.rec(expr.child, PREC_NONE)
+
+# }}}
+
+
+# {{{ assignments
+
+def _get_reduction(callables_table, assignee, expression):
+    """If *expression* updates *assignee* by a reduction operation, return a
+    tuple ``(operation, operand)``, where *operation* is one of ``"sum"``,
+    ``"prod"``, ``"max"`` and ``"min"``. Otherwise, return *None*.
+    """
+    from pymbolic.primitives import Sum, Product, Call
+    from loopy.symbolic import ResolvedFunction
+
+    if isinstance(expression, (Sum, Product)):
+        operands = [child for child in expression.children if child != assignee]
+        if len(operands) != len(expression.children) - 1 or not operands:
+            return None
+
+        if len(operands) == 1:
+            operand, = operands
+        else:
+            operand = type(expression)(tuple(operands))
+
+        operation = "sum" if isinstance(expression, Sum) else "prod"
+
+    elif (isinstance(expression, Call)
+            and isinstance(expression.function, ResolvedFunction)
+            and callables_table[expression.function.name].name in ["max", "min"]
+            and len(expression.parameters) == 2
+            and assignee in expression.parameters):
+        operand, = [par for par in expression.parameters if par != assignee]
+        operation = callables_table[expression.function.name].name
+
+    else:
+        return None
+
+    if _get_assignee_name(assignee) in get_dependencies(operand):
+        return None
+
+    return operation, operand
+
+
+def _get_assignee_name(assignee):
+    from pymbolic.primitives import Variable, Subscript
+
+    if isinstance(assignee, Variable):
+        return assignee.name
+    elif isinstance(assignee, Subscript):
+        return assignee.aggregate.name
+    else:
+        raise _UnvectorizableError()
+
+
+class NumpyAssignment(Generable):
+    """The code for an :class:`loopy.Assignment`, computing its results for
+    all iterations of the loops *loops* (a sequence of :class:`_VectorizedLoop`,
+    outermost first) at once.
+
+    :arg reduction_inames: the inames of the loops in *loops* over which the
+        assignment performs a reduction (see :func:`_get_reduction`).
+    :arg vector_temporaries: see :class:`ExpressionToNumpyMapper`.
+
+    .. attribute:: assignee_axes
+
+        If the assignee is a temporary variable assigned an array, the inames
+        corresponding to the axes of the array, otherwise *None*.
+
+    :raises _UnvectorizableError: if the assignment cannot be computed for all
+        iterations of *loops* at once.
+    """
+
+    def __init__(self, codegen_state, insn, loops=(),
+            reduction_inames=frozenset(), vector_temporaries=None):
+        self.codegen_state = codegen_state
+        self.insn = insn
+        self.loops = loops
+        self.reduction_inames = reduction_inames
+
+        if vector_temporaries is None:
+            vector_temporaries = {}
+
+        self.ast, self.assignee_axes = self._generate(vector_temporaries)
+
+    def _generate(self, vector_temporaries):
+        from pymbolic.primitives import Variable, Subscript
+        from genpy import Assign, If
+
+        codegen_state = self.codegen_state
+        kernel = codegen_state.kernel
+        insn = self.insn
+        loops = self.loops
+
+        context = tuple(loop.iname for loop in loops)
+        result_context = tuple(
+                iname for iname in context if iname not in self.reduction_inames)
+
+        ecm = ExpressionToNumpyMapper(codegen_state, loops=loops,
+                context=result_context, vector_temporaries=vector_temporaries)
+
+        for loop in loops:
+            if (get_dependencies(loop.lbound) | get_dependencies(loop.ubound)) \
+                    & set(context):
+                raise _UnvectorizableError()
+
+        # {{{ assignee
+
+        assignee = insn.assignee
+        assignee_name = _get_assignee_name(assignee)
+        lhs_axes = None
+
+        if isinstance(assignee, Subscript) and ecm.get_vector_dependencies(
+                assignee):
+            lhs, lhs_axes = ecm.map_vector_subscript(assignee)
+            if set(lhs_axes) != set(result_context):
+                raise _UnvectorizableError()
+
+        elif isinstance(assignee, Variable) and assignee_name in kernel.arg_dict:
+            # a zero-dimensional array
+            lhs = "%s[()]" % assignee_name
+
+        else:
+            lhs = ecm(assignee, PREC_NONE)
+            if result_context and assignee_name not in kernel.temporary_variables:
+                raise _UnvectorizableError()
+
+        # }}}
+
+        # {{{ value
+
+        if self.reduction_inames:
+            reduction = _get_reduction(codegen_state.callables_table,
+                    assignee, insn.expression)
+            if reduction is None:
+                raise _UnvectorizableError()
+            operation, operand = reduction
+
+            operand_ecm = ExpressionToNumpyMapper(codegen_state, loops=loops,
+                    context=context, vector_temporaries=vector_temporaries)
+            operand_inames = operand_ecm.get_vector_dependencies(operand)
+            if (operation in ["sum", "prod"]
+                    and not self.reduction_inames <= operand_inames):
+                # The reduction would need to count the iterations over the
+                # loops the operand does not depend on.
+                raise _UnvectorizableError()
+
+            axis = tuple(
+                    i for i, iname in enumerate(context)
+                    if iname in self.reduction_inames)
+            reduced = "_lpy_np.{}({}, axis={})".format(
+                    operation, operand_ecm(operand, PREC_NONE),
+                    axis[0] if len(axis) == 1 else axis)
+
+            if operation == "sum":
+                rhs = "{} + {}".format(ecm(assignee, PREC_NONE), reduced)
+            elif operation == "prod":
+                rhs = "{} * {}".format(ecm(assignee, PREC_NONE), reduced)
+            else:
+                rhs = "_lpy_np.{}imum({}, {})".format(
+                        operation, ecm(assignee, PREC_NONE), reduced)
+
+            rhs_inames = (
+                    ecm.get_vector_dependencies(assignee)
+                    | (operand_inames - self.reduction_inames))
+
+        else:
+            rhs = ecm(insn.expression, PREC_NONE)
+            rhs_inames = ecm.get_vector_dependencies(insn.expression)
+
+        # }}}
+
+        if lhs_axes is not None and rhs_inames:
+            perm = tuple(result_context.index(iname) for iname in lhs_axes)
+            if perm != tuple(sorted(perm)):
+                rhs = "_lpy_np.transpose({}, {})".format(rhs, perm)
+
+        ast = Assign(lhs, rhs)
+
+        if self.reduction_inames and operation in ["max", "min"]:
+            # max and min of empty arrays are undefined
+            loops_by_iname = {loop.iname: loop for loop in loops}
+            ast = If(" and ".join(
+                "{} >= {}".format(
+                    ecm(loops_by_iname[iname].ubound, PREC_NONE),
+                    ecm(loops_by_iname[iname].lbound, PREC_NONE))
+                for iname in context
+                if iname in self.reduction_inames), ast)
+
+        if (isinstance(assignee, Variable)
+                and assignee_name in kernel.temporary_variables
+                and rhs_inames):
+            assignee_axes = result_context
+        else:
+            assignee_axes = None
+
+        return ast, assignee_axes
+
+    def generate(self):
+        return self.ast.generate()
+
+
+def _get_numpy_assignments(ast):
+    """Return a :class:`list` of the :class:`NumpyAssignment` instances
+    making up *ast*, or *None* if it contains other (non-trivial) code.
+    """
+    if isinstance(ast, NumpyAssignment):
+        return [ast]
+
+    elif isinstance(ast, (Comment, Line)):
+        return []
+
+    elif isinstance(ast, Suite):
+        result = []
+        for child in ast.contents:
+            child_assignments = _get_numpy_assignments(child)
+            if child_assignments is None:
+                return None
+            result.extend(child_assignments)
+
+        return result
+
+    else:
+        return None
+
+
+def _get_accesses(insn, var_name):
+    """Return a :class:`set` of the expressions by which *insn* accesses the
+    variable *var_name*.
+    """
+    from loopy.symbolic import WalkMapper
+
+    result = set()
+
+    class AccessCollector(WalkMapper):
+        def map_variable(self, expr):
+            if expr.name == var_name:
+                result.add(expr)
+
+        def map_subscript(self, expr):
+            if expr.aggregate.name == var_name:
+                result.add(expr)
+                self.rec(expr.index)
+            else:
+                super().map_subscript(expr)
+
+    collector = AccessCollector()
+    collector(insn.assignee)
+    collector(insn.expression)
+
+    return result
+
+
+def vectorize_loop(codegen_state, iname, lbound, ubound, assignments):
+    """Return a :class:`list` of :class:`NumpyAssignment` instances
+    performing the loop over *iname* with the body *assignments* without
+    iterating.
+
+    :raises _UnvectorizableError: if the iterations of the loop depend on
+        each other in a way that prevents this.
+    """
+    kernel = codegen_state.kernel
+
+    body_insn_ids = {assignment.insn.id for assignment in assignments}
+    reader_map = kernel.reader_map()
+    writer_map = kernel.writer_map()
+
+    is_reduction = []
+
+    for iassignment, assignment in enumerate(assignments):
+        insn = assignment.insn
+        assignee_name = _get_assignee_name(insn.assignee)
+        other_assignments = (
+                assignments[:iassignment] + assignments[iassignment+1:])
+
+        if iname in get_dependencies(insn.assignee):
+            # Each iteration accesses its own element of the assignee.
+            for other_assignment in [assignment] + other_assignments:
+                if not _get_accesses(other_assignment.insn, assignee_name) <= {
+                        insn.assignee}:
+                    raise _UnvectorizableError()
+
+            is_reduction.append(False)
+
+        elif (not any(
+                    _get_accesses(other_assignment.insn, assignee_name)
+                    for other_assignment in other_assignments)
+                and _get_reduction(codegen_state.callables_table,
+                    insn.assignee, insn.expression) is not None):
+            is_reduction.append(True)
+
+        elif assignee_name in kernel.temporary_variables:
+            # Each iteration must (first) write its own value of the
+            # temporary, which is not used outside the loop.
+            if (reader_map.get(assignee_name, set())
+                    | writer_map.get(assignee_name, set())) - body_insn_ids:
+                raise _UnvectorizableError()
+
+            first_accessor = next(
+                    other_assignment for other_assignment in assignments
+                    if _get_accesses(other_assignment.insn, assignee_name))
+            if assignee_name in get_dependencies(
+                    first_accessor.insn.expression):
+                raise _UnvectorizableError()
+
+            is_reduction.append(False)
+
+        else:
+            raise _UnvectorizableError()
+
+    loop = _VectorizedLoop(iname, lbound, ubound)
+
+    result = []
+    vector_temporaries = {}
+
+    for assignment, assignment_is_reduction in zip(assignments, is_reduction):
+        reduction_inames = assignment.reduction_inames
+        if assignment_is_reduction:
+            reduction_inames = reduction_inames | {iname}
+
+        new_assignment = NumpyAssignment(assignment.codegen_state,
+                assignment.insn, (loop,) + assignment.loops,
+                frozenset(reduction_inames), dict(vector_temporaries))
+
+        assignee_name = _get_assignee_name(assignment.insn.assignee)
+        if new_assignment.assignee_axes is not None:
+            vector_temporaries[assignee_name] = new_assignment.assignee_axes
+        else:
+            vector_temporaries.pop(assignee_name, None)
+
+        result.append(new_assignment)
+
+    return result
+
+# }}}
+
+
+# {{{ ast builder
+
+class NumpyASTBuilder(PythonASTBuilderBase):
+    """Generates Python code operating on :mod:`numpy` arrays. If
+    :attr:`NumpyTarget.vectorize` is set, loops whose bodies consist of
+    assignments that can be computed for all iterations at once are
+    replaced by operations on array slices (see :func:`vectorize_loop`).
+    """
+
+    @property
+    def known_callables(self):
+        callables = super().known_callables
+        callables.update(get_numpy_callables())
+        return callables
+
+    def symbol_manglers(self):
+        return (
+                super().symbol_manglers() + [
+                    numpy_symbol_mangler
+                    ])
+
+    def get_expression_to_code_mapper(self, codegen_state):
+        return ExpressionToNumpyMapper(codegen_state)
+
+    def emit_sequential_loop(self, codegen_state, iname, iname_dtype,
+            lbound, ubound, inner):
+        assignments = _get_numpy_assignments(inner)
+
+        if self.target.vectorize and assignments:
+            try:
+                return Collection(vectorize_loop(
+                    codegen_state, iname, lbound, ubound, assignments))
+            except _UnvectorizableError:
+                pass
+
+        return super().emit_sequential_loop(codegen_state, iname, iname_dtype,
+                lbound, ubound, inner)
+
+    def emit_assignment(self, codegen_state, insn):
+        if insn.atomicity:
+            raise NotImplementedError("atomic ops in Python")
+
+        return NumpyAssignment(codegen_state, insn)
+
+# }}}
+
+
+# {{{ target
+
+class NumpyTarget(TargetBase):
+    """A target for executing kernels as Python code operating on
+    :mod:`numpy` arrays. Calling a :class:`loopy.TranslationUnit` with this
+    target runs its entrypoint on the :class:`numpy.ndarray` arguments
+    passed in.
+
+    :arg vectorize: If *True* (the default), innermost loops whose iterations
+        are independent (or only combine into a sum, product, maximum or
+        minimum) and which access arrays by subscripts of the form
+        ``stride*iname + offset`` are implemented by whole-array operations
+        on slices, as are the loops enclosing such loops, where possible.
+        All other loops are executed as Python loops.
+    """
+
+    hash_fields = ("vectorize",)
+    comparison_fields = ("vectorize",)
+
+    def __init__(self, vectorize=True):
+        self.vectorize = vectorize
+
+    def split_kernel_at_global_barriers(self):
+        return False
+
+    def get_host_ast_builder(self):
+        return DummyHostASTBuilder(self)
+
+    def get_device_ast_builder(self):
+        return NumpyASTBuilder(self)
+
+    # {{{ types
+
+    @memoize_method
+    def get_dtype_registry(self):
+        from loopy.target.c import DTypeRegistryWrapper
+        from loopy.target.c.compyte.dtypes import (
+                DTypeRegistry, fill_registry_with_c_types)
+        result = DTypeRegistry()
+        fill_registry_with_c_types(result, respect_windows=False,
+                include_bool=True)
+        return DTypeRegistryWrapper(result)
+
+    def is_vector_dtype(self, dtype):
+        return False
+
+    def get_vector_dtype(self, base, count):
+        raise KeyError()
+
+    def get_or_register_dtype(self, names, dtype=None):
+        # These kind of shouldn't be here.
+        return self.get_dtype_registry().get_or_register_dtype(names, dtype)
+
+    def dtype_to_typename(self, dtype):
+        # These kind of shouldn't be here.
+        return self.get_dtype_registry().dtype_to_ctype(dtype)
+
+    # }}}
+
+    def get_kernel_executor_cache_key(self, *args, **kwargs):
+        return None
+
+    def get_kernel_executor(self, t_unit, *args, **kwargs):
+        from loopy.target.numpy_execution import NumpyKernelExecutor
+        return NumpyKernelExecutor(t_unit, entrypoint=kwargs.pop("entrypoint"))
+
+# }}}
+
+# vim: foldmethod=marker
@@ -0,0 +1,160 @@
+__copyright__ = "Copyright (C) 2021 University of Illinois Board of Trustees"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from pytools import memoize_method
+from pytools.py_codegen import Indentation
+
+from loopy.target.execution import (KernelExecutorBase, _KernelInfo,
+        ExecutionWrapperGeneratorBase, get_highlighted_python_code)
+from loopy.target.c.c_execution import CExecutionWrapperGenerator
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class NumpyExecutionWrapperGenerator(CExecutionWrapperGenerator):
+    """
+    Specialized form of the :class:`ExecutionWrapperGeneratorBase` for
+    execution of Python code generated by :class:`loopy.NumpyTarget`.
+    Arguments are handled as for the C target.
+    """
+
+    def __init__(self):
+        system_args = ["_lpy_numpy_kernels"]
+        ExecutionWrapperGeneratorBase.__init__(self, system_args)
+
+    # {{{ generate invocation
+
+    def generate_invocation(self, gen, kernel_name, args,
+            kernel, implemented_data_info):
+        gen("for _lpy_knl in _lpy_numpy_kernels:")
+        with Indentation(gen):
+            gen("_lpy_knl({args})".format(
+                args=", ".join(args)))
+
+    # }}}
+
+
+class NumpyKernelExecutor(KernelExecutorBase):
+    """An object connecting a kernel to the Python functions generated for
+    it by :class:`loopy.NumpyTarget` for execution.
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    .. automethod:: bind
+    """
+
+    def get_invoker_uncached(self, kernel, entrypoint, codegen_result):
+        generator = NumpyExecutionWrapperGenerator()
+        return generator(kernel, entrypoint, codegen_result)
+
+    def get_wrapper_generator(self):
+        return NumpyExecutionWrapperGenerator()
+
+    def load_device_code(self, entrypoint, dev_code):
+        """Execute the generated Python code *dev_code* and return the
+        resulting namespace.
+        """
+        namespace = {}
+        exec(compile(dev_code, f"<generated numpy code for '{entrypoint}'>",
+            "exec"), namespace)
+        return namespace
+
+    @memoize_method
+    def program_info(self, entrypoint, arg_to_dtype_set=frozenset(),
+            all_kwargs=None):
+        program = self.get_typed_and_scheduled_translation_unit(
+                entrypoint, arg_to_dtype_set)
+
+        from loopy.codegen import generate_code_v2
+        codegen_result = generate_code_v2(program)
+
+        dev_code = codegen_result.device_code()
+
+        options = self.program[entrypoint].options
+        if options.write_cl:
+            output = dev_code
+            if options.highlight_cl:
+                output = get_highlighted_python_code(output)
+
+            if options.write_cl is True:
+                print(output)
+            else:
+                with open(options.write_cl, "w") as outf:
+                    outf.write(output)
+
+        if options.edit_cl:
+            from pytools import invoke_editor
+            dev_code = invoke_editor(dev_code, "code.py")
+
+        namespace = self.load_device_code(entrypoint, dev_code)
+
+        # Only the device programs of *entrypoint* are invoked, not those of
+        # its callees or of other entrypoints.
+        from loopy.schedule import CallKernel
+        entrypoint_dev_prog_names = {
+                sched_item.kernel_name
+                for sched_item in program[entrypoint].linearization
+                if isinstance(sched_item, CallKernel)}
+
+        numpy_kernels = [
+                namespace[dp.name]
+                for dp in codegen_result.device_programs
+                if dp.name in entrypoint_dev_prog_names]
+
+        return _KernelInfo(
+                program=program,
+                numpy_kernels=numpy_kernels,
+                implemented_data_info=codegen_result.implemented_data_infos[
+                    entrypoint],
+                invoker=self.get_invoker(program, entrypoint, codegen_result))
+
+    def get_kernel_info_and_system_args(self, entrypoint, arg_to_dtype_set,
+            *args):
+        program_info = self.program_info(entrypoint, arg_to_dtype_set)
+        return program_info, (program_info.numpy_kernels,) + args
+
+    def __call__(self, *args, entrypoint=None, **kwargs):
+        """
+        :returns: ``(None, output)`` the output is a tuple of output arguments
+            (arguments that are written as part of the kernel). The order is given
+            by the order of kernel arguments. If this order is unspecified
+            (such as when kernel arguments are inferred automatically),
+            enable :attr:`loopy.Options.return_dict` to make *output* a
+            :class:`dict` instead, with keys of argument names and values
+            of the returned arrays.
+        """
+        assert entrypoint is not None
+
+        if __debug__:
+            self.check_for_required_array_arguments(kwargs.keys())
+
+        if self.packing_controller is not None:
+            kwargs = self.packing_controller(kwargs)
+
+        program_info = self.program_info(entrypoint,
+                self.arg_to_dtype_set(kwargs))
+
+        return program_info.invoker(
+                program_info.numpy_kernels, *args, **kwargs)
+
+# vim: foldmethod=marker
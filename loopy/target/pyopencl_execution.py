@@ -25,6 +25,8 @@ from pytools import memoize_method
 from pytools.py_codegen import Indentation
 from loopy.target.execution import (
     KernelExecutorBase, ExecutionWrapperGeneratorBase, _KernelInfo, _Kernels)
+from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
+from loopy.version import DATA_MODEL_VERSION
 import logging
 logger = logging.getLogger(__name__)
 
@@ -248,12 +250,116 @@ class PyOpenCLExecutionWrapperGenerator(ExecutionWrapperGeneratorBase):
 
 # {{{ kernel executor
 
+# {{{ program binary cache
+
+cl_program_binary_cache = LoopyWriteOncePersistentDict(
+        "loopy-cl-program-binary-cache-v1-"+DATA_MODEL_VERSION,
+        key_builder=LoopyKeyBuilder())
+
+
+def _get_device_cache_key(device):
+    platform = device.platform
+    return (platform.vendor, platform.version,
+            device.vendor, device.name, device.version, device.driver_version)
+
+
+def _build_program_from_binaries(context, binaries, options):
+    import pyopencl as cl
+    try:
+        return (
+                cl.Program(context, context.devices, binaries)
+                .build(options=options))
+    except cl.Error as e:
+        logger.debug("building program from cached binaries failed: %s" % e)
+        return None
+
+
+def build_cl_program(context, dev_code, options):
+    """Return a :class:`pyopencl.Program` built from the source *dev_code*
+    with the build options *options* for all devices of *context*.
+
+    The binaries of the built program are kept in
+    :data:`cl_program_binary_cache`, keyed by the source, the devices (and
+    their drivers) and the build options, so that other processes may create
+    the program from them instead of compiling the source. Concurrent builds
+    of the same program in several processes are serialized by a lock file,
+    so that only one of them compiles it.
+    """
+    import pyopencl as cl
+    from loopy import CACHING_ENABLED
+
+    if options is None:
+        options = []
+    elif isinstance(options, str):
+        options = options.split()
+
+    if not CACHING_ENABLED:
+        return cl.Program(context, dev_code).build(options=options)
+
+    from loopy.instrumentation import note_pass_cache_hit
+
+    cache_key = (dev_code,
+            tuple(_get_device_cache_key(dev) for dev in context.devices),
+            tuple(options))
+
+    def get_cached_program():
+        try:
+            binaries = cl_program_binary_cache[cache_key]
+        except KeyError:
+            return None
+
+        return _build_program_from_binaries(context, binaries, options)
+
+    cl_program = get_cached_program()
+    if cl_program is not None:
+        note_pass_cache_hit(True)
+        return cl_program
+
+    import os
+    from pytools.persistent_dict import CleanupManager, LockManager
+
+    lock_file = os.path.join(cl_program_binary_cache.container_dir,
+            "build-lock-%s" % cl_program_binary_cache.key_builder(cache_key))
+
+    cleanup_m = CleanupManager()
+    try:
+        try:
+            LockManager(cleanup_m, lock_file)
+
+            # Another process may have built the program while we were
+            # waiting for the lock.
+            cl_program = get_cached_program()
+            if cl_program is not None:
+                note_pass_cache_hit(True)
+                return cl_program
+
+            logger.debug("program binary cache miss")
+            note_pass_cache_hit(False)
+
+            cl_program = cl.Program(context, dev_code).build(options=options)
+
+            binaries = cl_program.binaries
+            if all(binaries):
+                cl_program_binary_cache.store_if_not_present(
+                        cache_key, binaries)
+        except Exception:
+            cleanup_m.error_clean_up()
+            raise
+    finally:
+        cleanup_m.clean_up()
+
+    return cl_program
+
+# }}}
+
+
 class PyOpenCLKernelExecutor(KernelExecutorBase):
     """An object connecting a kernel to a :class:`pyopencl.Context`
     for execution.
 
     .. automethod:: __init__
     .. automethod:: __call__
+    .. automethod:: bind
     """
 
     def __init__(self, context, program, entrypoint):
@@ -306,12 +412,12 @@ class PyOpenCLKernelExecutor(KernelExecutorBase):
             from pytools import invoke_editor
             dev_code = invoke_editor(dev_code, "code.cl")
 
-        import pyopencl as cl
+        from loopy.instrumentation import record_pass
 
         #FIXME: redirect to "translation unit" level option as well.
-        cl_program = (
-                cl.Program(self.context, dev_code)
-                .build(options=program[entrypoint].options.cl_build_options))
+        with record_pass("build_cl_program", entrypoint):
+            cl_program = build_cl_program(self.context, dev_code,
+                    program[entrypoint].options.cl_build_options)
 
         cl_kernels = _Kernels()
         for dp in cl_program.kernel_names.split(";"):
@@ -324,6 +430,27 @@ class PyOpenCLKernelExecutor(KernelExecutorBase):
                     entrypoint],
                 invoker=self.get_invoker(program, entrypoint, codegen_result))
 
+    def get_kernel_info_and_system_args(self, entrypoint, arg_to_dtype_set,
+            queue, allocator=None, wait_for=None, out_host=None):
+        translation_unit_info = self.translation_unit_info(entrypoint,
+                arg_to_dtype_set)
+
+        return translation_unit_info, (translation_unit_info.cl_kernels,
+                queue, allocator, wait_for, out_host)
+
+    def bind(self, queue, *,
+            allocator=None, wait_for=None, out_host=None, entrypoint=None,
+            **kwargs):
+        """Resolve the generated code of *entrypoint* for the arguments
+        *kwargs* once. The arguments have the same meaning as for
+        :meth:`__call__`.
+
+        :returns: a :class:`loopy.BoundKernelCall`, each call of which
+            enqueues the kernel into *queue*.
+        """
+        return super().bind(queue, allocator, wait_for, out_host,
+                entrypoint=entrypoint, **kwargs)
+
     def __call__(self, queue, *,
             allocator=None, wait_for=None, out_host=None, entrypoint=None,
             **kwargs):
@@ -66,6 +66,12 @@ class ExpressionToPythonMapper(StringifyMapper):
             return super().map_variable(
                     expr, enclosing_prec)
 
+        if expr.name not in self.kernel.all_variable_names():
+            mangle_result = self.kernel.mangle_symbol(
+                    self.codegen_state.ast_builder, expr.name)
+            if mangle_result is not None:
+                return mangle_result[1]
+
         var_descr = self.kernel.get_var_descriptor(expr.name)
         if isinstance(var_descr, ValueArg):
             return super().map_variable(
@@ -225,6 +231,7 @@ class PythonASTBuilderBase(ASTBuilderBase):
         from pymbolic.mapper.stringifier import PREC_NONE, PREC_SUM
         from genpy import For
 
+        # genpy does not indent a Collection serving as the body of a loop.
         return For(
                 (iname,),
                 "range(%s, %s + 1)"
@@ -232,7 +239,7 @@ class PythonASTBuilderBase(ASTBuilderBase):
                     ecm(lbound, PREC_NONE, "i"),
                     ecm(ubound, PREC_SUM, "i"),
                     ),
-                inner)
+                Suite(inner))
 
     def emit_initializer(self, codegen_state, dtype, name, val_str, is_const):
         from genpy import Assign
@@ -252,7 +259,7 @@ class PythonASTBuilderBase(ASTBuilderBase):
 
     def emit_if(self, condition_str, ast):
         from genpy import If
-        return If(condition_str, ast)
+        return If(condition_str, Suite(ast))
 
     def emit_assignment(self, codegen_state, insn):
         ecm = codegen_state.expression_to_code_mapper
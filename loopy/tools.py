@@ -24,11 +24,13 @@ import collections.abc as abc
 
 import numpy as np
 from pytools import memoize_method
-from pytools.persistent_dict import KeyBuilder as KeyBuilderBase
+from pytools.persistent_dict import (
+        KeyBuilder as KeyBuilderBase, WriteOncePersistentDict)
 from loopy.symbolic import WalkMapper as LoopyWalkMapper
 from pymbolic.mapper.persistent_hash import (
         PersistentHashWalkMapper as PersistentHashWalkMapperBase)
 from sys import intern
+from weakref import WeakValueDictionary
 
 
 def is_integer(obj):
@@ -142,6 +144,534 @@ class PymbolicExpressionHashWrapper:
 # }}}
 
 
+# {{{ persistent dict with in-memory tier
+
+def _get_default_in_mem_cache_size():
+    import os
+    return int(os.environ.get("LOOPY_IN_MEM_CACHE_SIZE", 256))
+
+
+def parse_size(size):
+    """Return the number of bytes denoted by *size*, which may be an
+    :class:`int` or a string such as ``"1024"``, ``"500M"`` or ``"2G"``.
+    """
+    if is_integer(size):
+        return int(size)
+
+    size = size.strip().upper()
+    if size.endswith("B"):
+        size = size[:-1]
+
+    for i, suffix in enumerate(["K", "M", "G", "T"]):
+        if size.endswith(suffix):
+            return int(float(size[:-1]) * 1024**(i+1))
+
+    return int(size)
+
+
+def _get_default_max_disk_size():
+    import os
+    max_size = os.environ.get("LOOPY_CACHE_MAX_SIZE")
+    if max_size is None:
+        return None
+    return parse_size(max_size)
+
+
+class CacheStats:
+    """Counters and timings gathered by a :class:`LoopyWriteOncePersistentDict`
+    since its creation (or the last call to :func:`loopy.reset_cache_stats`).
+
+    .. attribute:: identifier
+
+    .. attribute:: mem_hits
+
+        Number of lookups served by the in-memory tier.
+
+    .. attribute:: disk_hits
+
+        Number of lookups served by the underlying persistent dictionary.
+
+    .. attribute:: misses
+
+    .. attribute:: stores
+
+        Number of calls to
+        :meth:`~pytools.persistent_dict.WriteOncePersistentDict.store`,
+        including those that found the entry already present.
+
+    .. attribute:: bytes_read
+
+    .. attribute:: bytes_written
+
+    .. attribute:: hash_time
+
+        Seconds spent computing persistent hashes of keys.
+
+    .. attribute:: load_time
+
+        Seconds spent reading and unpickling keys and values from disk.
+
+    .. attribute:: store_time
+
+        Seconds spent pickling and writing keys and values to disk.
+
+    .. attribute:: recompute_time
+
+        Seconds elapsed between a miss and the subsequent store of the same
+        key, i.e. the time spent recomputing the value that was not found.
+
+    .. autoattribute:: hits
+    """
+
+    fields = ("mem_hits", "disk_hits", "misses", "stores",
+            "bytes_read", "bytes_written",
+            "hash_time", "load_time", "store_time", "recompute_time")
+
+    def __init__(self, identifier):
+        self.identifier = identifier
+        self.reset()
+
+    def reset(self):
+        for field in self.fields:
+            setattr(self, field, 0)
+
+    @property
+    def hits(self):
+        return self.mem_hits + self.disk_hits
+
+    def copy(self):
+        result = type(self)(self.identifier)
+        for field in self.fields:
+            setattr(result, field, getattr(self, field))
+        return result
+
+    def __repr__(self):
+        return "{}({}: {})".format(
+                type(self).__name__, self.identifier,
+                ", ".join(f"{field}={getattr(self, field)!r}"
+                    for field in self.fields))
+
+    def __str__(self):
+        return (
+                f"{self.identifier}: "
+                f"{self.hits} hits ({self.mem_hits} in memory), "
+                f"{self.misses} misses, {self.stores} stores, "
+                f"{self.bytes_read} B read, {self.bytes_written} B written, "
+                f"{self.hash_time:.3f} s hashing, "
+                f"{self.load_time:.3f} s loading, "
+                f"{self.store_time:.3f} s storing, "
+                f"{self.recompute_time:.3f} s recomputing")
+
+
+class _TimingKeyBuilder:
+    def __init__(self, key_builder, stats):
+        self.key_builder = key_builder
+        self.stats = stats
+
+    def __call__(self, key):
+        from time import perf_counter
+        start = perf_counter()
+        try:
+            return self.key_builder(key)
+        finally:
+            self.stats.hash_time += perf_counter() - start
+
+    def __getattr__(self, name):
+        return getattr(self.key_builder, name)
+
+
+# maps identifiers to instances of LoopyWriteOncePersistentDict
+_persistent_dicts = WeakValueDictionary()
+
+
+def cache_stats():
+    """Return a :class:`dict` mapping the identifiers of :mod:`loopy`'s
+    persistent caches to snapshots of their :class:`loopy.tools.CacheStats`.
+
+    Example::
+
+        for stats in lp.cache_stats().values():
+            print(stats)
+    """
+    return {identifier: pdict.stats.copy()
+            for identifier, pdict in sorted(_persistent_dicts.items())}
+
+
+def reset_cache_stats():
+    """Reset the counters returned by :func:`cache_stats` to zero."""
+    for pdict in list(_persistent_dicts.values()):
+        pdict.stats.reset()
+
+
+class LoopyWriteOncePersistentDict(WriteOncePersistentDict):
+    """A :class:`pytools.persistent_dict.WriteOncePersistentDict` with
+    configurable defaults for the sizes of its in-memory tier and of its
+    on-disk entries.
+
+    The in-memory tier holds the at most *in_mem_cache_size* values most
+    recently read from disk, keyed (like the on-disk entries) by the
+    persistent hashes of their keys. A hit in this tier avoids reading and
+    unpickling the stored value. *in_mem_cache_size* defaults to the value of
+    the environment variable :envvar:`LOOPY_IN_MEM_CACHE_SIZE` (or 256 if
+    unset). A size of 0 disables the in-memory tier.
+
+    If *max_disk_size* (in bytes) is given, the on-disk entries are pruned
+    to at most 80% of that size, least recently used first, whenever
+    storing a value makes them exceed it. It defaults to the value of the
+    environment variable :envvar:`LOOPY_CACHE_MAX_SIZE` (parsed by
+    :func:`parse_size`, e.g. ``500M``), or no limit if unset.
+
+    .. attribute:: stats
+
+        A :class:`CacheStats` instance accumulating statistics on the use of
+        this dictionary. See also :func:`loopy.cache_stats`.
+
+    .. automethod:: clear_in_mem_cache
+    .. automethod:: disk_usage
+    .. automethod:: prune
+    """
+
+    def __init__(self, identifier, key_builder=None, container_dir=None,
+            in_mem_cache_size=None, max_disk_size=None):
+        if in_mem_cache_size is None:
+            in_mem_cache_size = _get_default_in_mem_cache_size()
+        if max_disk_size is None:
+            max_disk_size = _get_default_max_disk_size()
+
+        WriteOncePersistentDict.__init__(self, identifier,
+                key_builder=key_builder, container_dir=container_dir,
+                in_mem_cache_size=in_mem_cache_size)
+
+        self.stats = CacheStats(identifier)
+        self.key_builder = _TimingKeyBuilder(self.key_builder, self.stats)
+
+        # records whether the current thread's fetch read from disk
+        import threading
+        self._thread_state = threading.local()
+
+        # maps id(key) to (key, time of the miss) for keys that missed and
+        # have not yet been stored
+        self._pending_misses = {}
+
+        self.max_disk_size = max_disk_size
+        # estimate of the size of the on-disk entries, computed lazily
+        self._disk_size = None
+
+        _persistent_dicts[identifier] = self
+
+    def _read(self, path):
+        from os.path import getsize
+        from time import perf_counter
+        start = perf_counter()
+        result = WriteOncePersistentDict._read(path)
+        self.stats.load_time += perf_counter() - start
+        self._thread_state.read_from_disk = True
+        self.stats.bytes_read += getsize(path)
+
+        if path.endswith("contents"):
+            # record the use of the entry for least-recently-used pruning
+            import os
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        return result
+
+    def _write(self, path, value):
+        from os.path import getsize
+        from time import perf_counter
+        start = perf_counter()
+        WriteOncePersistentDict._write(path, value)
+        self.stats.store_time += perf_counter() - start
+
+        nbytes = getsize(path)
+        self.stats.bytes_written += nbytes
+        if self._disk_size is not None:
+            self._disk_size += nbytes
+
+    def fetch(self, key, _stacklevel=0):
+        self._thread_state.read_from_disk = False
+
+        try:
+            result = WriteOncePersistentDict.fetch(self, key,
+                    _stacklevel=1 + _stacklevel)
+        except KeyError:
+            self.stats.misses += 1
+
+            from time import perf_counter
+            if len(self._pending_misses) > 1024:
+                # values that were never stored, e.g. due to errors
+                self._pending_misses.clear()
+            self._pending_misses[id(key)] = (key, perf_counter())
+            raise
+
+        if self._thread_state.read_from_disk:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.mem_hits += 1
+
+        return result
+
+    def store(self, key, value, _skip_if_present=False, _stacklevel=0):
+        pending_miss = self._pending_misses.pop(id(key), None)
+        if pending_miss is not None and pending_miss[0] is key:
+            from time import perf_counter
+            self.stats.recompute_time += perf_counter() - pending_miss[1]
+
+        self.stats.stores += 1
+
+        WriteOncePersistentDict.store(self, key, value,
+                _skip_if_present=_skip_if_present,
+                _stacklevel=1 + _stacklevel)
+
+        if self.max_disk_size is not None:
+            if self._disk_size is None:
+                self._disk_size, _ = self.disk_usage()
+            if self._disk_size > self.max_disk_size:
+                self.prune(max_size=int(0.8*self.max_disk_size))
+
+    def clear_in_mem_cache(self):
+        """Discard the in-memory tier, leaving the on-disk entries intact."""
+        self._cache.clear()
+
+    def clear(self):
+        WriteOncePersistentDict.clear(self)
+        self.clear_in_mem_cache()
+        self._disk_size = None
+
+    def disk_usage(self):
+        """Return a tuple ``(nbytes, nentries)`` describing the entries of
+        this dictionary on disk.
+        """
+        entries = list(_iter_disk_entries(self.container_dir))
+        return sum(size for _, size, _ in entries), len(entries)
+
+    def prune(self, max_size=None, max_age=None):
+        """Remove on-disk entries that were last used more than *max_age*
+        seconds ago, then remove the least recently used entries until at
+        most *max_size* bytes remain. Entries that are in use by another
+        process are skipped.
+
+        :returns: the number of bytes removed.
+        """
+        nbytes_removed, self._disk_size = _prune_container_dir(
+                self.container_dir, max_size=max_size, max_age=max_age)
+        return nbytes_removed
+
+# }}}
+
+
+# {{{ on-disk cache management
+
+def _iter_numba_modules(container_dir):
+    """Yield tuples ``(module_path, cache_paths)`` for the modules written to
+    *container_dir* by :class:`loopy.target.numba_execution.NumbaKernelExecutor`,
+    along with the files in which Numba caches their machine code.
+    """
+    import os
+
+    module_dir = os.path.join(container_dir, "numba")
+    pycache_dir = os.path.join(module_dir, "__pycache__")
+
+    try:
+        module_names = [name[:-3] for name in os.listdir(module_dir)
+                if name.endswith(".py")]
+    except OSError:
+        return
+
+    try:
+        cache_names = os.listdir(pycache_dir)
+    except OSError:
+        cache_names = []
+
+    for module_name in module_names:
+        yield (os.path.join(module_dir, module_name + ".py"),
+                [os.path.join(pycache_dir, name) for name in cache_names
+                    if name.startswith(module_name + ".")])
+
+
+def _iter_disk_entries(container_dir):
+    """Yield tuples ``(item_path, nbytes, last_use)`` for the entries of a
+    :class:`pytools.persistent_dict.WriteOncePersistentDict` stored in
+    *container_dir*, as well as for the Numba modules stored alongside them
+    (see :func:`_iter_numba_modules`).
+    """
+    import os
+
+    def subdirs(path):
+        try:
+            with os.scandir(path) as it:
+                return [entry.path for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+
+    def usage(paths):
+        nbytes = 0
+        last_use = 0
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            nbytes += st.st_size
+            last_use = max(last_use, st.st_mtime)
+
+        return nbytes, last_use
+
+    for dir1 in subdirs(container_dir):
+        for dir2 in subdirs(dir1):
+            for item_dir in subdirs(dir2):
+                yield (item_dir, *usage([
+                    os.path.join(item_dir, name)
+                    for name in ["key", "contents"]]))
+
+    for module_path, cache_paths in _iter_numba_modules(container_dir):
+        yield (module_path, *usage([module_path, *cache_paths]))
+
+
+def _remove_disk_entry(container_dir, item_path):
+    """Remove the entry at *item_path* unless it is locked by another
+    process.
+
+    :returns: *True* if the entry was removed.
+    """
+    import os
+    import shutil
+
+    rel_path = os.path.relpath(item_path, container_dir)
+    lock_file = os.path.join(container_dir, rel_path.replace(os.sep, "")
+            + ".lock")
+
+    try:
+        fd = os.open(lock_file, os.O_CREAT | os.O_WRONLY | os.O_EXCL)
+    except OSError:
+        return False
+
+    try:
+        if os.path.isdir(item_path):
+            shutil.rmtree(item_path, ignore_errors=True)
+        else:
+            # a Numba module: remove its machine code first, so that it is
+            # never found without its module
+            module_dir, module_file = os.path.split(item_path)
+            pycache_dir = os.path.join(module_dir, "__pycache__")
+            try:
+                cache_names = os.listdir(pycache_dir)
+            except OSError:
+                cache_names = []
+
+            for path in [
+                    *(os.path.join(pycache_dir, name) for name in cache_names
+                        if name.startswith(module_file[:-3] + ".")),
+                    item_path]:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+    finally:
+        os.close(fd)
+        os.unlink(lock_file)
+
+    return True
+
+
+def _prune_container_dir(container_dir, max_size=None, max_age=None):
+    """
+    :returns: a tuple ``(nbytes_removed, nbytes_remaining)``.
+    """
+    from time import time
+
+    entries = sorted(_iter_disk_entries(container_dir),
+            key=lambda entry: entry[2])
+
+    total_size = sum(nbytes for _, nbytes, _ in entries)
+    nbytes_removed = 0
+    now = time()
+
+    for item_path, nbytes, last_use in entries:
+        too_old = max_age is not None and now - last_use > max_age
+        too_big = (max_size is not None
+                and total_size - nbytes_removed > max_size)
+        if not (too_old or too_big):
+            if max_age is None:
+                # entries are sorted by last use, nothing left to do
+                break
+            continue
+
+        if _remove_disk_entry(container_dir, item_path):
+            nbytes_removed += nbytes
+
+    return nbytes_removed, total_size - nbytes_removed
+
+
+def get_cache_root():
+    """Return the directory containing the on-disk caches of :mod:`loopy`
+    (as well as those of other users of :mod:`pytools.persistent_dict`).
+    """
+    import appdirs
+    return appdirs.user_cache_dir("pytools", "pytools")
+
+
+def get_cache_dirs(cache_root=None):
+    """Return a list of tuples ``(container_dir, is_current)`` for each of
+    :mod:`loopy`'s on-disk caches found in *cache_root* (by default,
+    :func:`get_cache_root`). *is_current* is *False* for caches created by
+    versions of :mod:`loopy` whose
+    :data:`~loopy.version.DATA_MODEL_VERSION` differs from the present one.
+    Their contents can never be used again by this version of :mod:`loopy`.
+    """
+    import os
+    from loopy.version import DATA_MODEL_VERSION
+
+    if cache_root is None:
+        cache_root = get_cache_root()
+
+    try:
+        names = sorted(os.listdir(cache_root))
+    except OSError:
+        return []
+
+    return [
+            (os.path.join(cache_root, name),
+                f"-{DATA_MODEL_VERSION}-py" in name)
+            for name in names
+            if name.startswith("pdict-v4-loopy-")
+            and os.path.isdir(os.path.join(cache_root, name))]
+
+
+def prune_caches(max_size=None, max_age=None, remove_stale=True,
+        cache_root=None):
+    """Reclaim disk space used by :mod:`loopy`'s on-disk caches.
+
+    :arg max_size: if given, the maximum number of bytes to retain per
+        cache, least recently used entries are removed first.
+    :arg max_age: if given, entries last used more than *max_age* seconds
+        ago are removed.
+    :arg remove_stale: if *True*, remove caches belonging to other versions of
+        :mod:`loopy` entirely. See :func:`get_cache_dirs`.
+    :returns: the number of bytes removed.
+    """
+    import shutil
+
+    nbytes_removed = 0
+    for container_dir, is_current in get_cache_dirs(cache_root):
+        if not is_current and remove_stale:
+            nbytes_removed += sum(
+                    nbytes for _, nbytes, _ in _iter_disk_entries(container_dir))
+            shutil.rmtree(container_dir, ignore_errors=True)
+        else:
+            nbytes_removed += _prune_container_dir(container_dir,
+                    max_size=max_size, max_age=max_age)[0]
+
+    for pdict in list(_persistent_dicts.values()):
+        pdict._disk_size = None
+
+    return nbytes_removed
+
+# }}}
+
+
 # {{{ eq key builder
 
 class LoopyEqKeyBuilder:
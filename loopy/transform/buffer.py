@@ -26,8 +26,8 @@ from loopy.symbolic import (get_dependencies,
         RuleAwareIdentityMapper, SubstitutionRuleMappingContext,
         SubstitutionMapper)
 from pymbolic.mapper.substitutor import make_subst_func
-from pytools.persistent_dict import WriteOncePersistentDict
-from loopy.tools import LoopyKeyBuilder, PymbolicExpressionHashWrapper
+from loopy.tools import (LoopyKeyBuilder, LoopyWriteOncePersistentDict,
+        PymbolicExpressionHashWrapper)
 from loopy.version import DATA_MODEL_VERSION
 from loopy.diagnostic import LoopyError
 from loopy.kernel import LoopKernel
@@ -124,7 +124,7 @@ class ArrayAccessReplacer(RuleAwareIdentityMapper):
 # }}}
 
 
-buffer_array_cache = WriteOncePersistentDict(
+buffer_array_cache = LoopyWriteOncePersistentDict(
         "loopy-buffer-array-cache-"+DATA_MODEL_VERSION,
         key_builder=LoopyKeyBuilder())
 
@@ -183,6 +183,10 @@ def privatize_temporaries_with_inames(
 
     from loopy.kernel.data import VectorizeTag
 
+    # Vectorized inames implemented as SIMD loops need no vector types.
+    use_vec_dim_tags = not (
+            kernel.target.get_device_ast_builder().can_implement_simd_loops)
+
     new_temp_vars = kernel.temporary_variables.copy()
     for tv_name, inames in var_to_new_priv_axis_iname.items():
         tv = new_temp_vars[tv_name]
@@ -194,7 +198,8 @@ def privatize_temporaries_with_inames(
 
         dim_tags = ["c"] * (len(shape) + len(extra_shape))
         for i, iname in enumerate(inames):
-            if kernel.iname_tags_of_type(iname, VectorizeTag):
+            if (use_vec_dim_tags
+                    and kernel.iname_tags_of_type(iname, VectorizeTag)):
                 dim_tags[len(shape) + i] = "vec"
 
         new_temp_vars[tv.name] = tv.copy(shape=shape + extra_shape,
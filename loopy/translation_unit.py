@@ -158,6 +158,7 @@ class TranslationUnit(ImmutableRecord):
         of :class:`loopy.kernel.function_interface.InKernelCallable` or *None*.
 
     .. automethod:: __call__
+    .. automethod:: bind
     .. automethod:: copy
     .. automethod:: __getitem__
     .. automethod:: with_kernel
@@ -305,14 +306,7 @@ class TranslationUnit(ImmutableRecord):
                              " The default entrypoint kernel is not uniquely"
                              " determined.")
 
-    def __call__(self, *args, **kwargs):
-        """
-        Builds and calls the *entrypoint* kernel, if
-        :attr:`TranslationUnit.target` is an executable target.
-
-        :arg entrypoint: The name of the entrypoint callable to be called.
-            Defaults to :attr:`default_entrypoint`.
-        """
+    def _resolve_call_entrypoint(self, kwargs):
         entrypoint = kwargs.get("entrypoint", None)
         if entrypoint is None:
             if len(self.entrypoints) == 1:
@@ -332,14 +326,52 @@ class TranslationUnit(ImmutableRecord):
 
         kwargs["entrypoint"] = entrypoint
 
+    def __call__(self, *args, **kwargs):
+        """
+        Builds and calls the *entrypoint* kernel, if
+        :attr:`TranslationUnit.target` is an executable target.
+
+        :arg entrypoint: The name of the entrypoint callable to be called.
+            Defaults to :attr:`default_entrypoint`.
+        """
+        self._resolve_call_entrypoint(kwargs)
+
+        pex = self._get_kernel_executor(*args, **kwargs)
+
+        return pex(*args, **kwargs)
+
+    def bind(self, *args, **kwargs):
+        """
+        Builds the *entrypoint* kernel for the arguments passed, as
+        :meth:`__call__` would, and returns a :class:`loopy.BoundKernelCall`
+        that invokes it with these arguments, without repeating the
+        resolution of the kernel's generated code for each call. Some of
+        the arguments may be replaced in each call of the result, e.g.::
+
+            knl_call = knl.bind(queue, a=a, out=out)
+            for a in arrays:
+                knl_call(a=a)
+
+        Several bound calls may be invoked together using a
+        :class:`loopy.KernelCallSequence`.
+
+        :arg entrypoint: The name of the entrypoint callable to be bound.
+            Defaults to :attr:`default_entrypoint`.
+        """
+        self._resolve_call_entrypoint(kwargs)
+
+        pex = self._get_kernel_executor(*args, **kwargs)
+
+        return pex.bind(*args, **kwargs)
+
+    def _get_kernel_executor(self, *args, **kwargs):
         key = self.target.get_kernel_executor_cache_key(*args, **kwargs)
         try:
-            pex = self._program_executor_cache[key]
+            return self._program_executor_cache[key]
         except KeyError:
             pex = self.target.get_kernel_executor(self, *args, **kwargs)
             self._program_executor_cache[key] = pex
-
-        return pex(*args, **kwargs)
+            return pex
 
     def __str__(self):
         # FIXME: do a topological sort by the call graph
@@ -356,6 +388,7 @@ class TranslationUnit(ImmutableRecord):
         super().__setstate__(state_obj)
 
         self._program_executor_cache = {}
+        self._hash_value = None
 
     def __hash__(self):
         if self._hash_value is not None:
@@ -668,6 +701,9 @@ def for_each_kernel(transform):
     LoopKernel, *args, **kwargs) -> LoopKernel``. Returns a function that would
     apply *transform* to all callable kernels in a :class:`loopy.TranslationUnit`.
     """
+    from loopy.instrumentation import instrumented_pass
+    instrumented_transform = instrumented_pass(transform)
+
     def _collective_transform(*args, **kwargs):
         if "translation_unit" in kwargs:
             t_unit_or_kernel = kwargs.pop("translation_unit")
@@ -682,7 +718,8 @@ def for_each_kernel(transform):
             new_callables = {}
             for func_id, clbl in t_unit.callables_table.items():
                 if isinstance(clbl, CallableKernel):
-                    new_subkernel = transform(clbl.subkernel, *args, **kwargs)
+                    new_subkernel = instrumented_transform(
+                            clbl.subkernel, *args, **kwargs)
                     clbl = clbl.copy(subkernel=new_subkernel)
                 elif isinstance(clbl, ScalarCallable):
                     pass
@@ -695,7 +732,7 @@ def for_each_kernel(transform):
         else:
             assert isinstance(t_unit_or_kernel, LoopKernel)
             kernel = t_unit_or_kernel
-            return transform(kernel, *args, **kwargs)
+            return instrumented_transform(kernel, *args, **kwargs)
 
     return wraps(transform)(_collective_transform)
 
@@ -37,6 +37,7 @@ from loopy.symbolic import (
         SubstitutionRuleMappingContext, SubArrayRef)
 from pymbolic.primitives import Variable, Subscript, Lookup
 from loopy.translation_unit import CallablesInferenceContext, make_clbl_inf_ctx
+from loopy.instrumentation import instrumented_pass
 
 import logging
 logger = logging.getLogger(__name__)
@@ -759,6 +760,7 @@ class _DictUnionView:
 
 # {{{ infer_unknown_types
 
+@instrumented_pass
 def infer_unknown_types_for_a_single_kernel(kernel, clbl_inf_ctx):
     """Infer types on temporaries and arguments."""
 
@@ -989,6 +991,7 @@ def infer_unknown_types_for_a_single_kernel(kernel, clbl_inf_ctx):
     return type_specialized_kernel, clbl_inf_ctx
 
 
+@instrumented_pass
 def infer_unknown_types(program, expect_completion=False):
     """Infer types on temporaries and arguments."""
     from loopy.kernel.data import auto
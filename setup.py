@@ -110,6 +110,9 @@ setup(name="loopy",
               "f2py>=0.3.1",
               "ply>=3.6",
               ],
+          "numba":  [
+              "numba",
+              ],
           },
 
       dependency_links=[
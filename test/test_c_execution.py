@@ -374,6 +374,307 @@ def test_scalar_global_args():
     assert out == (n*(n-1)/2)
 
 
+def test_c_openmp_group_axes():
+    from loopy.target.c import ExecutableCTarget
+
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<m}",
+            """
+            <> tmp = 2*a[i, j]
+            out[i, j] = tmp + 1
+            """,
+            [
+                lp.GlobalArg("a", np.float64, shape=("n", "m")),
+                "..."
+                ],
+            target=ExecutableCTarget(openmp=True))
+    knl = lp.split_iname(knl, "i", 4, outer_tag="g.0")
+    knl = lp.tag_inames(knl, "j:g.1")
+
+    code = lp.generate_code_v2(knl).device_code()
+    assert "#pragma omp parallel for collapse(2)" in code
+
+    a = np.random.default_rng().random((13, 7))
+    _, (out,) = knl(a=a)
+    assert np.allclose(out, 2*a + 1)
+
+    _, (out,) = knl(a=a, num_threads=2)
+    assert np.allclose(out, 2*a + 1)
+
+    knl_call = knl.bind(a=a, num_threads=2)
+    _, (out,) = knl_call()
+    assert np.allclose(out, 2*a + 1)
+
+    serial_knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]",
+            target=ExecutableCTarget())
+    with pytest.raises(lp.LoopyError):
+        serial_knl(a=a[0], num_threads=2)
+    with pytest.raises(lp.LoopyError):
+        serial_knl.bind(a=a[0], num_threads=2)
+
+    # not linked against the OpenMP runtime, as it has no parallel loops
+    no_omp_knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]",
+            target=ExecutableCTarget(openmp=True))
+    _, (out,) = no_omp_knl(a=a[0], num_threads=2)
+    assert np.allclose(out, 2*a[0])
+
+
+def test_c_openmp_simd():
+    from loopy.target.c import ExecutableCTarget
+
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<8}",
+            """
+            <> tmp = 2*a[i, j]
+            out[i, j] = tmp + 1
+            """,
+            [
+                lp.GlobalArg("a", np.float64, shape=("n", 8), alignment=16),
+                "..."
+                ],
+            target=ExecutableCTarget(openmp_simd=True))
+    knl = lp.tag_inames(knl, "j:vec")
+
+    code = lp.generate_code_v2(knl).device_code()
+    assert "#pragma omp simd safelen(8) aligned(a: 16)" in code
+
+    a = np.random.default_rng().random((13, 8))
+    _, (out,) = knl(a=a)
+    assert np.allclose(out, 2*a + 1)
+
+
+def test_c_build_translation_units():
+    from loopy.target.c import ExecutableCTarget
+    from loopy.target.c.c_execution import build_translation_units
+
+    target = ExecutableCTarget()
+
+    twice = lp.make_function(
+            "{[i]: 0<=i<10}",
+            "y[i] = 2*x[i]",
+            name="twice", target=target)
+    caller = lp.make_kernel(
+            "{[j]: 0<=j<10}",
+            "[j]: out[j] = twice([j]: a[j])",
+            [
+                lp.GlobalArg("a", np.float64, shape=(10,)),
+                lp.GlobalArg("out", np.float64, shape=(10,)),
+                ],
+            target=target)
+    caller = lp.merge([caller, twice])
+
+    thrice = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 3*a[i]",
+            [lp.GlobalArg("a", np.float64, shape="n"), "..."],
+            target=target)
+
+    build_translation_units([caller, thrice], max_workers=2)
+
+    a = np.random.default_rng().random(10)
+    _, (out,) = caller(a=a)
+    assert np.allclose(out, 2*a)
+    _, (out,) = thrice(a=a)
+    assert np.allclose(out, 3*a)
+
+
+def test_c_complex_scalar_arg():
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = c*a[i]",
+            [
+                lp.GlobalArg("a", np.complex128, shape="n"),
+                lp.ValueArg("c", np.complex128),
+                "..."
+                ],
+            target=lp.ExecutableCTarget())
+
+    a = np.random.default_rng().random(16) + 1j
+    for _ in range(2):
+        _, (out,) = knl(a=a, c=2+3j)
+        assert np.allclose(out, (2+3j)*a)
+
+
+def test_c_autotune(tmp_path):
+    from pytools.persistent_dict import PersistentDict
+    from loopy.autotune import autotune
+    from loopy.tools import LoopyKeyBuilder
+
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]",
+            [lp.GlobalArg("a", np.float64, shape="n"), "..."],
+            target=lp.ExecutableCTarget())
+    knl = lp.add_and_infer_dtypes(knl, {"a": np.float64})
+
+    def transform(t_unit, block_size, unroll):
+        t_unit = lp.split_iname(t_unit, "i", block_size)
+        if unroll:
+            if block_size > 4:
+                raise lp.LoopyError("unrolling too much")
+            t_unit = lp.tag_inames(t_unit, "i_inner:unr")
+        return t_unit
+
+    database = PersistentDict("loopy-test-autotune",
+            key_builder=LoopyKeyBuilder(), container_dir=str(tmp_path))
+    space = {"block_size": [4, 16], "unroll": [False, True]}
+    a = np.random.default_rng().random(1000)
+
+    result = autotune(knl, transform, space, {"a": a},
+            warmup=1, repeat=2, database=database)
+    assert not result.from_database
+    assert len(result.timings) == 4
+    assert sum(timing.times is None for timing in result.timings) == 1
+    _, (out,) = result.t_unit(a=a)
+    assert np.allclose(out, 2*a)
+
+    # similar problem size: found in the database
+    a = np.random.default_rng().random(1020)
+    cached_result = autotune(knl, transform, space, {"a": a},
+            database=database)
+    assert cached_result.from_database
+    assert cached_result.choice == result.choice
+    _, (out,) = cached_result.t_unit(a=a)
+    assert np.allclose(out, 2*a)
+
+    # variants failing in code generation are skipped
+    typed_knl = lp.add_and_infer_dtypes(knl, {"n": np.int32})
+    result = autotune(typed_knl,
+            lambda t_unit, tag: lp.tag_inames(t_unit, {"i": tag}),
+            {"tag": ["for", "l.0"]}, {"a": a},
+            warmup=1, repeat=2, database=False)
+    assert result.choice == {"tag": "for"}
+    failed_timing, = [
+            timing for timing in result.timings if timing.times is None]
+    assert failed_timing.choice == {"tag": "l.0"}
+    assert isinstance(failed_timing.error, lp.LoopyError)
+
+    # variants failing to compile are skipped, whether they are compiled
+    # ahead of timing (typed_knl) or on their first invocation (knl)
+    def add_preamble(t_unit, preamble):
+        if preamble is None:
+            return t_unit
+        return t_unit.with_kernel(t_unit.default_entrypoint.copy(
+                preambles=[("99_bogus", preamble)]))
+
+    from codepy import CompileError
+    for t_unit in [typed_knl, knl]:
+        result = autotune(t_unit, add_preamble,
+                {"preamble": [None, "#error bogus preamble"]}, {"a": a},
+                warmup=1, repeat=2, database=False)
+        assert result.choice == {"preamble": None}
+        failed_timing, = [
+                timing for timing in result.timings if timing.times is None]
+        assert isinstance(failed_timing.error, CompileError)
+
+
+def test_c_benchmark():
+    import json
+    from loopy.benchmark import benchmark
+
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]",
+            [lp.GlobalArg("a", np.float64, shape="n"), "..."],
+            target=lp.ExecutableCTarget())
+
+    a = np.random.default_rng().random(100)
+    result = benchmark(knl, {"a": a}, warmup=1, min_repeat=3, max_repeat=3)
+    assert result.name == "loopy_kernel"
+    assert result.nrepeat == 3
+    assert result.min <= result.median
+    assert result.iqr >= 0
+
+    # repeated until min_time is exceeded
+    result = benchmark(knl, {"a": a}, min_repeat=1, min_time=1e-3)
+    assert sum(result.times) >= 1e-3 or result.nrepeat == 1000
+
+    data = json.loads(result.to_json())
+    assert data["nrepeat"] == result.nrepeat
+    assert data["median"] == result.median
+
+
+def test_c_arg_signature_cache():
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<m}",
+            "out[i, j] = 2*a[i, j]",
+            [
+                lp.GlobalArg("a", np.float64, shape="n, m", offset=lp.auto,
+                    dim_tags="stride:auto,stride:auto"),
+                "..."],
+            target=lp.ExecutableCTarget())
+    knl = lp.set_options(knl, skip_arg_checks=False)
+
+    rng = np.random.default_rng()
+    a = rng.random((10, 12))
+
+    # arguments with the same signature are only checked once
+    for _ in range(2):
+        _, (out,) = knl(a=a)
+        assert np.allclose(out, 2*a)
+
+    # a transposed array differs in signature, so its strides get found
+    _, (out,) = knl(a=a.T)
+    assert np.allclose(out, 2*a.T)
+
+    with pytest.raises(TypeError):
+        knl(a=a.astype(np.int64))
+
+    with pytest.raises(TypeError):
+        knl(a=a, out=np.empty((10, 13)))
+
+    _, (out,) = knl(a=a[1:, 2:])
+    assert np.allclose(out, 2*a[1:, 2:])
+
+    _, (out,) = knl(a=a)
+    assert np.allclose(out, 2*a)
+
+
+def test_c_bound_kernel_call():
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]",
+            target=lp.ExecutableCTarget())
+    knl = lp.add_dtypes(knl, {"a": np.float64})
+
+    knl2 = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "b[i] = out[i] + 1",
+            target=lp.ExecutableCTarget())
+    knl2 = lp.add_dtypes(knl2, {"out": np.float64})
+
+    rng = np.random.default_rng()
+    a = rng.random(10)
+    out = np.empty(10)
+    b = np.empty(10)
+
+    knl_call = knl.bind(a=a, out=out)
+
+    _, (out_result,) = knl_call()
+    assert out_result is out
+    assert np.allclose(out, 2*a)
+
+    a2 = rng.random(10)
+    knl_call(a=a2)
+    assert np.allclose(out, 2*a2)
+
+    seq = lp.KernelCallSequence([knl_call, knl2.bind(out=out, b=b)])
+    assert seq.arg_names >= {"a", "b", "out"}
+
+    seq()
+    assert np.allclose(b, 2*a + 1)
+
+    seq(a=a2)
+    assert np.allclose(b, 2*a2 + 1)
+
+    with pytest.raises(TypeError):
+        seq(c=a)
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         exec(sys.argv[1])
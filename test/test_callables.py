@@ -984,6 +984,48 @@ def test_callee_with_parameter_and_grid(ctx_factory):
     np.testing.assert_allclose(out.get(), np.arange(10))
 
 
+def test_parallel_codegen_matches_sequential():
+    callees = [
+            lp.make_function(
+                "{[i]: 0<=i<10}",
+                "y[i] = %d*x[i]" % (k+2),
+                name="scale%d" % k)
+            for k in range(4)]
+
+    t_unit = lp.make_kernel(
+            "{[i]: 0<=i<10}",
+            "\n".join(
+                "[i]: y%d[i] = scale%d([i]: x[i])" % (k, k)
+                for k in range(4)),
+            [lp.GlobalArg("x", np.float64, shape=(10,)), ...])
+    t_unit = lp.merge([t_unit] + callees)
+
+    import warnings
+    from pytools.persistent_dict import CollisionWarning
+    from loopy.instrumentation import PassProfiler
+
+    # the serial and parallel translation units differ only in this option
+    serial_t_unit = lp.set_options(t_unit, codegen_processes=0)
+    parallel_t_unit = lp.set_options(t_unit, codegen_processes=4)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", CollisionWarning)
+
+        code = lp.generate_code_v2(serial_t_unit).device_code()
+        parallel_code = lp.generate_code_v2(parallel_t_unit).device_code()
+        with PassProfiler() as prof:
+            parallel_code_again = lp.generate_code_v2(
+                    parallel_t_unit).device_code()
+
+    assert parallel_code == code
+    assert parallel_code_again == code
+    if lp.CACHING_ENABLED:
+        assert [record.cache_hit for record in prof.records
+                if record.name == "generate_code_v2"] == [True]
+    for k in range(4):
+        assert "scale%d(" % k in code
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         exec(sys.argv[1])
@@ -1589,6 +1589,132 @@ def test_unschedulable_kernel_detection():
     assert len(list(lp.get_iname_duplication_options(knl))) == 10
 
 
+def test_parallel_linearization_matches_sequential():
+    nstages = 4
+
+    def make_knl(options):
+        return lp.make_kernel(
+                "{[%s]: 0<=%s<n}" % (
+                    ",".join("i%d,j%d" % (k, k) for k in range(nstages)),
+                    ",".join("i%d,j%d" % (k, k) for k in range(nstages))),
+                "\n".join("""
+                    <> acc%(k)d = sum(j%(k)d, a[i%(k)d, j%(k)d]) {id=red%(k)d}
+                    out%(k)d[i%(k)d] = acc%(k)d {id=out%(k)d, groups=g%(k)d}
+                    """ % {"k": k}
+                    for k in range(nstages)),
+                [lp.GlobalArg("a", np.float64, shape=lp.auto), ...],
+                seq_dependencies=False,
+                options=options)
+
+    seq_knl = lp.linearize(lp.preprocess_kernel(make_knl(lp.Options())))
+
+    par_knl = make_knl(lp.Options(linearization_processes=3))
+
+    import warnings
+    from pytools.persistent_dict import CollisionWarning
+    from loopy.instrumentation import PassProfiler
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", CollisionWarning)
+
+        par_lin_knl = lp.linearize(lp.preprocess_kernel(par_knl))
+        with PassProfiler() as prof:
+            par_lin_knl_again = lp.linearize(lp.preprocess_kernel(par_knl))
+
+    assert (seq_knl["loopy_kernel"].linearization
+            == par_lin_knl["loopy_kernel"].linearization
+            == par_lin_knl_again["loopy_kernel"].linearization)
+
+    if lp.CACHING_ENABLED:
+        assert [record.cache_hit for record in prof.records
+                if record.name in ["preprocess_program",
+                    "get_one_linearized_kernel"]] == [True, True]
+
+    # the parallel search only yields the first linearization
+    par_knl = lp.preprocess_kernel(par_knl)
+    linearized_kernels = list(lp.generate_loop_schedules(
+        par_knl["loopy_kernel"], par_knl.callables_table))
+    assert len(linearized_kernels) == 1
+    assert (linearized_kernels[0].linearization
+            == seq_knl["loopy_kernel"].linearization)
+
+
+def test_linearization_does_not_recurse():
+    nloops = 100
+    knl = lp.make_kernel(
+            ["{[i%d]: 0<=i%d<10}" % (k, k) for k in range(nloops)],
+            "\n".join(
+                "a[i%d] = a[i%d] + %d {id=insn%d%s}"
+                % (k, k, k, k, ",dep=insn%d" % (k-1) if k else "")
+                for k in range(nloops)),
+            [lp.GlobalArg("a", np.float64, shape=(10,))])
+    knl = lp.preprocess_kernel(knl)
+
+    # Each loop adds three levels to the search tree. Make sure searching it
+    # does not need a recursion limit proportional to its depth.
+    import inspect
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 100)
+    try:
+        with lp.CacheMode(False):
+            knl = lp.linearize(knl)
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+    assert len(knl["loopy_kernel"].linearization) == 3*nloops + 2
+
+
+def test_incremental_relinearization():
+    from loopy.schedule import EnterLoop, get_reusable_preschedule
+
+    knl = lp.make_kernel(
+            "{[i,j,k]: 0<=i,j,k<n}",
+            """
+            a[i, j] = 2*i + j {id=a}
+            b[k] = 3*k {id=b}
+            """,
+            [lp.GlobalArg("a,b", np.int32, shape=lp.auto),
+                lp.ValueArg("n", np.int32)])
+    knl = lp.prioritize_loops(knl, "i,j")
+
+    with lp.CacheMode(False):
+        lin = lp.linearize(lp.preprocess_kernel(knl))
+        old_linearization = lin["loopy_kernel"].linearization
+
+        # unrolling k leaves both loop nests valid
+        t_unit = lp.tag_inames(knl, "k:unr")
+        t_unit = lp.linearize(lp.preprocess_kernel(t_unit), prior=lin)
+        assert (t_unit["loopy_kernel"].linearization
+                == old_linearization)
+
+        # reversing the priority of i and j invalidates their loop nest,
+        # which gets rescheduled
+        t_unit = lp.preprocess_kernel(lp.prioritize_loops(knl, "j,i"))
+        assert get_reusable_preschedule(
+                t_unit["loopy_kernel"], old_linearization) == tuple(
+                        old_linearization[6:9])
+
+        t_unit = lp.linearize(t_unit, prior=lin)
+        loop_order = [sched_item.iname
+                for sched_item in t_unit["loopy_kernel"].linearization
+                if isinstance(sched_item, EnterLoop)]
+        assert loop_order.index("j") < loop_order.index("i")
+
+        # transformations changing the preprocessing take effect
+        red_knl = lp.make_kernel(
+                "{[i, j]: 0<=i<n and 0<=j<16}",
+                "out[i] = sum(j, a[i, j])",
+                [lp.GlobalArg("a", np.float32, shape=("n", 16)), "..."])
+        red_knl = lp.tag_inames(red_knl, "i:g.0")
+        red_lin = lp.linearize(lp.preprocess_kernel(red_knl))
+
+        red_knl = lp.tag_inames(red_knl, "j:l.0")
+        red_lin = lp.linearize(lp.preprocess_kernel(red_knl), prior=red_lin)
+        assert any(
+                tv.address_space == lp.AddressSpace.LOCAL
+                for tv in red_lin["loopy_kernel"].temporary_variables.values())
+
+
 def test_regression_no_ret_call_removal(ctx_factory):
     # https://github.com/inducer/loopy/issues/32
     prog = lp.make_kernel(
@@ -2480,6 +2606,63 @@ def test_execution_backend_can_cache_dtypes(ctx_factory):
     knl(queue)
 
 
+def test_cl_program_binary_cache(ctx_factory):
+    from loopy.target.pyopencl_execution import build_cl_program
+    from loopy.instrumentation import PassProfiler, record_pass
+    from uuid import uuid4
+
+    ctx = ctx_factory()
+    queue = cl.CommandQueue(ctx)
+
+    if not lp.CACHING_ENABLED:
+        pytest.skip("caching is disabled")
+
+    # a fresh source, so that the first build misses the cache
+    dev_code = """
+        // %s
+        __kernel void fill(__global int *a) { a[get_global_id(0)] = 17; }
+        """ % uuid4()
+
+    a = cl.array.zeros(queue, 8, np.int32)
+    for expect_cache_hit in [False, True]:
+        a.fill(0)
+
+        with PassProfiler() as prof:
+            with record_pass("build_cl_program"):
+                cl_program = build_cl_program(ctx, dev_code, [])
+
+        cl_program.fill(queue, a.shape, None, a.data)
+
+        assert (a.get() == 17).all()
+        assert prof.records[0].cache_hit == expect_cache_hit
+
+
+def test_cl_bound_kernel_call(ctx_factory):
+    ctx = ctx_factory()
+    queue = cl.CommandQueue(ctx)
+
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]")
+    knl = lp.add_dtypes(knl, {"a": np.float32})
+
+    a = cl.array.to_device(queue, np.arange(16, dtype=np.float32))
+    out = cl.array.empty_like(a)
+
+    knl_call = knl.bind(queue, a=a, out=out)
+    seq = lp.KernelCallSequence([knl_call, knl.bind(queue, a=out, out=a)])
+
+    for _ in range(2):
+        (_, (out_result,)), _ = seq()
+
+    assert out_result is out
+    assert np.allclose(a.get(), 16*np.arange(16))
+
+    evt, _ = knl_call(a=out)
+    evt.wait()
+    assert np.allclose(out.get(), 16*np.arange(16))
+
+
 def test_wildcard_dep_matching():
     prog = lp.make_kernel(
             "{[i]: 0 <= i < 10}",
@@ -2591,6 +2774,39 @@ def test_check_for_variable_access_ordering_with_aliasing():
         lp.generate_code_v2(knl)
 
 
+@pytest.mark.parametrize(("w3_deps", "nosync", "expect_error"), [
+    ("r1:r2", False, False),
+    ("r1", False, True),
+    ("r1", True, False),
+    ])
+def test_check_for_variable_access_ordering_transitive(
+        w3_deps, nosync, expect_error):
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            """
+            for i
+                t[i] = a[i]  {id=w0}
+                <> u = 2*t[i]  {id=r1, dep=w0}
+                <> v = 3*t[i]  {id=r2, dep=w0}
+                t[i] = u  {id=w3, dep=%s}
+                out[i] = t[i] + v  {id=r4, dep=w3:r2}
+            end
+            """ % w3_deps,
+            [lp.GlobalArg("a,t,out", np.float64, shape="n"), "..."],
+            seq_dependencies=False)
+
+    if nosync:
+        knl = lp.add_nosync(knl, "any", "id:r2", "id:w3",
+                bidirectional=True, force=True)
+
+    if expect_error:
+        from loopy.diagnostic import VariableAccessNotOrdered
+        with pytest.raises(VariableAccessNotOrdered, match="'w3'.*'r2'"):
+            lp.generate_code_v2(knl)
+    else:
+        lp.generate_code_v2(knl)
+
+
 @pytest.mark.parametrize(("second_index", "expect_barrier"),
         [
             ("2*i", True),
@@ -279,6 +279,233 @@ def test_Optional():  # noqa
     # }}}
 
 
+def test_LoopyWriteOncePersistentDict(tmp_path):  # noqa
+    import numpy as np
+    import loopy as lp
+    from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
+
+    pdict = LoopyWriteOncePersistentDict("loopy-test-in-mem-tier",
+            key_builder=LoopyKeyBuilder(), container_dir=str(tmp_path),
+            in_mem_cache_size=2)
+
+    knls = [
+            lp.make_kernel("{[i]: 0<=i<n}", "out[i] = %d*i" % k)
+            for k in range(3)]
+    values = [np.arange(k+1) for k in range(3)]
+
+    for knl, value in zip(knls, values):
+        pdict.store_if_not_present(knl, value)
+
+    # {{{ the in-memory tier holds values read from disk, least recent first
+
+    def in_mem_cache_contains(key):
+        return pdict.key_builder(key) in pdict._cache
+
+    assert not in_mem_cache_contains(knls[0])
+    for knl, value in zip(knls, values):
+        assert (pdict[knl] == value).all()
+
+    assert len(pdict._cache) == 2
+    assert not in_mem_cache_contains(knls[0])
+    assert pdict[knls[2]] is pdict[knls[2]]
+
+    assert (pdict[knls[0]] == values[0]).all()
+    assert in_mem_cache_contains(knls[0])
+    assert not in_mem_cache_contains(knls[1])
+
+    # }}}
+
+    # {{{ keys that are equal in Python but not in persistence are distinct
+
+    pdict.store_if_not_present(1, "int key")
+    pdict.store_if_not_present(True, "bool key")
+    assert pdict[1] == "int key"
+    assert pdict[True] == "bool key"
+
+    # }}}
+
+    # {{{ unhashable keys are supported
+
+    pdict.store_if_not_present([1, 2], "list key")
+    assert pdict[[1, 2]] == "list key"
+
+    # }}}
+
+    pdict.clear_in_mem_cache()
+    assert not pdict._cache
+    assert (pdict[knls[1]] == values[1]).all()
+
+    with pytest.raises(KeyError):
+        pdict[lp.make_kernel("{[i]: 0<=i<n}", "out[i] = 3*i")]
+
+
+def test_cache_stats(tmp_path):
+    import loopy as lp
+    from loopy.tools import LoopyKeyBuilder, LoopyWriteOncePersistentDict
+
+    pdict = LoopyWriteOncePersistentDict("loopy-test-cache-stats",
+            key_builder=LoopyKeyBuilder(), container_dir=str(tmp_path))
+    lp.reset_cache_stats()
+
+    knl = lp.make_kernel("{[i]: 0<=i<n}", "out[i] = 2*i")
+
+    with pytest.raises(KeyError):
+        pdict[knl]
+    pdict.store_if_not_present(knl, "value")
+    assert pdict[knl] == "value"
+    assert pdict[knl] == "value"
+
+    stats = lp.cache_stats()["loopy-test-cache-stats"]
+    assert stats.misses == 1
+    assert stats.stores == 1
+    assert stats.mem_hits == 1
+    assert stats.disk_hits == 1
+    assert stats.hits == 2
+    assert stats.bytes_written > 0
+    assert stats.bytes_read > 0
+    assert stats.hash_time > 0
+    assert stats.recompute_time > 0
+    str(stats)
+
+    lp.reset_cache_stats()
+    assert lp.cache_stats()["loopy-test-cache-stats"].hits == 0
+
+
+def test_persistent_dict_disk_eviction(tmp_path):
+    import os
+    import numpy as np
+    from loopy.tools import (LoopyKeyBuilder, LoopyWriteOncePersistentDict,
+            prune_caches, get_cache_dirs)
+    from loopy.version import DATA_MODEL_VERSION
+
+    cache_root = tmp_path
+    container_dir = cache_root / f"pdict-v4-loopy-test-{DATA_MODEL_VERSION}-py3"
+    pdict = LoopyWriteOncePersistentDict("loopy-test-eviction",
+            key_builder=LoopyKeyBuilder(), container_dir=str(container_dir),
+            in_mem_cache_size=0, max_disk_size=5000)
+
+    for i in range(10):
+        pdict.store_if_not_present(i, np.zeros(1000, np.uint8))
+
+    nbytes, nentries = pdict.disk_usage()
+    assert nbytes <= 5000
+    assert 0 < nentries < 10
+    # the most recently stored entry survives
+    assert pdict[9].shape == (1000,)
+
+    with pytest.raises(KeyError):
+        pdict[0]
+
+    # {{{ stale caches are removed entirely
+
+    stale_dir = cache_root / "pdict-v4-loopy-test-0000-py3"
+    stale_pdict = LoopyWriteOncePersistentDict("loopy-test-stale",
+            key_builder=LoopyKeyBuilder(), container_dir=str(stale_dir))
+    stale_pdict.store_if_not_present(0, "stale")
+
+    assert set(get_cache_dirs(str(cache_root))) == {
+            (str(container_dir), True), (str(stale_dir), False)}
+
+    assert prune_caches(max_age=3600, cache_root=str(cache_root)) > 0
+    assert not os.path.exists(stale_dir)
+    assert pdict.disk_usage()[1] == nentries
+
+    # }}}
+
+    # {{{ numba modules are accounted for along with their machine code
+
+    module_dir = container_dir / "numba"
+    (module_dir / "__pycache__").mkdir(parents=True)
+    for name, size in [
+            ("_lpy_numba_abc.py", 100),
+            ("__pycache__/_lpy_numba_abc.loopy_kernel-6.py311.nbi", 20),
+            ("__pycache__/_lpy_numba_abc.loopy_kernel-6.py311.1.nbc", 300),
+            ("__pycache__/_lpy_numba_abcd.loopy_kernel-6.py311.nbi", 5)]:
+        (module_dir / name).write_bytes(b"x" * size)
+
+    assert pdict.disk_usage() == (nbytes + 420, nentries + 1)
+
+    # }}}
+
+    assert prune_caches(max_size=0, cache_root=str(cache_root)) == nbytes + 420
+    assert pdict.disk_usage() == (0, 0)
+    assert os.listdir(module_dir / "__pycache__") == [
+            "_lpy_numba_abcd.loopy_kernel-6.py311.nbi"]
+
+
+def test_memoize_lru():
+    import loopy as lp
+    from loopy.memo import memoize_lru
+
+    calls = []
+
+    @memoize_lru(maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x*x
+
+    assert [square(x) for x in [1, 2, 1, 3, 2]] == [1, 4, 1, 9, 4]
+    # 2 was evicted by 3, as 1 was used more recently
+    assert calls == [1, 2, 3, 2]
+
+    info = lp.memo_cache_info()[square.identifier]
+    assert (info.hits, info.misses, info.evictions) == (1, 4, 2)
+    assert info.size == info.maxsize == 2
+    assert info.nbytes > 0
+
+    lp.clear_memo_caches()
+    assert lp.memo_cache_info()[square.identifier].size == 0
+    square(1)
+    assert calls == [1, 2, 3, 2, 1]
+
+
+def test_pass_profiler(tmp_path):
+    import json
+    import numpy as np
+    import loopy as lp
+    from loopy.instrumentation import PassProfiler
+
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<16}",
+            "out[i] = sum(j, a[i, j]**2)",
+            target=lp.OpenCLTarget())
+    knl = lp.add_dtypes(knl, {"a": np.float64})
+    knl = lp.split_iname(knl, "i", 16, outer_tag="g.0", inner_tag="l.0")
+
+    with lp.CacheMode(False):
+        with PassProfiler(trace_memory=True) as prof:
+            lp.generate_code_v2(knl)
+
+    names = {record.name for record in prof.records}
+    assert {"preprocess_program", "infer_unknown_types", "expand_subst",
+            "realize_reduction_for_single_kernel", "check_bounds",
+            "get_one_linearized_kernel", "insert_barriers",
+            "generate_code_for_a_single_kernel"} <= names
+
+    codegen_record, = [record for record in prof.records
+            if record.name == "generate_code_v2"]
+    assert codegen_record.kernel_name == "loopy_kernel"
+    assert codegen_record.depth == 0
+    assert codegen_record.cache_hit is None
+    assert codegen_record.allocated_memory is not None
+    if sys.version_info >= (3, 9):
+        assert codegen_record.peak_memory >= 0
+    assert all(record.wall_time <= codegen_record.wall_time
+            for record in prof.records)
+    assert "preprocess_program" in prof.summary()
+
+    prof.write_chrome_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as inf:
+        trace = json.load(inf)
+    assert len(trace["traceEvents"]) == len(prof.records)
+
+    # nothing is recorded outside of the profiler
+    nrecords = len(prof.records)
+    with lp.CacheMode(False):
+        lp.generate_code_v2(knl)
+    assert len(prof.records) == nrecords
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         exec(sys.argv[1])
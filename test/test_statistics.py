@@ -21,6 +21,7 @@ THE SOFTWARE.
 """
 
 import sys
+import pytest
 from pyopencl.tools import (  # noqa
         pytest_generate_tests_for_pyopencl
         as pytest_generate_tests)
@@ -1499,6 +1500,124 @@ def test_no_loop_ops():
     assert f64_mul == 1
 
 
+def test_insn_count_memoization():
+    # the instructions share their inames, but not their operations
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<m}",
+            """
+            c[i, j] = a[i, j]*b[i, j] {id=mul}
+            d[i, j] = a[i, j] + b[i, j] + 3*a[i, j] {id=add}
+            e[i] = 2*a[i, 0] {id=single}
+            """,
+            name="memo", assumptions="n,m >= 1")
+    knl = lp.add_and_infer_dtypes(knl, dict(a=np.float32, b=np.float32))
+
+    params = {"n": 17, "m": 13}
+    n, m = params["n"], params["m"]
+
+    op_map = lp.get_op_map(knl, subgroup_size=SGS, count_redundant_work=True)
+    assert op_map[lp.Op(np.float32, "mul", CG.SUBGROUP, "memo")].eval_with_dict(
+            params) == n*m + n*m + n
+    assert op_map[lp.Op(np.float32, "add", CG.SUBGROUP, "memo")].eval_with_dict(
+            params) == 2*n*m
+
+    with pytest.warns(lp.LoopyWarning) as warnings:
+        mem_map = lp.get_mem_access_map(knl, count_redundant_work=True,
+                subgroup_size=SGS)
+
+    stores = mem_map.filter_by(direction=["store"]).group_by("variable")
+    assert stores[lp.MemAccess(variable="c")].eval_with_dict(params) == n*m
+    assert stores[lp.MemAccess(variable="d")].eval_with_dict(params) == n*m
+    assert stores[lp.MemAccess(variable="e")].eval_with_dict(params) == n
+
+    # the warning about the sub-group count is issued for each instruction
+    subgroup_warnings = [str(w.message) for w in warnings
+            if "insn_count_subgroups_upper_bound" in str(w.message)]
+    for insn_id in ["mul", "add", "single"]:
+        assert any("instruction %s " % insn_id in msg
+                for msg in subgroup_warnings)
+
+
+def test_eval_with_arrays():
+    knl = lp.make_kernel(
+            "{[i,j,k]: 0<=i<n and 0<=j<m and 0<=k<i and k mod 3 = 0}",
+            "a[i, j] = a[i, j] + b[i, k]*c[k, j]",
+            name="matmul_tri", assumptions="n,m >= 1")
+    knl = lp.add_and_infer_dtypes(knl, dict(a=np.float64, b=np.float64,
+                                            c=np.float64))
+    knl = lp.split_iname(knl, "j", 4)
+
+    op_map = lp.get_op_map(knl, subgroup_size=SGS, count_redundant_work=True)
+    mem_map = lp.get_mem_access_map(knl, subgroup_size=SGS,
+                                    count_redundant_work=True)
+
+    n = np.arange(1, 50)
+    m = np.arange(1, 50)[::-1]
+
+    for stats_map in [op_map, mem_map]:
+        sums = stats_map.eval_and_sum_with_arrays({"n": n, "m": m})
+        assert sums.shape == n.shape
+        assert list(sums) == [
+                stats_map.eval_and_sum({"n": int(n_i), "m": int(m_i)})
+                for n_i, m_i in zip(n, m)]
+
+        counts = stats_map.eval_with_arrays({"n": n[:, np.newaxis], "m": 7})
+        for key, values in counts.items():
+            assert values.shape == (len(n), 1)
+            assert values[10, 0] == stats_map[key].eval_with_dict(
+                    {"n": int(n[10]), "m": 7})
+
+    import islpy as isl
+    from loopy.statistics import GuardedPwQPolynomial
+    n_poly = isl.PwQPolynomial.from_pw_aff(isl.PwAff("[n] -> { [(n)] }"))
+    triangle = GuardedPwQPolynomial(
+            (n_poly*(n_poly+1)).scale_down_val(2),
+            isl.Set("[n] -> { : n >= 0 }"))
+    assert list(triangle.eval_with_arrays({"n": np.arange(5)})) == [
+            0, 1, 3, 6, 10]
+
+    with pytest.raises(ValueError):
+        triangle.eval_with_arrays({"n": np.arange(-1, 5)})
+
+
+def test_perf_model_ranks_coalesced_access_first():
+    from loopy.perf_model import (DeviceDescription, estimate_performance,
+            rank_variants)
+
+    knl = lp.make_kernel(
+            "{[i,j]: 0<=i,j<n}",
+            "out[i, j] = 2*a[i, j]",
+            name="scale", assumptions="n>=1")
+    knl = lp.add_and_infer_dtypes(knl, dict(a=np.float32))
+
+    coalesced = lp.split_iname(knl, "j", 32, inner_tag="l.0", outer_tag="g.0")
+    coalesced = lp.tag_inames(coalesced, "i:g.1")
+    strided = lp.split_iname(knl, "i", 32, inner_tag="l.0", outer_tag="g.0")
+    strided = lp.tag_inames(strided, "j:g.1")
+
+    device = DeviceDescription({np.float32: 10e12}, global_bandwidth=500e9,
+            transaction_size=128, subgroup_size=SGS, launch_latency=5e-6)
+
+    n = 1024
+    estimate = estimate_performance(coalesced, device, {"n": n})
+    assert estimate.bound == "global memory"
+    assert estimate.global_bytes == 2*4*n*n
+    assert estimate.ops == n*n
+    assert np.isclose(estimate.total_time, 2*4*n*n/500e9 + 5e-6)
+
+    # a stride of n floats fetches a full transaction per element
+    estimate = estimate_performance(strided, device, {"n": n})
+    assert estimate.global_bytes == 2*128*n*n
+
+    ranked = rank_variants([strided, coalesced], device, {"n": n})
+    assert [program for _, program in ranked] == [coalesced, strided]
+
+    estimates = estimate_performance(coalesced, device,
+            {"n": np.array([1, 32, n])})
+    assert estimates.total_time.shape == (3,)
+    assert (np.diff(estimates.total_time) > 0).all()
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         exec(sys.argv[1])
@@ -265,6 +265,38 @@ def test_numba_target():
     print(lp.generate_code_v2(knl).device_code())
 
 
+@pytest.mark.parametrize("parallel", [False, True])
+def test_numba_target_execution(parallel):
+    pytest.importorskip("numba")
+
+    knl = lp.make_kernel(
+        "{[i, j, k, l]: 0<=i<n and 0<=j, k, l<m}",
+        """
+        <> t[j] = 2*a[i, j]
+        <> t_max = max(k, t[k])
+        row_max[i] = t_max
+        out[i, l] = sqrt(t[l] - t_max + 2)
+        """,
+        [
+            lp.GlobalArg("a", np.float64, shape="n, m"),
+            lp.GlobalArg("row_max, out", is_input=False, shape=lp.auto),
+            ...],
+        target=lp.NumbaTarget(parallel=parallel),
+        assumptions="n, m >= 1")
+
+    knl = lp.split_iname(knl, "i", 4, outer_tag="g.0")
+    knl = lp.set_options(knl, return_dict=True)
+
+    code = lp.generate_code_v2(knl).device_code()
+    assert "prange" in code
+
+    a = np.random.rand(10, 7)
+    _, out = knl(a=a)
+
+    assert np.allclose(out["row_max"], 2*a.max(axis=1))
+    assert np.allclose(out["out"], np.sqrt(2*a - 2*a.max(axis=1)[:, None] + 2))
+
+
 def test_numba_cuda_target():
     knl = lp.make_kernel(
         "{[i,j,k]: 0<=i,j<M and 0<=k<N}",
@@ -287,6 +319,56 @@ def test_numba_cuda_target():
     print(lp.generate_code_v2(knl).all_code())
 
 
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_numpy_target(vectorize):
+    knl = lp.make_kernel(
+        "{[i, j, k, l, p]: 0<=i, j<n and 0<=k, l, p<m}",
+        """
+        dist[i, j] = sqrt(sum(k, (x[i, k]-x[j, k])**2))
+        row_max[i] = max(l, x[i, l])
+        <> t = 2*x[i, 0]
+        shifted[i] = t + i
+        xt[p, i] = x[i, p]
+        """,
+        [
+            lp.GlobalArg("x", np.float64, shape="n, m"),
+            ...
+            ],
+        assumptions="n, m >= 1",
+        target=lp.NumpyTarget(vectorize=vectorize))
+    knl = lp.set_options(knl, return_dict=True)
+
+    code = lp.generate_code_v2(knl).device_code()
+    print(code)
+    assert ("for " in code) != vectorize
+
+    x = np.random.rand(7, 5)
+    _, out = knl(x=x)
+
+    assert np.allclose(out["dist"],
+            np.sqrt(((x[:, None, :] - x[None, :, :])**2).sum(axis=-1)))
+    assert np.allclose(out["row_max"], x.max(axis=1))
+    assert np.allclose(out["shifted"], 2*x[:, 0] + np.arange(7))
+    assert np.allclose(out["xt"], x.T)
+
+    # iterations depending on each other are not vectorized
+    knl = lp.make_kernel(
+        "{[i]: 1<=i<n}",
+        "a[i] = a[i-1] + b[2*i]",
+        [
+            lp.GlobalArg("a", np.float64, shape="n"),
+            lp.GlobalArg("b", np.float64, shape="2*n"),
+            lp.ValueArg("n", np.int32),
+            ],
+        target=lp.NumpyTarget(vectorize=vectorize))
+
+    a = np.zeros(10)
+    b = np.random.rand(20)
+    knl(a=a, b=b)
+
+    assert np.allclose(a, np.cumsum(np.concatenate([[0], b[2:20:2]])))
+
+
 def test_sized_integer_c_codegen(ctx_factory):
     ctx = ctx_factory()
     queue = cl.CommandQueue(ctx)